@@ -18,17 +18,20 @@ Usage:
 
 import sys
 import os
+import importlib.util
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Fall back to the src directory only when SigmaPy isn't installed
+if importlib.util.find_spec("sigmapy") is None:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from sigmapy import ErgoClient, ConfigParser
-from sigmapy.utils import EnvManager
 from pathlib import Path
 
 
 def demo_simple_operations():
     """Demonstrate simple one-line operations."""
+    from sigmapy import ErgoClient
+    from sigmapy.utils import EnvManager
+    
     print("🚀 SigmaPy High-Level API Demo")
     print("=" * 50)
     print()
@@ -100,6 +103,8 @@ def demo_simple_operations():
 
 def demo_config_driven_operations():
     """Demonstrate configuration-driven operations."""
+    from sigmapy import ErgoClient, ConfigParser
+    
     print("🔧 Configuration-Driven Operations")
     print("=" * 50)
     print()
@@ -119,8 +124,9 @@ def demo_config_driven_operations():
         print(f"   📄 Using config: {nft_config}")
         nft_ids = client.mint_nft_collection(nft_config)
         print(f"   🎨 Minted {len(nft_ids)} NFTs from collection!")
-        for i, nft_id in enumerate(nft_ids):
-            print(f"      NFT #{i+1}: {nft_id}")
+        sys.stdout.write("".join(
+            f"      NFT #{i}: {nft_id}\n" for i, nft_id in enumerate(nft_ids, 1)
+        ))
     else:
         print(f"   ⚠️  Config file not found: {nft_config}")
         print("   📝 Creating example config...")
@@ -149,8 +155,9 @@ def demo_config_driven_operations():
         # Distribute tokens
         tx_ids = client.distribute_tokens(token_id, token_config)
         print(f"   🪙 Distributed tokens in {len(tx_ids)} transactions!")
-        for i, tx_id in enumerate(tx_ids):
-            print(f"      Transaction #{i+1}: {tx_id}")
+        sys.stdout.write("".join(
+            f"      Transaction #{i}: {tx_id}\n" for i, tx_id in enumerate(tx_ids, 1)
+        ))
     else:
         print(f"   ⚠️  Config file not found: {token_config}")
         print("   📝 Creating example config...")
@@ -165,6 +172,8 @@ def demo_config_driven_operations():
 
 def demo_batch_operations():
     """Demonstrate batch operations."""
+    from sigmapy import ErgoClient
+    
     print("⚡ Batch Operations")
     print("=" * 50)
     print()
@@ -220,6 +229,8 @@ def demo_batch_operations():
 
 def demo_utility_functions():
     """Demonstrate utility functions."""
+    from sigmapy import ErgoClient
+    
     print("🛠️ Utility Functions")
     print("=" * 50)
     print()
@@ -246,8 +257,8 @@ def demo_utility_functions():
         "9gQqZyxyjAptMbfW1Gydm3qaap11zd6X9DrABTbMBRJLjZhQRCA"   # Valid
     ]
     
-    for addr in test_addresses:
-        is_valid = client.validate_address(addr)
+    results = client.validate_addresses(test_addresses)
+    for addr, is_valid in zip(test_addresses, results):
         status = "✅ Valid" if is_valid else "❌ Invalid"
         print(f"   {status}: {addr[:20]}...")
     
@@ -266,6 +277,8 @@ def demo_utility_functions():
 
 def main():
     """Run all demos."""
+    from sigmapy.utils import EnvManager
+    
     print("🎓 SigmaPy Beginner-Friendly Demo")
     print("This demo showcases the new high-level APIs that make")
     print("Ergo blockchain development accessible to beginners.")
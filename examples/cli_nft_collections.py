@@ -13,15 +13,18 @@ Usage:
 
 import sys
 import os
+import importlib.util
 import argparse
 import logging
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Fall back to the src directory only when SigmaPy isn't installed
+if importlib.util.find_spec("sigmapy") is None:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from sigmapy import ErgoClient
+# sigmapy is imported inside each command so that --help and argument
+# errors do not pay for loading the full client stack
 
 
 def setup_logging(verbose: bool = False):
@@ -35,6 +38,9 @@ def setup_logging(verbose: bool = False):
 
 def create_collection(config_file: str, dry_run: bool = True):
     """Create a collection token from configuration file."""
+    from sigmapy import ErgoClient
+    from sigmapy.config import load_yaml_cached
+    
     print(f"🎨 Creating collection token from {config_file}")
     mode = "DRY RUN" if dry_run else "LIVE"
     print(f"📄 Mode: {mode}")
@@ -46,12 +52,15 @@ def create_collection(config_file: str, dry_run: bool = True):
             print("❌ Cancelled by user")
             return False
     
+    # Parse the configuration once; validation and execution share the dict
+    config = load_yaml_cached(config_file)
+    
     # Initialize client
     client = ErgoClient(dry_run=dry_run)
     
     # Validate configuration first
     print("\n🔍 Validating collection configuration...")
-    result = client.validate_collection_config(config_file)
+    result = client.validate_collection_config(config)
     
     if not result['valid']:
         print("❌ Configuration has errors:")
@@ -76,7 +85,7 @@ def create_collection(config_file: str, dry_run: bool = True):
     print(f"\n🚀 Creating collection token...")
     
     try:
-        tx_id = client.create_collection_from_config(config_file)
+        tx_id = client.create_collection_from_config(config)
         
         print(f"\n✅ Collection token created successfully!")
         print(f"📋 Transaction ID: {tx_id}")
@@ -95,16 +104,22 @@ def create_collection(config_file: str, dry_run: bool = True):
 
 def mint_collection(config_file: str, dry_run: bool = True):
     """Mint an entire NFT collection from configuration file."""
+    from sigmapy import ErgoClient
+    from sigmapy.config import load_yaml_cached
+    
     print(f"🎨 Minting NFT collection from {config_file}")
     mode = "DRY RUN" if dry_run else "LIVE"
     print(f"📄 Mode: {mode}")
     
+    # Parse the configuration once; validation and execution share the dict
+    config = load_yaml_cached(config_file)
+    
     # Initialize client
     client = ErgoClient(dry_run=dry_run)
     
     # Validate configuration first
     print("\n🔍 Validating NFT collection configuration...")
-    result = client.validate_nft_collection_config(config_file)
+    result = client.validate_nft_collection_config(config)
     
     if not result['valid']:
         print("❌ Configuration has errors:")
@@ -140,7 +155,7 @@ def mint_collection(config_file: str, dry_run: bool = True):
     print(f"\n🚀 Minting {result['nft_count']} NFTs...")
     
     try:
-        tx_ids = client.mint_nft_collection(config_file)
+        tx_ids = client.mint_nft_collection(config)
         
         successful = len([tx for tx in tx_ids if not tx.startswith('dry_run')])
         
@@ -148,19 +163,21 @@ def mint_collection(config_file: str, dry_run: bool = True):
         print(f"📋 Transactions created: {len(tx_ids)}")
         print(f"✅ Successful: {successful}")
         
+        # One write for the whole listing instead of one print per NFT
+        lines = [f"   {i}. {tx_id}\n" for i, tx_id in enumerate(tx_ids, 1)]
+        
         if dry_run:
             print("\n🔍 Dry run transactions:")
-            for i, tx_id in enumerate(tx_ids, 1):
-                print(f"   {i}. {tx_id}")
+            sys.stdout.write("".join(lines))
         else:
             print("\n📋 Transaction IDs:")
-            for i, tx_id in enumerate(tx_ids, 1):
-                print(f"   {i}. {tx_id}")
+            sys.stdout.write("".join(lines))
             
             print(f"\n🔗 Monitor your transactions on the Ergo blockchain explorer:")
             print(f"   Mainnet: https://explorer.ergoplatform.com/")
             print(f"   Testnet: https://testnet.ergoplatform.com/")
         
+        sys.stdout.flush()
         return True
         
     except Exception as e:
@@ -176,6 +193,8 @@ def mint_single_nft(
     dry_run: bool = True
 ):
     """Mint a single NFT."""
+    from sigmapy import ErgoClient
+    
     print(f"🎨 Minting single NFT: {name}")
     mode = "DRY RUN" if dry_run else "LIVE"
     print(f"📄 Mode: {mode}")
@@ -223,13 +242,16 @@ def mint_single_nft(
 
 def validate_collection_config(config_file: str):
     """Validate a collection configuration file."""
+    from sigmapy import ErgoClient
+    from sigmapy.config import load_yaml_cached
+    
     print(f"🔍 Validating collection configuration: {config_file}")
     
     # Initialize client in dry-run mode for validation
     client = ErgoClient(dry_run=True)
     
     # Validate configuration
-    result = client.validate_collection_config(config_file)
+    result = client.validate_collection_config(load_yaml_cached(config_file))
     
     if result['valid']:
         print("✅ Collection configuration is valid!")
@@ -258,13 +280,16 @@ def validate_collection_config(config_file: str):
 
 def validate_nft_config(config_file: str):
     """Validate an NFT collection configuration file."""
+    from sigmapy import ErgoClient
+    from sigmapy.config import load_yaml_cached
+    
     print(f"🔍 Validating NFT collection configuration: {config_file}")
     
     # Initialize client in dry-run mode for validation
     client = ErgoClient(dry_run=True)
     
     # Validate configuration
-    result = client.validate_nft_collection_config(config_file)
+    result = client.validate_nft_collection_config(load_yaml_cached(config_file))
     
     if result['valid']:
         print("✅ NFT collection configuration is valid!")
@@ -294,6 +319,8 @@ def validate_nft_config(config_file: str):
 
 def create_collection_template(output_file: str):
     """Create a template collection configuration file."""
+    from sigmapy import ErgoClient
+    
     print(f"📝 Creating collection template: {output_file}")
     
     client = ErgoClient(dry_run=True)
@@ -301,10 +328,13 @@ def create_collection_template(output_file: str):
     
     print(f"✅ Collection template created successfully!")
     print(f"📄 Edit {output_file} with your collection details")
+    return True
 
 
 def create_nft_template(output_file: str):
     """Create a template NFT collection configuration file."""
+    from sigmapy import ErgoClient
+    
     print(f"📝 Creating NFT collection template: {output_file}")
     
     client = ErgoClient(dry_run=True)
@@ -312,6 +342,7 @@ def create_nft_template(output_file: str):
     
     print(f"✅ NFT collection template created successfully!")
     print(f"📄 Edit {output_file} with your NFT details and collection token ID")
+    return True
 
 
 def main():
@@ -346,30 +377,51 @@ Notes:
     )
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    parser.set_defaults(needs_dry_run=False)
     
     # Collection commands
     create_collection_parser = subparsers.add_parser('create-collection', help='Create collection token')
     create_collection_parser.add_argument('config_file', help='Collection configuration file')
     create_collection_parser.add_argument('--dry-run', action='store_true', default=True, help='Run in dry-run mode (default)')
     create_collection_parser.add_argument('--live', action='store_true', help='Run in live mode')
+    create_collection_parser.set_defaults(
+        func=lambda args, **kwargs: create_collection(args.config_file, **kwargs),
+        needs_dry_run=True
+    )
     
     validate_collection_parser = subparsers.add_parser('validate-collection', help='Validate collection config')
     validate_collection_parser.add_argument('config_file', help='Collection configuration file')
+    validate_collection_parser.set_defaults(
+        func=lambda args: validate_collection_config(args.config_file)
+    )
     
     collection_template_parser = subparsers.add_parser('collection-template', help='Create collection template')
     collection_template_parser.add_argument('output_file', help='Output template file')
+    collection_template_parser.set_defaults(
+        func=lambda args: create_collection_template(args.output_file)
+    )
     
     # NFT commands
     mint_collection_parser = subparsers.add_parser('mint-collection', help='Mint NFT collection')
     mint_collection_parser.add_argument('config_file', help='NFT collection configuration file')
     mint_collection_parser.add_argument('--dry-run', action='store_true', default=True, help='Run in dry-run mode (default)')
     mint_collection_parser.add_argument('--live', action='store_true', help='Run in live mode')
+    mint_collection_parser.set_defaults(
+        func=lambda args, **kwargs: mint_collection(args.config_file, **kwargs),
+        needs_dry_run=True
+    )
     
     validate_nfts_parser = subparsers.add_parser('validate-nfts', help='Validate NFT collection config')
     validate_nfts_parser.add_argument('config_file', help='NFT collection configuration file')
+    validate_nfts_parser.set_defaults(
+        func=lambda args: validate_nft_config(args.config_file)
+    )
     
     nft_template_parser = subparsers.add_parser('nft-template', help='Create NFT collection template')
     nft_template_parser.add_argument('output_file', help='Output template file')
+    nft_template_parser.set_defaults(
+        func=lambda args: create_nft_template(args.output_file)
+    )
     
     # Single NFT command
     mint_nft_parser = subparsers.add_parser('mint-nft', help='Mint single NFT')
@@ -379,6 +431,12 @@ Notes:
     mint_nft_parser.add_argument('--collection-id', help='Collection token ID')
     mint_nft_parser.add_argument('--dry-run', action='store_true', default=True, help='Run in dry-run mode (default)')
     mint_nft_parser.add_argument('--live', action='store_true', help='Run in live mode')
+    mint_nft_parser.set_defaults(
+        func=lambda args, **kwargs: mint_single_nft(
+            args.name, args.description, args.image_url, args.collection_id, **kwargs
+        ),
+        needs_dry_run=True
+    )
     
     # Global options
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
@@ -392,37 +450,12 @@ Notes:
     # Setup logging
     setup_logging(args.verbose)
     
-    # Handle dry-run vs live mode for applicable commands
-    dry_run = True
-    if hasattr(args, 'live') and args.live:
-        dry_run = False
-    elif hasattr(args, 'dry_run'):
-        dry_run = args.dry_run
+    # Commands that can run live get dry_run; --live overrides the --dry-run default
+    kwargs = {"dry_run": not args.live} if args.needs_dry_run else {}
     
     # Execute command
     try:
-        success = True
-        
-        if args.command == 'create-collection':
-            success = create_collection(args.config_file, dry_run)
-        elif args.command == 'validate-collection':
-            success = validate_collection_config(args.config_file)
-        elif args.command == 'collection-template':
-            create_collection_template(args.output_file)
-        elif args.command == 'mint-collection':
-            success = mint_collection(args.config_file, dry_run)
-        elif args.command == 'validate-nfts':
-            success = validate_nft_config(args.config_file)
-        elif args.command == 'nft-template':
-            create_nft_template(args.output_file)
-        elif args.command == 'mint-nft':
-            success = mint_single_nft(
-                args.name, args.description, args.image_url, 
-                args.collection_id, dry_run
-            )
-        else:
-            parser.error(f"Unknown command: {args.command}")
-        
+        success = args.func(args, **kwargs)
         sys.exit(0 if success else 1)
         
     except KeyboardInterrupt:
@@ -12,12 +12,15 @@ Usage:
 
 import sys
 import os
+import importlib.util
 import argparse
+import functools
 import logging
 from pathlib import Path
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Fall back to the src directory only when SigmaPy isn't installed
+if importlib.util.find_spec("sigmapy") is None:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from sigmapy import ErgoClient
 
@@ -31,38 +34,77 @@ def setup_logging(verbose: bool = False):
     )
 
 
-def validate_config(config_file: str):
-    """Validate a token distribution configuration file."""
+@functools.lru_cache(maxsize=1)
+def _get_client(dry_run: bool = True) -> ErgoClient:
+    """Return a shared ErgoClient so repeated commands don't rebuild it."""
+    return ErgoClient(dry_run=dry_run)
+
+
+def validate_config(config_file: str, client: ErgoClient = None, config: dict = None):
+    """Validate a token distribution configuration file (or its parsed config)."""
     print(f"🔍 Validating configuration: {config_file}")
     
     # Initialize client in dry-run mode for validation
-    client = ErgoClient(dry_run=True)
+    if client is None:
+        client = _get_client(dry_run=True)
     
     # Validate configuration
-    result = client.validate_distribution_config(config_file)
+    result = client.validate_distribution_config(config if config is not None else config_file)
     
+    # Build the whole report and write it in one go
+    out = []
     if result['valid']:
-        print("✅ Configuration is valid!")
+        out.append("✅ Configuration is valid!")
         
         # Show summary if available
         if 'total_recipients' in result:
-            print(f"📊 Summary:")
-            print(f"   • Recipients: {result['total_recipients']}")
-            print(f"   • Total tokens: {result['total_tokens']:,}")
-            print(f"   • Single transaction: ✅")
-            print(f"   • Min ERG needed: {result['min_erg_needed']:.6f} ERG")
-            print(f"   • Total fees: {result['total_fees']:.6f} ERG")
-            print(f"   • Total cost: {result['total_erg_needed']:.6f} ERG")
+            out.extend([
+                f"📊 Summary:",
+                f"   • Recipients: {result['total_recipients']}",
+                f"   • Total tokens: {result['total_tokens']:,}",
+                f"   • Single transaction: ✅",
+                f"   • Min ERG needed: {result['min_erg_needed']:.6f} ERG",
+                f"   • Total fees: {result['total_fees']:.6f} ERG",
+                f"   • Total cost: {result['total_erg_needed']:.6f} ERG",
+            ])
     else:
+        out.append("❌ Configuration has errors:")
+        out.extend(f"   • {error}" for error in result['errors'])
+    
+    if result['valid'] and result.get('warnings'):
+        out.append("⚠️  Warnings:")
+        out.extend(f"   • {warning}" for warning in result['warnings'])
+    
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
+    
+    return result['valid']
+
+
+def validate_config_header(config_file: str):
+    """Print the distribution settings without loading the recipient list."""
+    from sigmapy.config import ConfigParser
+    
+    print(f"🔍 Checking configuration header: {config_file}")
+    
+    try:
+        header = ConfigParser.parse_header(config_file)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ Could not read configuration: {e}")
+        return False
+    
+    distribution = header.get('distribution') or {}
+    if not distribution.get('token_id'):
         print("❌ Configuration has errors:")
-        for error in result['errors']:
-            print(f"   • {error}")
+        print("   • Missing required field: distribution.token_id")
         return False
     
-    if result.get('warnings'):
-        print("⚠️  Warnings:")
-        for warning in result['warnings']:
-            print(f"   • {warning}")
+    print("✅ Header looks valid (run without --quick to check every recipient)")
+    print(f"📊 Summary:")
+    print(f"   • Token ID: {distribution['token_id']}")
+    print(f"   • Fee per transaction: {distribution.get('fee_per_tx', 0.001)} ERG")
+    if 'recipients' in header:
+        print(f"   • Recipients: {len(header['recipients'] or [])}")
     
     return True
 
@@ -81,18 +123,28 @@ def distribute_tokens(config_file: str, dry_run: bool = True):
             return False
     
     # Initialize client
-    client = ErgoClient(dry_run=dry_run)
+    client = _get_client(dry_run=dry_run)
     
     # First validate the configuration
     print("\n🔍 Validating configuration...")
-    if not validate_config(config_file):
+    # Parse once; validation and distribution share the same read-only config
+    from sigmapy.config import ParserCache
+    
+    try:
+        config = ParserCache.view(config_file)
+    except Exception as e:
+        print(f"❌ Could not read configuration: {e}")
+        return False
+    
+    if not validate_config(config_file, client, config):
         return False
     
     print(f"\n🎯 Executing distribution...")
     
     try:
         # Execute distribution (single transaction)
-        tx_id = client.distribute_tokens(config_file)
+        # Already validated above - don't check every recipient twice
+        tx_id = client.distribute_tokens(config, validate=False)
         
         print(f"\n✅ Distribution completed successfully!")
         print(f"📋 Transaction created: {tx_id}")
@@ -113,23 +165,30 @@ def create_template(output_file: str):
     """Create a template configuration file."""
     print(f"📝 Creating template configuration: {output_file}")
     
-    client = ErgoClient(dry_run=True)
+    client = _get_client(dry_run=True)
     client.token_manager.create_distribution_template(output_file)
     
     print(f"✅ Template created successfully!")
     print(f"📄 Edit {output_file} with your token details and recipient addresses")
 
 
-def main():
-    """Main CLI function."""
+# Subcommands accepted by the CLI
+COMMANDS = ('validate', 'distribute', 'template')
+
+
+@functools.lru_cache(maxsize=None)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once and reuse it for every main() call."""
     parser = argparse.ArgumentParser(
         description='SigmaPy Token Distribution CLI',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
   %(prog)s validate my_distribution.yaml
+  %(prog)s validate my_distribution.yaml --quick
   %(prog)s distribute my_distribution.yaml --dry-run
   %(prog)s distribute my_distribution.yaml --live
+  %(prog)s distribute my_distribution.yaml --no-yaml-cache
   %(prog)s template new_distribution.yaml
   
 Notes:
@@ -139,21 +198,37 @@ Notes:
         """
     )
     
-    parser.add_argument('command', choices=['validate', 'distribute', 'template'],
+    parser.add_argument('command', choices=COMMANDS,
                         help='Command to execute')
     parser.add_argument('file', help='Configuration file path')
     parser.add_argument('--dry-run', action='store_true', default=True,
                         help='Run in dry-run mode (default)')
     parser.add_argument('--live', action='store_true',
                         help='Run in live mode (create real transactions)')
+    parser.add_argument('--quick', action='store_true',
+                        help='validate: only check the distribution header, not each recipient')
+    parser.add_argument('--no-yaml-cache', action='store_true',
+                        help='Always parse the YAML; do not read or write cached parses')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Enable verbose logging')
     
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv=None):
+    """Main CLI function."""
+    parser = _get_parser()
+    args = parser.parse_args(argv)
     
     # Setup logging
     setup_logging(args.verbose)
     
+    # Set before the client reads its environment so it keeps the choice
+    if args.no_yaml_cache:
+        from sigmapy.config import set_yaml_cache_enabled
+        os.environ["SIGMAPY_YAML_CACHE"] = "false"
+        set_yaml_cache_enabled(False)
+    
     # Handle dry-run vs live mode
     if args.live:
         dry_run = False
@@ -162,7 +237,9 @@ Notes:
     
     # Execute command
     try:
-        if args.command == 'validate':
+        if args.command == 'validate' and args.quick:
+            success = validate_config_header(args.file)
+        elif args.command == 'validate':
             success = validate_config(args.file)
         elif args.command == 'distribute':
             success = distribute_tokens(args.file, dry_run)
@@ -15,9 +15,11 @@ Usage:
 
 import sys
 import os
+import importlib.util
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Fall back to the src directory only when SigmaPy isn't installed
+if importlib.util.find_spec("sigmapy") is None:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from sigmapy.examples import AdvancedTransactionExample
 
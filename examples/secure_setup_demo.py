@@ -14,10 +14,11 @@ Usage:
 
 import sys
 import os
-from pathlib import Path
+import importlib.util
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Fall back to the src directory only when SigmaPy isn't installed
+if importlib.util.find_spec("sigmapy") is None:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from sigmapy import ErgoClient
 from sigmapy.utils import EnvManager, validate_env_security
@@ -48,7 +49,7 @@ def demo_environment_setup():
     print()
     
     # Show current configuration
-    print("2. Current configuration:")
+    out = ["2. Current configuration:"]
     config = env_manager.get_config_dict()
     for key, value in config.items():
         if key == "seed_phrase" and value:
@@ -58,27 +59,27 @@ def demo_environment_setup():
             display_value = f"{value[:8]}..." if len(value) > 8 else "[HIDDEN]"
         else:
             display_value = value
-        print(f"   {key}: {display_value}")
+        out.append(f"   {key}: {display_value}")
     
-    print()
+    out.append("")
     
     # Security validation
-    print("3. Security validation:")
+    out.append("3. Security validation:")
     security = validate_env_security()
     
     if security["secure"]:
-        print("   ✅ All security checks passed")
+        out.append("   ✅ All security checks passed")
     else:
-        print("   ❌ Security issues detected:")
-        for issue in security["issues"]:
-            print(f"      - {issue}")
+        out.append("   ❌ Security issues detected:")
+        out.extend(f"      - {issue}" for issue in security["issues"])
     
     if security["warnings"]:
-        print("   ⚠️  Security warnings:")
-        for warning in security["warnings"]:
-            print(f"      - {warning}")
+        out.append("   ⚠️  Security warnings:")
+        out.extend(f"      - {warning}" for warning in security["warnings"])
     
-    print()
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
 
 
 def demo_secure_client_initialization():
@@ -141,38 +142,35 @@ def demo_environment_overrides():
 
 def demo_security_best_practices():
     """Demonstrate security best practices."""
-    print("🛡️  Security Best Practices")
-    print("=" * 50)
-    print()
-    
-    print("✅ DO:")
-    print("   • Store seed phrases in .env files")
-    print("   • Add .env to .gitignore")
-    print("   • Use environment variables in production")
-    print("   • Validate configuration before use")
-    print("   • Use testnet for development")
-    print("   • Keep ergo-lib-python updated")
-    
-    print()
-    
-    print("❌ DON'T:")
-    print("   • Hardcode seed phrases in source code")
-    print("   • Commit .env files to version control")
-    print("   • Share seed phrases with others")
-    print("   • Use test seed phrases on mainnet")
-    print("   • Store seed phrases in plain text files")
-    print("   • Use the same seed phrase for multiple purposes")
-    
-    print()
-    
-    print("💡 Additional Security Tips:")
-    print("   • Use different addresses for different purposes")
-    print("   • Monitor your transactions regularly")
-    print("   • Use multi-signature wallets for large amounts")
-    print("   • Keep backups of your seed phrase secure")
-    print("   • Test on testnet before mainnet operations")
-    
-    print()
+    sys.stdout.write("""\
+🛡️  Security Best Practices
+==================================================
+
+✅ DO:
+   • Store seed phrases in .env files
+   • Add .env to .gitignore
+   • Use environment variables in production
+   • Validate configuration before use
+   • Use testnet for development
+   • Keep ergo-lib-python updated
+
+❌ DON'T:
+   • Hardcode seed phrases in source code
+   • Commit .env files to version control
+   • Share seed phrases with others
+   • Use test seed phrases on mainnet
+   • Store seed phrases in plain text files
+   • Use the same seed phrase for multiple purposes
+
+💡 Additional Security Tips:
+   • Use different addresses for different purposes
+   • Monitor your transactions regularly
+   • Use multi-signature wallets for large amounts
+   • Keep backups of your seed phrase secure
+   • Test on testnet before mainnet operations
+
+""")
+    sys.stdout.flush()
 
 
 def demo_environment_file_creation():
@@ -186,34 +184,33 @@ def demo_environment_file_creation():
     print("1. Creating .env file template...")
     
     # Create example .env file
-    example_path = Path(__file__).parent.parent / ".env.example"
-    if example_path.exists():
+    project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    example_path = os.path.join(project_dir, '.env.example')
+    if os.path.isfile(example_path):
         print(f"   ✅ .env.example already exists: {example_path}")
     else:
         env_manager.create_env_file()
         print(f"   ✅ Created .env.example: {example_path}")
     
-    print()
-    
-    print("2. .env file template contents:")
-    print("   ```")
-    print("   # SigmaPy Environment Configuration")
-    print("   SIGMAPY_SEED_PHRASE=\"your twelve word mnemonic...\"")
-    print("   SIGMAPY_NETWORK=\"testnet\"")
-    print("   SIGMAPY_NODE_URL=\"\"")
-    print("   SIGMAPY_API_KEY=\"\"")
-    print("   SIGMAPY_DEMO_MODE=\"true\"")
-    print("   ```")
-    
-    print()
-    
-    print("3. To use the .env file:")
-    print("   • Copy .env.example to .env")
-    print("   • Fill in your actual values")
-    print("   • Never commit .env to git")
-    print("   • Keep .env file permissions secure")
-    
-    print()
+    sys.stdout.write("""
+2. .env file template contents:
+   ```
+   # SigmaPy Environment Configuration
+   SIGMAPY_SEED_PHRASE="your twelve word mnemonic..."
+   SIGMAPY_NETWORK="testnet"
+   SIGMAPY_NODE_URL=""
+   SIGMAPY_API_KEY=""
+   SIGMAPY_DEMO_MODE="true"
+   ```
+
+3. To use the .env file:
+   • Copy .env.example to .env
+   • Fill in your actual values
+   • Never commit .env to git
+   • Keep .env file permissions secure
+
+""")
+    sys.stdout.flush()
 
 
 def main():
@@ -230,20 +227,23 @@ def main():
         demo_security_best_practices()
         demo_environment_file_creation()
         
-        print("🎉 Security demo completed successfully!")
-        print()
-        print("📚 What you learned:")
-        print("• How to use .env files for secure configuration")
-        print("• How to validate security settings")
-        print("• How to override environment variables")
-        print("• Security best practices for seed phrases")
-        print("• How to create and manage environment files")
-        print()
-        print("🔧 Next steps:")
-        print("• Create your own .env file with real values")
-        print("• Test with testnet before using mainnet")
-        print("• Review and follow all security best practices")
-        print("• Set up proper file permissions for .env")
+        sys.stdout.write("""\
+🎉 Security demo completed successfully!
+
+📚 What you learned:
+• How to use .env files for secure configuration
+• How to validate security settings
+• How to override environment variables
+• Security best practices for seed phrases
+• How to create and manage environment files
+
+🔧 Next steps:
+• Create your own .env file with real values
+• Test with testnet before using mainnet
+• Review and follow all security best practices
+• Set up proper file permissions for .env
+""")
+        sys.stdout.flush()
         
     except Exception as e:
         print(f"❌ Demo failed: {e}")
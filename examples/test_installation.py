@@ -11,36 +11,39 @@ Usage:
 
 import sys
 import os
-from pathlib import Path
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Fall back to the src directory only when SigmaPy isn't installed
+try:
+    import sigmapy  # noqa: F401
+except ImportError:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-def test_python_version():
+def test_python_version(out=print):
     """Test if Python version is supported."""
-    print("🐍 Testing Python version...")
+    out("🐍 Testing Python version...")
     
     version = sys.version_info
     if version.major < 3 or (version.major == 3 and version.minor < 8):
-        print(f"   ❌ Python {version.major}.{version.minor} is not supported")
-        print("   💡 Please upgrade to Python 3.8 or higher")
+        out(f"   ❌ Python {version.major}.{version.minor} is not supported")
+        out("   💡 Please upgrade to Python 3.8 or higher")
         return False
     
-    print(f"   ✅ Python {version.major}.{version.minor}.{version.micro} is supported")
+    out(f"   ✅ Python {version.major}.{version.minor}.{version.micro} is supported")
     return True
 
-def test_sigmapy_import():
+def test_sigmapy_import(out=print):
     """Test if SigmaPy can be imported."""
-    print("📦 Testing SigmaPy import...")
+    out("📦 Testing SigmaPy import...")
     
     try:
         import sigmapy
-        print(f"   ✅ SigmaPy v{sigmapy.__version__} imported successfully")
-        return True
     except ImportError as e:
-        print(f"   ❌ Failed to import SigmaPy: {e}")
-        print("   💡 Try running: pip install -e .")
+        out(f"   ❌ Failed to import SigmaPy: {e}")
+        out("   💡 Try running: pip install -e .")
         return False
+    
+    out(f"   ✅ SigmaPy v{sigmapy.__version__} imported successfully")
+    return True
 
 def test_sigmapy_components():
     """Test if SigmaPy components can be imported."""
@@ -55,11 +58,17 @@ def test_sigmapy_components():
         ("SerializationUtils", "sigmapy.utils", "SerializationUtils"),
     ]
     
+    import importlib
+    
+    # Each distinct module is imported once and reused for its components
+    modules = {}
+    
     success = True
     for name, module, component in components:
         try:
-            mod = __import__(module, fromlist=[component])
-            getattr(mod, component)
+            if module not in modules:
+                modules[module] = importlib.import_module(module)
+            getattr(modules[module], component)
             print(f"   ✅ {name} imported successfully")
         except ImportError as e:
             print(f"   ❌ Failed to import {name}: {e}")
@@ -70,30 +79,32 @@ def test_sigmapy_components():
     
     return success
 
-def test_ergo_lib_python():
+def test_ergo_lib_python(out=print):
     """Test if ergo-lib-python is available."""
-    print("🔗 Testing ergo-lib-python...")
+    out("🔗 Testing ergo-lib-python...")
     
-    try:
-        import ergo_lib_python
-        print("   ✅ ergo-lib-python imported successfully")
-        print("   🎉 Full blockchain functionality available!")
+    # Probe for the module without running its native initialization
+    from importlib.util import find_spec
+    
+    if find_spec("ergo_lib_python") is not None:
+        out("   ✅ ergo-lib-python found")
+        out("   🎉 Full blockchain functionality available!")
         return True
-    except ImportError:
-        print("   ⚠️  ergo-lib-python not found")
-        print("   💡 SigmaPy will work in demo mode")
-        print("   💡 To enable full functionality, install ergo-lib-python:")
-        print("       pip install ergo-lib-python")
-        print("   💡 Or build from source:")
-        print("       git clone https://github.com/ergoplatform/sigma-rust.git")
-        print("       cd sigma-rust/bindings/ergo-lib-python")
-        print("       pip install maturin")
-        print("       maturin develop --release")
+    else:
+        out("   ⚠️  ergo-lib-python not found")
+        out("   💡 SigmaPy will work in demo mode")
+        out("   💡 To enable full functionality, install ergo-lib-python:")
+        out("       pip install ergo-lib-python")
+        out("   💡 Or build from source:")
+        out("       git clone https://github.com/ergoplatform/sigma-rust.git")
+        out("       cd sigma-rust/bindings/ergo-lib-python")
+        out("       pip install maturin")
+        out("       maturin develop --release")
         return False
 
-def test_dependencies():
+def test_dependencies(out=print):
     """Test if required dependencies are available."""
-    print("📚 Testing dependencies...")
+    out("📚 Testing dependencies...")
     
     dependencies = [
         ("requests", "HTTP client for node communication"),
@@ -102,24 +113,20 @@ def test_dependencies():
         ("typing_extensions", "Enhanced type hints"),
     ]
     
+    # Only check that each dependency is installed; importing is left to
+    # the tests that actually use it
+    from importlib.util import find_spec
+    
     success = True
     for dep, description in dependencies:
-        try:
-            if dep == "yaml":
-                import yaml
-            elif dep == "json":
-                import json
-            elif dep == "typing_extensions":
-                import typing_extensions
-            else:
-                __import__(dep)
-            print(f"   ✅ {dep} - {description}")
-        except ImportError:
-            print(f"   ❌ {dep} - {description}")
+        if find_spec(dep) is not None:
+            out(f"   ✅ {dep} - {description}")
+        else:
+            out(f"   ❌ {dep} - {description}")
             if dep == "yaml":
-                print("       Install with: pip install PyYAML")
+                out("       Install with: pip install PyYAML")
             elif dep == "typing_extensions":
-                print("       Install with: pip install typing-extensions")
+                out("       Install with: pip install typing-extensions")
             success = False
     
     return success
@@ -201,11 +208,11 @@ def test_config_files():
         print(f"   ❌ Configuration test failed: {e}")
         return False
 
-def test_examples():
+def test_examples(out=print):
     """Test if example files exist and can be imported."""
-    print("📝 Testing examples...")
+    out("📝 Testing examples...")
     
-    examples_dir = Path(__file__).parent
+    examples_dir = os.path.dirname(os.path.abspath(__file__))
     
     examples = [
         "beginner_friendly_demo.py",
@@ -216,11 +223,10 @@ def test_examples():
     
     success = True
     for example in examples:
-        example_path = examples_dir / example
-        if example_path.exists():
-            print(f"   ✅ {example} exists")
+        if os.path.isfile(os.path.join(examples_dir, example)):
+            out(f"   ✅ {example} exists")
         else:
-            print(f"   ❌ {example} missing")
+            out(f"   ❌ {example} missing")
             success = False
     
     return success
@@ -231,18 +237,43 @@ def main():
     print("=" * 50)
     print()
     
-    tests = [
+    # Presence checks only probe the filesystem, so they run concurrently;
+    # each one's output is buffered and printed in order afterwards
+    presence_tests = [
         ("Python Version", test_python_version),
         ("SigmaPy Import", test_sigmapy_import),
-        ("SigmaPy Components", test_sigmapy_components),
         ("Dependencies", test_dependencies),
         ("ergo-lib-python", test_ergo_lib_python),
+        ("Examples", test_examples),
+    ]
+    
+    # These exercise the API and must run one at a time
+    tests = [
+        ("SigmaPy Components", test_sigmapy_components),
         ("Basic Functionality", test_basic_functionality),
         ("Configuration Files", test_config_files),
-        ("Examples", test_examples),
     ]
     
+    from concurrent.futures import ThreadPoolExecutor
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        probes = []
+        for test_name, test_func in presence_tests:
+            output = []
+            probes.append((test_name, output, executor.submit(test_func, output.append)))
+    
     results = []
+    for test_name, output, future in probes:
+        print("\n".join(output))
+        try:
+            result = future.result()
+            results.append((test_name, result))
+            print()
+        except Exception as e:
+            print(f"   ❌ {test_name} test crashed: {e}")
+            results.append((test_name, False))
+            print()
+    
     for test_name, test_func in tests:
         try:
             result = test_func()
@@ -14,10 +14,12 @@ Usage:
 
 import sys
 import os
+import importlib.util
 import logging
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Fall back to the src directory only when SigmaPy isn't installed
+if importlib.util.find_spec("sigmapy") is None:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from sigmapy import ErgoClient
 from pathlib import Path
@@ -28,67 +30,81 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+def _write(lines):
+    """Write a block of report lines to stdout in one call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def test_token_distribution():
     """Test token distribution functionality."""
-    print("🧪 Testing SigmaPy Token Distribution")
-    print("=" * 50)
+    # Each section's report is collected and written once, not line by line
+    _write([
+        "🧪 Testing SigmaPy Token Distribution",
+        "=" * 50,
+        "\n1. Initializing ErgoClient in dry-run mode...",
+    ])
     
     # Test with demo mode (no real wallet needed)
-    print("\n1. Initializing ErgoClient in dry-run mode...")
     client = ErgoClient(
         seed_phrase="abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about",
         network="testnet",
         dry_run=True
     )
     
-    print(f"   ✓ Client initialized: {client}")
-    print(f"   ✓ Dry-run mode: {client.get_dry_run_mode()}")
-    print(f"   ✓ Network: {client.get_network_info()['network']}")
+    _write([
+        f"   ✓ Client initialized: {client}",
+        f"   ✓ Dry-run mode: {client.get_dry_run_mode()}",
+        f"   ✓ Network: {client.get_network_info()['network']}",
+    ])
     
     # Test configuration validation
-    print("\n2. Testing configuration validation...")
+    out = ["\n2. Testing configuration validation..."]
     config_file = Path(__file__).parent / "test_large_distribution.yaml"
     
     validation_result = client.validate_distribution_config(config_file)
     
-    print(f"   ✓ Configuration file: {config_file}")
-    print(f"   ✓ Valid: {validation_result['valid']}")
+    out.append(f"   ✓ Configuration file: {config_file}")
+    out.append(f"   ✓ Valid: {validation_result['valid']}")
     
     # Print validation result contents for debugging
-    print(f"   Debug: validation_result keys = {list(validation_result.keys())}")
+    out.append(f"   Debug: validation_result keys = {list(validation_result.keys())}")
     
     if 'total_recipients' in validation_result:
-        print(f"   ✓ Total recipients: {validation_result['total_recipients']}")
-        print(f"   ✓ Total tokens: {validation_result['total_tokens']}")
-        print(f"   ✓ Estimated batches: {validation_result['estimated_batches']}")
-        print(f"   ✓ Min ERG needed: {validation_result['min_erg_needed']:.6f} ERG")
-        print(f"   ✓ Total fees: {validation_result['total_fees']:.6f} ERG")
-        print(f"   ✓ Total ERG needed: {validation_result['total_erg_needed']:.6f} ERG")
+        out.append(f"   ✓ Total recipients: {validation_result['total_recipients']}")
+        out.append(f"   ✓ Total tokens: {validation_result['total_tokens']}")
+        out.append(f"   ✓ Estimated batches: {validation_result['estimated_batches']}")
+        out.append(f"   ✓ Min ERG needed: {validation_result['min_erg_needed']:.6f} ERG")
+        out.append(f"   ✓ Total fees: {validation_result['total_fees']:.6f} ERG")
+        out.append(f"   ✓ Total ERG needed: {validation_result['total_erg_needed']:.6f} ERG")
     else:
-        print(f"   ❌ Validation result missing expected fields")
+        out.append(f"   ❌ Validation result missing expected fields")
     
     if validation_result['errors']:
-        print(f"   ⚠️  Validation errors: {validation_result['errors']}")
+        out.append(f"   ⚠️  Validation errors: {validation_result['errors']}")
     
     if validation_result['warnings']:
-        print(f"   ⚠️  Validation warnings: {validation_result['warnings']}")
+        out.append(f"   ⚠️  Validation warnings: {validation_result['warnings']}")
     
     # Test dry-run distribution
-    print("\n3. Testing dry-run token distribution...")
+    out.append("\n3. Testing dry-run token distribution...")
+    _write(out)
     try:
         tx_ids = client.distribute_tokens(config_file)
         
-        print(f"   ✓ Dry-run distribution completed")
-        print(f"   ✓ Transaction IDs generated: {len(tx_ids)}")
-        for i, tx_id in enumerate(tx_ids):
-            print(f"     {i+1}. {tx_id}")
+        out = [
+            f"   ✓ Dry-run distribution completed",
+            f"   ✓ Transaction IDs generated: {len(tx_ids)}",
+        ]
+        out.extend(f"     {i+1}. {tx_id}" for i, tx_id in enumerate(tx_ids))
+        _write(out)
         
     except Exception as e:
-        print(f"   ❌ Error during distribution: {e}")
+        _write([f"   ❌ Error during distribution: {e}"])
         return False
     
     # Test address validation
-    print("\n4. Testing address validation...")
+    out = ["\n4. Testing address validation..."]
     test_addresses = [
         "9fRusAarL1KkrWQVsxSRVYnvWzD4dWoLLxbYk3eWBV3jD3qvr3W",  # Valid mainnet
         "3WvsT2Gm4EpsM9Pg18PdY6XyhNNMqXDsvJTbbf6ihLvAmSb7u5RN",  # Valid testnet
@@ -96,35 +112,39 @@ def test_token_distribution():
         "9"  # Too short
     ]
     
-    for addr in test_addresses:
-        is_valid = client.validate_address(addr)
-        print(f"   {addr[:20]}... : {'✓ Valid' if is_valid else '❌ Invalid'}")
+    results = client.validate_addresses(test_addresses)
+    out.extend(
+        f"   {addr[:20]}... : {'✓ Valid' if is_valid else '❌ Invalid'}"
+        for addr, is_valid in zip(test_addresses, results)
+    )
     
     # Test wallet functionality
-    print("\n5. Testing wallet functionality...")
+    out.append("\n5. Testing wallet functionality...")
+    _write(out)
+    out = []
     try:
         addresses = client.get_addresses(3)
-        print(f"   ✓ Generated {len(addresses)} addresses:")
-        for i, addr in enumerate(addresses):
-            print(f"     {i+1}. {addr}")
+        out.append(f"   ✓ Generated {len(addresses)} addresses:")
+        out.extend(f"     {i+1}. {addr}" for i, addr in enumerate(addresses))
         
         balance = client.get_balance()
-        print(f"   ✓ Balance retrieved: {balance['erg']} ERG")
+        out.append(f"   ✓ Balance retrieved: {balance['erg']} ERG")
         
     except Exception as e:
-        print(f"   ❌ Error testing wallet: {e}")
+        out.append(f"   ❌ Error testing wallet: {e}")
     
     # Test dry-run mode toggle
-    print("\n6. Testing dry-run mode toggle...")
-    print(f"   Current dry-run mode: {client.get_dry_run_mode()}")
+    out.append("\n6. Testing dry-run mode toggle...")
+    out.append(f"   Current dry-run mode: {client.get_dry_run_mode()}")
     
     client.set_dry_run_mode(False)
-    print(f"   After disabling: {client.get_dry_run_mode()}")
+    out.append(f"   After disabling: {client.get_dry_run_mode()}")
     
     client.set_dry_run_mode(True)
-    print(f"   After re-enabling: {client.get_dry_run_mode()}")
+    out.append(f"   After re-enabling: {client.get_dry_run_mode()}")
     
-    print("\n✅ All tests completed successfully!")
+    out.append("\n✅ All tests completed successfully!")
+    _write(out)
     return True
 
 def test_config_generation():
@@ -18,16 +18,41 @@ __version__ = "0.1.0"
 __author__ = "Ergo Community"
 __email__ = "community@ergoplatform.org"
 
-# High-level API - Main entry point
-from .client import ErgoClient
+from typing import TYPE_CHECKING
 
-# Operation managers (only what exists)
-from .operations import TokenManager
-# from .operations import NFTMinter, BatchProcessor  # TODO: Implement these
-# from .config import ConfigParser  # TODO: Implement this
+from ._lazy import make_lazy
+
+# Public names and the submodule that defines each one. They are imported on
+# first attribute access (PEP 562), so ``from sigmapy import AmountUtils``
+# doesn't pay for the client, operation managers and ergo bindings.
+_LAZY = {
+    # High-level API - Main entry point
+    "ErgoClient": "sigmapy.client",
+    
+    # Operation managers
+    "TokenManager": "sigmapy.operations",
+    
+    # Configuration
+    "ConfigParser": "sigmapy.config",
+    
+    # Essential utilities only
+    "AmountUtils": "sigmapy.utils",
+    "EnvManager": "sigmapy.utils",
+}
+
+# Subpackages reachable as attributes (sigmapy.tutorials) without an import;
+# they are never imported just because sigmapy is
+_SUBMODULES = ("tutorials", "examples")
+
+if TYPE_CHECKING:
+    from .client import ErgoClient
+    from .operations import TokenManager
+    from .config import ConfigParser
+    from .utils import AmountUtils, EnvManager
+
+
+__getattr__, __dir__ = make_lazy(__name__, _LAZY, _SUBMODULES)
 
-# Essential utilities only
-from .utils import AmountUtils, EnvManager
 
 __all__ = [
     # High-level API
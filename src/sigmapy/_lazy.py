@@ -0,0 +1,53 @@
+"""
+Lazy package exports (PEP 562)
+
+Packages list their public names in a table mapping each name to the module
+that defines it; the name is imported on first attribute access, so importing
+a package never pulls in modules the caller doesn't use.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+import importlib
+import sys
+
+
+def make_lazy(
+    package: str,
+    table: Dict[str, str],
+    submodules: Iterable[str] = ()
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module-level ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        package: The package's ``__name__``
+        table: Public name -> module defining it (absolute, or relative to
+            ``package``)
+        submodules: Subpackages reachable as attributes without an import
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign at the package's top level
+
+    Examples:
+        >>> __getattr__, __dir__ = make_lazy(__name__, _LAZY)
+    """
+    submodules = tuple(submodules)
+
+    def __getattr__(name: str) -> Any:
+        """Import a public name from its module on first access."""
+        if name in submodules:
+            # Importing a subpackage binds it as an attribute of the package
+            return importlib.import_module(f"{package}.{name}")
+        try:
+            module_name = table[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Cache it so later lookups skip __getattr__ entirely
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(table) | set(submodules))
+
+    return __getattr__, __dir__
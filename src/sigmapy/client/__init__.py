@@ -6,12 +6,35 @@ Ergo blockchain operations including wallet management, transaction building,
 and network interactions.
 """
 
-from .ergo_client import ErgoClient
-from .wallet_manager import WalletManager
-from .network_manager import NetworkManager
+from typing import TYPE_CHECKING
+
+from .._lazy import make_lazy
+
+# Each name is imported from its module on first access (PEP 562), so
+# importing WalletManager or NetworkManager alone doesn't import ErgoClient
+# and every operation manager behind it
+_LAZY = {
+    "ErgoClient": ".ergo_client",
+    "WalletManager": ".wallet_manager",
+    "NetworkManager": ".network_manager",
+    "AsyncNetworkManager": ".async_network_manager",
+    "CircuitOpenError": ".network_manager",
+}
+
+if TYPE_CHECKING:
+    from .ergo_client import ErgoClient
+    from .wallet_manager import WalletManager
+    from .network_manager import CircuitOpenError, NetworkManager
+    from .async_network_manager import AsyncNetworkManager
+
+
+__getattr__, __dir__ = make_lazy(__name__, _LAZY)
+
 
 __all__ = [
     "ErgoClient",
     "WalletManager",
     "NetworkManager",
+    "AsyncNetworkManager",
+    "CircuitOpenError",
 ]
\ No newline at end of file
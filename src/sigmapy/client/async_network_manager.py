@@ -0,0 +1,90 @@
+"""
+AsyncNetworkManager - asyncio interface to node operations
+
+This class exposes the NetworkManager lookups as coroutines so callers can
+run many of them at once with asyncio.gather(). Each call runs the
+synchronous NetworkManager method in a worker thread, so every request
+still shares its pooled keep-alive session, circuit breaker, caches and
+request coalescing.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import functools
+
+from .network_manager import NetworkManager
+
+
+class AsyncNetworkManager:
+    """
+    Awaitable wrapper around a NetworkManager.
+    
+    Examples:
+        >>> async_network = AsyncNetworkManager(client.network_manager)
+        >>> balances = await asyncio.gather(
+        ...     *(async_network.get_address_balance(a) for a in addresses)
+        ... )
+    """
+    
+    def __init__(self, network_manager: NetworkManager):
+        """
+        Initialize AsyncNetworkManager.
+        
+        Args:
+            network_manager: NetworkManager whose session and caches to use
+        """
+        self.network_manager = network_manager
+    
+    @staticmethod
+    async def _run(fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking call on the loop's default executor (asyncio.to_thread needs 3.9)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(fn, *args))
+    
+    async def get_network_info(self) -> Dict[str, Any]:
+        """Get network information (see NetworkManager.get_network_info)."""
+        return await self._run(self.network_manager.get_network_info)
+    
+    async def get_block_height(self) -> int:
+        """Get current block height (see NetworkManager.get_block_height)."""
+        return await self._run(self.network_manager.get_block_height)
+    
+    async def get_address_balance(self, address: str) -> Dict[str, Any]:
+        """Get balance for an address (see NetworkManager.get_address_balance)."""
+        return await self._run(self.network_manager.get_address_balance, address)
+    
+    async def get_address_utxos(self, address: str) -> List[Dict[str, Any]]:
+        """Get UTXOs for an address (see NetworkManager.get_address_utxos)."""
+        return await self._run(self.network_manager.get_address_utxos, address)
+    
+    async def broadcast_transaction(self, signed_tx: Any) -> str:
+        """Broadcast a signed transaction (see NetworkManager.broadcast_transaction)."""
+        return await self._run(self.network_manager.broadcast_transaction, signed_tx)
+    
+    async def get_transaction_status(self, tx_id: str) -> Dict[str, Any]:
+        """Get transaction status (see NetworkManager.get_transaction_status)."""
+        return await self._run(self.network_manager.get_transaction_status, tx_id)
+    
+    async def wait_for_confirmations(
+        self,
+        tx_ids: List[Optional[str]],
+        timeout_seconds: int = 300,
+        min_confirmations: int = 1
+    ) -> Dict[str, Dict[str, Any]]:
+        """Wait for many transactions (see NetworkManager.wait_for_confirmations)."""
+        return await self._run(
+            self.network_manager.wait_for_confirmations,
+            tx_ids, timeout_seconds, min_confirmations
+        )
+    
+    async def get_mempool_size(self) -> int:
+        """Get current mempool size (see NetworkManager.get_mempool_size)."""
+        return await self._run(self.network_manager.get_mempool_size)
+    
+    async def get_token_info(self, token_id: str) -> Dict[str, Any]:
+        """Get token information (see NetworkManager.get_token_info)."""
+        return await self._run(self.network_manager.get_token_info, token_id)
+    
+    def __repr__(self) -> str:
+        """Detailed string representation."""
+        return f"AsyncNetworkManager({self.network_manager!r})"
@@ -6,10 +6,15 @@ Ergo blockchain operations including wallet management, NFT minting, token
 operations, and smart contract interactions.
 """
 
-from typing import Dict, List, Optional, Union, Any
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union, Any
+import functools
 import logging
+import os
+import time
+from collections import OrderedDict
 from pathlib import Path
 
+from ..config import set_yaml_cache_enabled
 from ..operations import TokenManager
 from ..operations.collection_manager import CollectionManager
 from ..operations.nft_minter import NFTMinter
@@ -19,6 +24,24 @@ from .wallet_manager import WalletManager
 from .network_manager import NetworkManager
 
 
+logger = logging.getLogger(__name__)
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _invalidates_balance(method: _F) -> _F:
+    """Mark a client method that may spend or receive funds."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            # Even a failed call may have broadcast part of its work
+            self.invalidate_balance_cache()
+    return wrapper  # type: ignore[return-value]
+
+
 class ErgoClient:
     """
     High-level client for Ergo blockchain operations.
@@ -46,8 +69,28 @@ class ErgoClient:
         ...     token_id="abc123...",
         ...     config_file="distribution.yaml"
         ... )
+    
+    All node requests share one pooled keep-alive HTTP session, so a
+    long-lived client pays the TCP/TLS handshake once rather than per call.
+    Use the client as a context manager (or call ``close()``) to release
+    its connections when done:
+    
+        >>> with ErgoClient(seed_phrase="...") as client:
+        ...     client.airdrop_tokens("abc123...", addresses, amounts)
     """
     
+    # How long get_network_info() results are reused before asking the node again
+    NETWORK_INFO_TTL_SECONDS = 5.0
+    
+    # How long get_balance() results are reused; any transaction clears them
+    BALANCE_TTL_SECONDS = 0.5
+    
+    # Distinct addresses whose balances are remembered at once
+    BALANCE_CACHE_SIZE = 512
+    
+    # Distinct royalty splits remembered by create_royalty_structure()
+    ROYALTY_CACHE_SIZE = 128
+    
     def __init__(
         self,
         seed_phrase: Optional[str] = None,
@@ -55,7 +98,9 @@ class ErgoClient:
         network: Optional[str] = None,
         api_key: Optional[str] = None,
         env_file: Optional[str] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        yaml_cache: Optional[bool] = None,
+        selection_strategy: str = "auto"
     ):
         """
         Initialize the ErgoClient.
@@ -67,6 +112,11 @@ class ErgoClient:
             api_key: API key for node access (overrides env)
             env_file: Path to .env file (defaults to .env in current directory)
             dry_run: If True, build transactions but don't broadcast them
+            yaml_cache: Cache parsed config files on disk. This is a
+                process-wide setting, changed only when given; it otherwise
+                follows SIGMAPY_YAML_CACHE as read at import (default True)
+            selection_strategy: Token transaction input selection, "auto" or
+                "single_pass" (see TokenManager)
             
         Examples:
             >>> # Initialize with environment variables
@@ -82,7 +132,7 @@ class ErgoClient:
             >>> # Initialize with custom .env file
             >>> client = ErgoClient(env_file="custom.env")
         """
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         
         # Initialize environment manager
         self.env_manager = EnvManager(env_file)
@@ -93,6 +143,10 @@ class ErgoClient:
         # Set dry run mode
         self.dry_run = dry_run or config.get("demo_mode", False)
         
+        # Config file caching is process-wide, so only an explicit choice changes it
+        if yaml_cache is not None:
+            set_yaml_cache_enabled(yaml_cache)
+        
         # Validate security
         security = self.env_manager.validate_security()
         if not security["secure"]:
@@ -113,17 +167,43 @@ class ErgoClient:
             config["timeout"]
         )
         
-        # Initialize operation handlers with dry-run mode
-        self.token_manager = TokenManager(self.wallet_manager, self.network_manager, self.dry_run)
-        self.collection_manager = CollectionManager(self.wallet_manager, self.network_manager, self.dry_run)
-        self.nft_minter = NFTMinter(self.wallet_manager, self.network_manager, self.dry_run)
-        self.royalty_manager = RoyaltyManager()
+        # Operation handlers are built on first use (see the properties below);
+        # reject a bad strategy now rather than at the first token operation
+        TokenManager.check_selection_strategy(selection_strategy)
+        self.selection_strategy = selection_strategy
+        
+        # (fetched_at, info) for the short-lived get_network_info() cache
+        self._network_info_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # address (None for the primary address) -> (fetched_at, balance), in LRU order
+        self._balance_cache: "OrderedDict[Optional[str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # recipients signature -> royalty structure, in LRU order
+        self._royalty_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
         # TODO: Implement remaining managers
         # self.contract_manager = ContractManager(self.wallet_manager, self.network_manager, self.dry_run)
         # self.batch_processor = BatchProcessor(self.wallet_manager, self.network_manager, self.dry_run)
         
         self.logger.info(f"ErgoClient initialized for {config['network']}")
     
+    # Operation handlers, created lazily so clients that only query balances
+    # or validate addresses never build them
+    @functools.cached_property
+    def token_manager(self) -> TokenManager:
+        return TokenManager(
+            self.wallet_manager, self.network_manager, self.dry_run, self.selection_strategy
+        )
+    
+    @functools.cached_property
+    def collection_manager(self) -> CollectionManager:
+        return CollectionManager(self.wallet_manager, self.network_manager, self.dry_run)
+    
+    @functools.cached_property
+    def nft_minter(self) -> NFTMinter:
+        return NFTMinter(self.wallet_manager, self.network_manager, self.dry_run)
+    
+    @functools.cached_property
+    def royalty_manager(self) -> RoyaltyManager:
+        return RoyaltyManager()
+    
     def _get_config(
         self, 
         seed_phrase: Optional[str], 
@@ -167,8 +247,40 @@ class ErgoClient:
             >>> balance = client.get_balance()
             >>> print(f"ERG Balance: {balance['erg']} ERG")
             >>> print(f"Tokens: {balance['tokens']}")
+        
+        Results are reused for BALANCE_TTL_SECONDS, so polling callers make
+        at most one node request per window; sending or minting through
+        this client clears them immediately.
+        """
+        now = time.monotonic()
+        cached = self._balance_cache.get(address)
+        if cached is not None and now - cached[0] < self.BALANCE_TTL_SECONDS:
+            self._balance_cache.move_to_end(address)
+            return self._copy_balance(cached[1])
+        
+        balance = self.wallet_manager.get_balance(address)
+        self._balance_cache[address] = (now, balance)
+        self._balance_cache.move_to_end(address)
+        if len(self._balance_cache) > self.BALANCE_CACHE_SIZE:
+            self._balance_cache.popitem(last=False)
+        return self._copy_balance(balance)
+    
+    @staticmethod
+    def _copy_balance(balance: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a balance so callers can't modify the cached one."""
+        return {
+            **balance,
+            "tokens": [dict(token) for token in balance.get("tokens", [])]
+        }
+    
+    def invalidate_balance_cache(self) -> None:
         """
-        return self.wallet_manager.get_balance(address)
+        Forget all cached balances.
+        
+        Called automatically after every transaction made through this
+        client; call it yourself when funds move by other means.
+        """
+        self._balance_cache.clear()
     
     def get_addresses(self, count: int = 1) -> List[str]:
         """
@@ -186,6 +298,7 @@ class ErgoClient:
         """
         return self.wallet_manager.get_addresses(count)
     
+    @_invalidates_balance
     def send_erg(
         self,
         recipient: str,
@@ -216,6 +329,7 @@ class ErgoClient:
     # NFT operations temporarily disabled until NFTMinter is implemented
     
     # Token Operations
+    @_invalidates_balance
     def create_token(
         self,
         name: str,
@@ -254,6 +368,7 @@ class ErgoClient:
             recipient=recipient
         )
     
+    @_invalidates_balance
     def send_tokens(
         self,
         token_id: str,
@@ -283,13 +398,20 @@ class ErgoClient:
         """
         return self.token_manager.send_tokens(token_id, recipient, amount, fee_erg)
     
-    def distribute_tokens(self, config_file: Union[str, Path]) -> str:
+    @_invalidates_balance
+    def distribute_tokens(
+        self,
+        config_file: Union[str, Path, Dict[str, Any]],
+        validate: bool = True
+    ) -> str:
         """
         Distribute tokens to multiple addresses from a configuration file.
         All recipients are processed in a single transaction.
         
         Args:
-            config_file: Path to YAML configuration file
+            config_file: Path to YAML configuration file or already-parsed config dict
+            validate: Pre-validate recipient addresses (skip if the config was
+                just checked with validate_distribution_config)
             
         Returns:
             Transaction ID (single transaction for all recipients)
@@ -297,15 +419,19 @@ class ErgoClient:
         Examples:
             >>> tx_id = client.distribute_tokens("distribution.yaml")
             >>> print(f"Distribution completed in transaction: {tx_id}")
+            
+            >>> config = load_yaml_cached("distribution.yaml")
+            >>> if client.validate_distribution_config(config)["valid"]:
+            ...     tx_id = client.distribute_tokens(config, validate=False)
         """
-        return self.token_manager.distribute_tokens_from_config(config_file)
+        return self.token_manager.distribute_tokens_from_config(self._normpath(config_file), validate)
     
-    def validate_distribution_config(self, config_file: Union[str, Path]) -> Dict[str, Any]:
+    def validate_distribution_config(self, config_file: Union[str, Path, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Validate a token distribution configuration file.
         
         Args:
-            config_file: Path to YAML configuration file
+            config_file: Path to YAML configuration file or already-parsed config dict
             
         Returns:
             Validation result with summary
@@ -317,10 +443,11 @@ class ErgoClient:
             ... else:
             ...     print(f"Errors: {result['errors']}")
         """
-        return self.token_manager.validate_distribution_config(config_file)
+        return self.token_manager.validate_distribution_config(self._normpath(config_file))
     
     # Collection Operations
     
+    @_invalidates_balance
     def create_collection_token(
         self,
         name: str,
@@ -354,12 +481,13 @@ class ErgoClient:
             name, description, supply, royalties, additional_metadata
         )
     
-    def create_collection_from_config(self, config_file: Union[str, Path]) -> str:
+    @_invalidates_balance
+    def create_collection_from_config(self, config_file: Union[str, Path, Dict[str, Any]]) -> str:
         """
         Create a collection token from a YAML configuration file.
         
         Args:
-            config_file: Path to YAML configuration file
+            config_file: Path to YAML configuration file or parsed config dict
             
         Returns:
             Transaction ID
@@ -367,22 +495,23 @@ class ErgoClient:
         Examples:
             >>> collection_id = client.create_collection_from_config("collection.yaml")
         """
-        return self.collection_manager.create_collection_from_config(config_file)
+        return self.collection_manager.create_collection_from_config(self._normpath(config_file))
     
-    def validate_collection_config(self, config_file: Union[str, Path]) -> Dict[str, Any]:
+    def validate_collection_config(self, config_file: Union[str, Path, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Validate a collection configuration file.
         
         Args:
-            config_file: Path to YAML configuration file
+            config_file: Path to YAML configuration file or parsed config dict
             
         Returns:
             Validation result with summary
         """
-        return self.collection_manager.validate_collection_config(config_file)
+        return self.collection_manager.validate_collection_config(self._normpath(config_file))
     
     # NFT Operations
     
+    @_invalidates_balance
     def mint_nft(
         self,
         name: str,
@@ -425,33 +554,40 @@ class ErgoClient:
             royalties, traits, additional_metadata
         )
     
-    def mint_nft_collection(self, collection_config: Union[str, Path, Dict[str, Any]]) -> List[str]:
+    @_invalidates_balance
+    def mint_nft_collection(
+        self,
+        collection_config: Union[str, Path, Dict[str, Any]],
+        max_in_flight: Optional[int] = None
+    ) -> List[str]:
         """
-        Mint an entire NFT collection sequentially.
+        Mint an entire NFT collection, several NFTs at a time.
         
         Args:
             collection_config: Path to YAML config file or config dict
+            max_in_flight: NFTs minted concurrently (default
+                NFTMinter.MAX_MINT_WORKERS); 1 mints them one after another
             
         Returns:
-            List of transaction IDs (one per NFT)
+            List of transaction IDs for the minted NFTs, in config order
             
         Examples:
             >>> nft_ids = client.mint_nft_collection("nft_collection.yaml")
             >>> print(f"Minted {len(nft_ids)} NFTs")
         """
-        return self.nft_minter.mint_nft_collection(collection_config)
+        return self.nft_minter.mint_nft_collection(self._normpath(collection_config), max_in_flight)
     
-    def validate_nft_collection_config(self, config_file: Union[str, Path]) -> Dict[str, Any]:
+    def validate_nft_collection_config(self, config_file: Union[str, Path, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Validate an NFT collection configuration file.
         
         Args:
-            config_file: Path to YAML configuration file
+            config_file: Path to YAML configuration file or parsed config dict
             
         Returns:
             Validation result with summary
         """
-        return self.nft_minter.validate_nft_collection_config(config_file)
+        return self.nft_minter.validate_nft_collection_config(self._normpath(config_file))
     
     # Royalty Operations
     
@@ -476,8 +612,43 @@ class ErgoClient:
             ...     {"address": "9fCharity...", "percentage": 15, "name": "Charity"},
             ...     {"address": "9fPlatform...", "percentage": 5, "name": "Platform"}
             ... ])
-        """
-        return self.royalty_manager.create_royalty_structure(recipients, validate)
+        
+        Structures are cached by the recipients' contents, so a split shared
+        by every NFT in a collection is validated and built only once.
+        """
+        try:
+            key = (validate,) + tuple(
+                (r.get('address'), r.get('percentage'), type(r.get('percentage')),
+                 r.get('name'), r.get('description'))
+                for r in recipients
+            )
+            hash(key)
+        except (AttributeError, TypeError):
+            # Malformed or unhashable input - let the manager report it
+            return self.royalty_manager.create_royalty_structure(recipients, validate)
+        
+        structure = self._royalty_cache.get(key)
+        if structure is None:
+            structure = self.royalty_manager.create_royalty_structure(recipients, validate)
+            self._royalty_cache[key] = structure
+            if len(self._royalty_cache) > self.ROYALTY_CACHE_SIZE:
+                self._royalty_cache.popitem(last=False)
+        else:
+            self._royalty_cache.move_to_end(key)
+        
+        return self._copy_royalty_structure(structure)
+    
+    @staticmethod
+    def _copy_royalty_structure(structure: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a royalty structure; only its recipient list and entries are mutable."""
+        return {
+            **structure,
+            'recipients': [dict(recipient) for recipient in structure['recipients']]
+        }
+    
+    def clear_royalty_cache(self) -> None:
+        """Forget all royalty structures cached by create_royalty_structure()."""
+        self._royalty_cache.clear()
     
     def calculate_royalty_distribution(
         self,
@@ -509,31 +680,44 @@ class ErgoClient:
             >>> client.set_dry_run_mode(False)  # Disable dry-run
         """
         self.dry_run = dry_run
-        self.token_manager.set_dry_run_mode(dry_run)
-        self.collection_manager.set_dry_run_mode(dry_run)
-        self.nft_minter.set_dry_run_mode(dry_run)
+        # Handlers not built yet will pick up self.dry_run when created
+        for name in ("token_manager", "collection_manager", "nft_minter"):
+            handler = self.__dict__.get(name)
+            if handler is not None:
+                handler.set_dry_run_mode(dry_run)
         self.logger.info(f"Dry-run mode {'enabled' if dry_run else 'disabled'}")
     
     def get_dry_run_mode(self) -> bool:
         """Check if in dry-run mode."""
         return self.dry_run
     
+    @_invalidates_balance
     def airdrop_tokens(
         self,
         token_id: str,
-        addresses: List[str],
-        amounts: List[int]
-    ) -> List[str]:
+        addresses: Iterable[Union[str, Tuple[str, int]]],
+        amounts: Optional[Iterable[int]] = None,
+        fee_erg: float = 0.001,
+        batch_size: Optional[int] = None
+    ) -> List[Optional[str]]:
         """
         Airdrop tokens to multiple addresses.
         
+        Recipients are grouped into batched transactions that are submitted
+        concurrently. Large recipient lists can be streamed by passing an
+        iterable of ``(address, amount)`` pairs and omitting ``amounts``.
+        
         Args:
             token_id: Token ID to airdrop
-            addresses: List of recipient addresses
+            addresses: List of recipient addresses, or ``(address, amount)``
+                pairs when ``amounts`` is omitted
             amounts: List of amounts corresponding to each address
+            fee_erg: Transaction fee per batch in ERG
+            batch_size: Recipients per transaction (default 100)
             
         Returns:
-            List of transaction IDs
+            List of transaction IDs, one per batch; None for a batch that
+            failed (failures are logged and do not stop the other batches)
             
         Examples:
             >>> tx_ids = client.airdrop_tokens(
@@ -542,8 +726,18 @@ class ErgoClient:
             ...     amounts=[10, 20, 30]
             ... )
             >>> print(f"Airdropped to {len(addresses)} addresses")
+            
+            >>> # Stream recipients without building lists
+            >>> pairs = ((row["address"], row["amount"]) for row in rows)
+            >>> tx_ids = client.airdrop_tokens("abc123...", pairs)
+            
+            >>> # Stream recipients straight from a large YAML config
+            >>> pairs = client.token_manager.stream_recipients("airdrop.yaml")
+            >>> tx_ids = client.airdrop_tokens("abc123...", pairs)
         """
-        return self.token_manager.airdrop_tokens(token_id, addresses, amounts)
+        return self.token_manager.airdrop_tokens(
+            token_id, addresses, amounts, fee_erg, batch_size
+        )
     
     # TODO: Implement smart contract and batch operations
     # Smart contract and batch operations temporarily disabled
@@ -560,8 +754,19 @@ class ErgoClient:
             >>> info = client.get_network_info()
             >>> print(f"Network: {info['network']}")
             >>> print(f"Block height: {info['height']}")
-        """
-        return self.network_manager.get_network_info()
+        
+        Results are reused for NETWORK_INFO_TTL_SECONDS, so back-to-back
+        calls within one command make a single node request.
+        """
+        now = time.monotonic()
+        if self._network_info_cache is not None:
+            fetched_at, info = self._network_info_cache
+            if now - fetched_at < self.NETWORK_INFO_TTL_SECONDS:
+                return dict(info)
+        
+        info = self.network_manager.get_network_info()
+        self._network_info_cache = (now, info)
+        return dict(info)
     
     def get_transaction_status(self, tx_id: str) -> Dict[str, Any]:
         """
@@ -600,7 +805,41 @@ class ErgoClient:
         """
         return self.network_manager.wait_for_confirmation(tx_id, timeout_seconds)
     
+    def wait_for_confirmations(
+        self,
+        tx_ids: List[Optional[str]],
+        timeout_seconds: int = 300
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait for many transactions at once, e.g. every airdrop batch.
+        
+        All pending transactions are polled together in one loop, so the
+        wait is as long as the slowest transaction rather than the sum.
+        
+        Args:
+            tx_ids: Transaction IDs to wait for; None entries (failed
+                airdrop batches) are skipped
+            timeout_seconds: Maximum total time to wait
+            
+        Returns:
+            Dictionary mapping each transaction ID to its final status
+            
+        Examples:
+            >>> tx_ids = client.airdrop_tokens("abc123...", addresses, amounts)
+            >>> failed = [n for n, tx in enumerate(tx_ids, 1) if tx is None]
+            >>> statuses = client.wait_for_confirmations(tx_ids)  # None entries are skipped
+            >>> unconfirmed = [tx for tx, s in statuses.items() if s['status'] != 'confirmed']
+        """
+        return self.network_manager.wait_for_confirmations(tx_ids, timeout_seconds)
+    
     # Helper Methods
+    @staticmethod
+    def _normpath(config: Union[str, "os.PathLike[str]", Dict[str, Any]]) -> Union[str, Dict[str, Any]]:
+        """Turn any path-like config argument into a plain str; parsed configs pass through."""
+        if isinstance(config, os.PathLike):
+            return os.fspath(config)
+        return config
+    
     def erg_to_nanoerg(self, erg_amount: float) -> int:
         """Convert ERG to nanoERG."""
         return AmountUtils.erg_to_nanoerg(erg_amount)
@@ -613,6 +852,32 @@ class ErgoClient:
         """Validate an Ergo address."""
         return self.network_manager.validate_address(address)
     
+    def validate_addresses(self, addresses: List[str]) -> List[bool]:
+        """
+        Validate many Ergo addresses in one call.
+        
+        Args:
+            addresses: Addresses to validate
+            
+        Returns:
+            List of booleans, one per input address
+            
+        Examples:
+            >>> client.validate_addresses(["9f...", "invalid_address"])
+            [True, False]
+        """
+        return self.network_manager.validate_addresses(addresses)
+    
+    def close(self) -> None:
+        """Close the client's pooled node connections."""
+        self.network_manager.close()
+    
+    def __enter__(self) -> "ErgoClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def __str__(self) -> str:
         """String representation of the client."""
         return f"ErgoClient(network={self.network_manager.network})"
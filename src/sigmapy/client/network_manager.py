@@ -8,11 +8,259 @@ This class handles network-related operations including:
 - Status monitoring
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple, TypeVar
+import codecs
+import copy
+import functools
+import json
 import logging
+import random
+import re
+import threading
 import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from types import MappingProxyType
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urljoin
+from urllib3.util.retry import Retry
+
+from ..config._yaml_cache import json_dumps, json_loads
+from ..utils.address_utils import AddressUtils
+
+
+logger = logging.getLogger(__name__)
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_MAINNET_NODES: Tuple[str, ...] = (
+    "https://api.ergoplatform.com",
+    "https://ergo-node.anetapps.com",
+    "https://api.ergopad.io"
+)
+_TESTNET_NODES: Tuple[str, ...] = (
+    "https://api-testnet.ergoplatform.com",
+    "https://testnet-node.anetapps.com"
+)
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = " \t\r\n"
+# Characters that matter when finding where an array item ends
+_JSON_STRUCTURE = re.compile(r'[\[\]{}",]')
+_JSON_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+def _iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Decode the items of a top-level JSON array from a stream of byte chunks.
+    
+    Each item is yielded as soon as it has been received, so a large
+    response is never held as one parsed list (or one string). Item
+    boundaries are found by a bracket/string scanner whose state carries
+    over between chunks, so every byte is scanned once however large an
+    item is; each complete item is then decoded once.
+    
+    Raises:
+        ValueError: If the stream is not a well-formed JSON array
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    pos = 0
+    exhausted = False
+    
+    def read_more() -> bool:
+        """Replace the buffer with the next chunk of text."""
+        nonlocal buffer, pos, exhausted
+        if exhausted:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            buffer = decoder.decode(b"", final=True)
+        else:
+            buffer = decoder.decode(chunk)
+        pos = 0
+        return True
+    
+    def next_char() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _JSON_WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not read_more():
+                raise ValueError("Truncated JSON array")
+    
+    def read_item() -> Any:
+        """Decode the item starting at pos, leaving pos just past it."""
+        nonlocal pos
+        parts = []
+        start = scan = pos
+        depth = 0
+        in_string = escaped = False
+        
+        while True:
+            end = None
+            if escaped:
+                # The escaped character opened this chunk
+                if scan < len(buffer):
+                    scan += 1
+                    escaped = False
+                    continue
+            elif in_string:
+                match = _JSON_STRING_SPECIAL.search(buffer, scan)
+                if match is None:
+                    scan = len(buffer)
+                elif match.group() == "\\":
+                    scan = match.end()
+                    escaped = True
+                    continue
+                else:
+                    in_string = False
+                    scan = match.end()
+                    if depth == 0:
+                        end = scan
+            else:
+                match = _JSON_STRUCTURE.search(buffer, scan)
+                if match is None:
+                    scan = len(buffer)
+                else:
+                    char = match.group()
+                    scan = match.end()
+                    if char == '"':
+                        in_string = True
+                    elif char in "[{":
+                        depth += 1
+                    elif depth == 0:
+                        # A bare number/literal ends at the array's , or ]
+                        end = match.start()
+                    elif char != ",":
+                        depth -= 1
+                        if depth == 0:
+                            end = scan
+            
+            if end is not None:
+                parts.append(buffer[start:end])
+                pos = end
+                return _JSON_DECODER.decode("".join(parts))
+            if scan < len(buffer):
+                continue
+            
+            # Item continues in the next chunk; keep what we have of it
+            parts.append(buffer[start:])
+            if not read_more():
+                raise ValueError("Truncated JSON array")
+            start = scan = 0
+    
+    if next_char() != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+    
+    if next_char() == "]":
+        return
+    
+    while True:
+        next_char()
+        yield read_item()
+        
+        separator = next_char()
+        pos += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Unexpected {separator!r} in JSON array")
+
+
+def _coalesced(method: _F) -> _F:
+    """
+    Share one in-flight node lookup among concurrent identical calls.
+    
+    The first caller for a given method and arguments does the request;
+    callers arriving while it is running wait for it and receive a shallow
+    copy of its result (or its exception) instead of sending their own.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        key = (method.__name__,) + args
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        
+        if not leader:
+            return copy.copy(future.result())
+        
+        try:
+            result = method(self, *args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    return wrapper  # type: ignore[return-value]
+
+
+def _close_sessions(*sessions: requests.Session) -> None:
+    """Close sessions and the pooled connections they hold."""
+    for session in sessions:
+        session.close()
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised instead of contacting a node that keeps failing."""
+
+
+class _CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one node.
+    
+    Closed: requests flow. After ``threshold`` consecutive failures the
+    circuit opens and requests are refused for ``cooldown`` seconds. Then a
+    single trial request is let through (half-open): success closes the
+    circuit, failure reopens it for another cooldown.
+    """
+    
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.state = "closed"
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """Return True if a request may be sent now."""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = "half_open"
+                return True
+            return False
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.state = "closed"
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+    
+    def reset(self) -> None:
+        self.record_success()
 
 
 class NetworkManager:
@@ -21,18 +269,63 @@ class NetworkManager:
     interacting with Ergo nodes and the blockchain network.
     """
     
-    # Default public nodes
-    DEFAULT_NODES = {
-        "mainnet": [
-            "https://api.ergoplatform.com",
-            "https://ergo-node.anetapps.com",
-            "https://api.ergopad.io"
-        ],
-        "testnet": [
-            "https://api-testnet.ergoplatform.com",
-            "https://testnet-node.anetapps.com"
-        ]
-    }
+    # Default public nodes (read-only; shared by every instance)
+    DEFAULT_NODES = MappingProxyType({
+        "mainnet": _MAINNET_NODES,
+        "testnet": _TESTNET_NODES
+    })
+    
+    # Connection pooling for the shared session: keep-alive connections are
+    # reused across calls (and by concurrent airdrop broadcasts)
+    HTTP_POOL_CONNECTIONS = 10
+    HTTP_POOL_MAXSIZE = 50
+    
+    # Idempotent requests are retried on dropped connections and transient
+    # node responses. Unreachable nodes fail fast (the fallback nodes cover
+    # that) and broadcasts (POST) are never retried automatically
+    HTTP_MAX_RETRIES = 3
+    HTTP_RETRY_BACKOFF = 0.25
+    HTTP_RETRY_STATUSES = (429, 502, 503, 504)
+    
+    # Bulkhead for heavy endpoints (full UTXO lists): they get their own
+    # smaller connection pool and a cap on concurrent requests, so a burst of
+    # large downloads cannot starve light polls such as /info or tx status
+    HEAVY_POOL_MAXSIZE = 8
+    HEAVY_MAX_CONCURRENCY = 4
+    
+    # Confirmation polling backs off exponentially from the base interval up
+    # to the ceiling; wait_for_confirmations() polls this many ids at once
+    CONFIRMATION_BASE_POLL_INTERVAL = 2
+    CONFIRMATION_MAX_POLL_INTERVAL = 30
+    CONFIRMATION_POLL_WORKERS = 16
+    
+    # Requests in flight for the multi-address lookups
+    ADDRESS_FETCH_WORKERS = 16
+    
+    # Read-only lookups against a public node are hedged: if the node has not
+    # answered within this delay, the same GET goes to the next public node
+    # and the first response wins
+    HEDGE_DELAY_SECONDS = 0.3
+    
+    # Stop contacting a node after this many consecutive failed requests
+    # (connection errors, timeouts, 5xx) and refuse calls for the cooldown,
+    # so an outage costs microseconds per call instead of a full timeout
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_COOLDOWN_SECONDS = 30
+    
+    # When using the public nodes, each request goes to the faster of two
+    # randomly picked healthy nodes, ranked by an EWMA of their response
+    # times. A node that times out or returns 5xx sits out for the cooldown
+    NODE_LATENCY_SMOOTHING = 0.2
+    NODE_COOLDOWN_SECONDS = 30
+    
+    # TTL caches for node lookups repeated while building transactions.
+    # Token metadata never changes once minted; an address's UTXO set only
+    # changes per block (~2 min) or when we broadcast, which clears it
+    TOKEN_INFO_TTL_SECONDS = 3600
+    TOKEN_INFO_CACHE_SIZE = 2048
+    UTXO_TTL_SECONDS = 60
+    UTXO_CACHE_SIZE = 1024
     
     def __init__(
         self,
@@ -50,7 +343,7 @@ class NetworkManager:
             api_key: API key for node access
             timeout: Request timeout in seconds
         """
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.network = network
         self.api_key = api_key
         self.timeout = timeout
@@ -61,14 +354,62 @@ class NetworkManager:
         else:
             self.node_url = self.DEFAULT_NODES[network][0]
         
-        # Initialize session
-        self.session = requests.Session()
-        if api_key:
-            self.session.headers.update({"X-API-Key": api_key})
+        # Initialize sessions: one for light calls, one for heavy downloads
+        self.session = self._build_session(self.HTTP_POOL_MAXSIZE)
+        self._heavy_session = self._build_session(self.HEAVY_POOL_MAXSIZE)
+        self._heavy_slots = threading.BoundedSemaphore(self.HEAVY_MAX_CONCURRENCY)
+        # Closes the sessions if the manager is garbage collected or the
+        # interpreter exits without close() having been called. Unlike
+        # atexit.register(self.close) it does not keep the manager alive
+        self._finalizer = weakref.finalize(
+            self, _close_sessions, self.session, self._heavy_session
+        )
+        
+        # node url -> circuit breaker / latency stats; see _request and _choose_node
+        self._breakers: Dict[str, _CircuitBreaker] = {}
+        self._node_stats: Dict[str, Dict[str, float]] = {
+            node: {"ewma_ms": float("inf"), "failures": 0, "cooldown_until": 0.0}
+            for node in self.DEFAULT_NODES.get(network, ())
+        }
+        self._node_lock = threading.Lock()
+        
+        # (method, args) -> Future of the lookup currently running; see _coalesced
+        self._inflight: Dict[Tuple[Any, ...], Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Created on the first hedged request; shut down by close()
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_lock = threading.Lock()
+        
+        # key -> (fetched_at, value), in LRU order; shared by worker threads
+        self._token_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._utxo_cache: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         
         # Test connection
         self._test_connection()
     
+    def _build_session(self, pool_maxsize: int) -> requests.Session:
+        """Create a keep-alive session with its own connection pool and GET retries."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=self.HTTP_MAX_RETRIES,
+                connect=0,
+                backoff_factor=self.HTTP_RETRY_BACKOFF,
+                status_forcelist=self.HTTP_RETRY_STATUSES,
+                allowed_methods=frozenset({"GET"}),
+                raise_on_status=False
+            )
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if self.api_key:
+            session.headers.update({"X-API-Key": self.api_key})
+        return session
+    
     def _test_connection(self) -> None:
         """Test connection to the node."""
         try:
@@ -87,6 +428,7 @@ class NetworkManager:
         for node_url in fallback_nodes:
             try:
                 self.node_url = node_url
+                self._breaker_for(node_url).reset()
                 info = self.get_network_info()
                 self.logger.info(f"Connected to fallback node: {node_url}")
                 return
@@ -96,24 +438,240 @@ class NetworkManager:
         
         self.logger.error("All nodes failed. Network operations may not work.")
     
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _origin(node_url: str) -> str:
+        """
+        Return the URL prefix that absolute request paths are appended to.
+        
+        Every request path is absolute, so only the origin is ever used;
+        caching it avoids running urljoin on each request.
+        """
+        return urljoin(node_url, "/")[:-1]
+    
+    def _breaker_for(self, node_url: str) -> _CircuitBreaker:
+        """Return the circuit breaker guarding one node, creating it on first use."""
+        with self._node_lock:
+            breaker = self._breakers.get(node_url)
+            if breaker is None:
+                breaker = self._breakers[node_url] = _CircuitBreaker(
+                    self.CIRCUIT_FAILURE_THRESHOLD, self.CIRCUIT_COOLDOWN_SECONDS
+                )
+            return breaker
+    
+    def _healthy_nodes(self) -> List[str]:
+        """Public nodes of this network that are not cooling down."""
+        now = time.monotonic()
+        with self._node_lock:
+            return [
+                node for node, stats in self._node_stats.items()
+                if stats["cooldown_until"] <= now
+            ]
+    
+    def _latency(self, node_url: str) -> float:
+        """Smoothed latency of a node; unmeasured nodes rank first so they get probed."""
+        ewma_ms = self._node_stats[node_url]["ewma_ms"]
+        return 0.0 if ewma_ms == float("inf") else ewma_ms
+    
+    def _choose_node(self) -> str:
+        """
+        Pick the node for the next idempotent GET.
+        
+        Custom nodes are always used as-is. With the public nodes, two
+        healthy nodes are sampled at random and the one with the lower
+        smoothed latency wins (power of two choices), so traffic follows the
+        fastest nodes without every client piling onto the same one. If every
+        public node is cooling down, the configured node is used.
+        """
+        if self.node_url not in self._node_stats:
+            return self.node_url
+        healthy = self._healthy_nodes()
+        if not healthy:
+            return self.node_url
+        if len(healthy) == 1:
+            return healthy[0]
+        first, second = random.sample(healthy, 2)
+        return first if self._latency(first) <= self._latency(second) else second
+    
+    def _record_node_result(self, node_url: str, elapsed_ms: Optional[float]) -> None:
+        """Fold a request outcome into a public node's stats (None means it failed)."""
+        stats = self._node_stats.get(node_url)
+        if stats is None:
+            return
+        with self._node_lock:
+            if elapsed_ms is None:
+                stats["failures"] += 1
+                stats["cooldown_until"] = time.monotonic() + self.NODE_COOLDOWN_SECONDS
+            elif stats["ewma_ms"] == float("inf"):
+                stats["failures"] = 0
+                stats["ewma_ms"] = elapsed_ms
+            else:
+                stats["failures"] = 0
+                alpha = self.NODE_LATENCY_SMOOTHING
+                stats["ewma_ms"] = (1 - alpha) * stats["ewma_ms"] + alpha * elapsed_ms
+    
+    def node_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the per-node latency and health statistics.
+        
+        Returns:
+            Dictionary of public node URL to its smoothed latency in
+            milliseconds, consecutive failures and cooldown deadline
+        """
+        with self._node_lock:
+            return {node: dict(stats) for node, stats in self._node_stats.items()}
+    
+    def _request(
+        self,
+        method: str,
+        path: str,
+        heavy: bool = False,
+        node_url: Optional[str] = None,
+        **kwargs
+    ) -> requests.Response:
+        """
+        Send a request through the target node's circuit breaker.
+        
+        GETs default to _choose_node(); anything else goes to the configured
+        node. The node that served the request is recorded as
+        ``response.node_url``. Heavy requests use the separate heavy-endpoint
+        session; callers hold a _heavy_slots permit around them.
+        
+        Raises:
+            CircuitOpenError: If the node has been failing and is cooling down
+            requests.RequestException: If the request itself fails
+        """
+        if node_url is None:
+            node_url = self._choose_node() if method == "GET" else self.node_url
+        breaker = self._breaker_for(node_url)
+        if not breaker.allow():
+            raise CircuitOpenError(
+                f"Node {node_url} is unavailable after "
+                f"{breaker.failures} consecutive failures; "
+                f"retrying after {self.CIRCUIT_COOLDOWN_SECONDS}s"
+            )
+        
+        session = self._heavy_session if heavy else self.session
+        started = time.monotonic()
+        try:
+            response = session.request(
+                method, self._origin(node_url) + path, timeout=self.timeout, **kwargs
+            )
+        except requests.RequestException:
+            breaker.record_failure()
+            self._record_node_result(node_url, None)
+            raise
+        
+        if response.status_code >= 500:
+            breaker.record_failure()
+            self._record_node_result(node_url, None)
+        else:
+            breaker.record_success()
+            self._record_node_result(node_url, (time.monotonic() - started) * 1000)
+        response.node_url = node_url
+        return response
+    
+    def _hedged_get(self, path: str) -> requests.Response:
+        """
+        GET an idempotent path, hedging a slow public node with a second one.
+        
+        The request goes to the node picked by _choose_node() first. If it
+        has not completed within HEDGE_DELAY_SECONDS, it is repeated against
+        the fastest other healthy public node and whichever responds first
+        is returned; the loser's response is closed when it arrives. Custom
+        nodes are never hedged, since the public nodes may not hold the same
+        data.
+        """
+        node_url = self._choose_node()
+        hedge_nodes = [node for node in self._healthy_nodes() if node != node_url]
+        if node_url not in self._node_stats or not hedge_nodes:
+            return self._request("GET", path, node_url=node_url)
+        
+        executor = self._get_hedge_executor()
+        primary = executor.submit(self._request, "GET", path, node_url=node_url)
+        done, _ = wait([primary], timeout=self.HEDGE_DELAY_SECONDS)
+        if done:
+            return primary.result()
+        
+        hedge = executor.submit(
+            self._request, "GET", path, node_url=min(hedge_nodes, key=self._latency)
+        )
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.add_done_callback(self._close_response)
+                    return future.result()
+        
+        # Both failed; report the first node's error
+        return primary.result()
+    
+    @staticmethod
+    def _close_response(future) -> None:
+        """Release the connection of a hedged request nobody is waiting for."""
+        if future.exception() is None:
+            future.result().close()
+    
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=self.ADDRESS_FETCH_WORKERS,
+                    thread_name_prefix="sigmapy-hedge"
+                )
+            return self._hedge_executor
+    
+    def _cache_get(self, cache: OrderedDict, key: str, ttl: float) -> Optional[Any]:
+        """Return a cached value younger than ttl seconds, or None."""
+        with self._cache_lock:
+            cached = cache.get(key)
+            if cached is None:
+                return None
+            if time.monotonic() - cached[0] >= ttl:
+                del cache[key]
+                return None
+            cache.move_to_end(key)
+            return cached[1]
+    
+    def _cache_put(self, cache: OrderedDict, key: str, value: Any, max_entries: int) -> None:
+        """Store a value with the current time, evicting the least recently used."""
+        with self._cache_lock:
+            cache[key] = (time.monotonic(), value)
+            cache.move_to_end(key)
+            while len(cache) > max_entries:
+                cache.popitem(last=False)
+    
+    def invalidate_utxo_cache(self, address: Optional[str] = None) -> None:
+        """
+        Forget cached UTXOs for one address, or for every address.
+        
+        Called automatically after each broadcast; call it yourself when
+        boxes are spent or received by other means.
+        """
+        with self._cache_lock:
+            if address is None:
+                self._utxo_cache.clear()
+            else:
+                self._utxo_cache.pop(address, None)
+    
     def get_network_info(self) -> Dict[str, Any]:
         """
         Get network information.
         
         Returns:
-            Dictionary containing network details
+            Dictionary containing network details; ``node_url`` is the node
+            that answered
         """
         try:
-            response = self.session.get(
-                urljoin(self.node_url, "/info"),
-                timeout=self.timeout
-            )
+            response = self._hedged_get("/info")
             response.raise_for_status()
             
-            info = response.json()
+            info = json_loads(response.content)
             return {
                 "network": self.network,
-                "node_url": self.node_url,
+                "node_url": response.node_url,
                 "height": info.get("fullHeight", 0),
                 "version": info.get("appVersion", "unknown"),
                 "peers": info.get("peersCount", 0),
@@ -140,13 +698,10 @@ class NetworkManager:
             Current block height
         """
         try:
-            response = self.session.get(
-                urljoin(self.node_url, "/blocks/lastHeaders/1"),
-                timeout=self.timeout
-            )
+            response = self._hedged_get("/blocks/lastHeaders/1")
             response.raise_for_status()
             
-            blocks = response.json()
+            blocks = json_loads(response.content)
             if blocks:
                 return blocks[0].get("height", 0)
             
@@ -155,6 +710,7 @@ class NetworkManager:
         
         return 0
     
+    @_coalesced
     def get_address_balance(self, address: str) -> Dict[str, Any]:
         """
         Get balance for an address.
@@ -166,13 +722,10 @@ class NetworkManager:
             Dictionary containing balance information
         """
         try:
-            response = self.session.get(
-                urljoin(self.node_url, f"/blockchain/balance/{address}"),
-                timeout=self.timeout
-            )
+            response = self._hedged_get(f"/blockchain/balance/{address}")
             response.raise_for_status()
             
-            balance_data = response.json()
+            balance_data = json_loads(response.content)
             return {
                 "address": address,
                 "nanoerg": balance_data.get("nanoErgs", 0),
@@ -187,30 +740,103 @@ class NetworkManager:
                 "tokens": []
             }
     
+    @_coalesced
     def get_address_utxos(self, address: str) -> List[Dict[str, Any]]:
         """
         Get UTXOs for an address.
         
+        Results are cached for UTXO_TTL_SECONDS; any broadcast through this
+        manager clears the cache.
+        
         Args:
             address: Address to check
             
         Returns:
             List of UTXO dictionaries
         """
+        cached = self._cache_get(self._utxo_cache, address, self.UTXO_TTL_SECONDS)
+        if cached is not None:
+            return list(cached)
+        
         try:
-            response = self.session.get(
-                urljoin(self.node_url, f"/blockchain/box/unspent/byAddress/{address}"),
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            utxos = response.json()
-            return [self._format_utxo(utxo) for utxo in utxos]
+            with self._heavy_slots:
+                response = self._request(
+                    "GET", f"/blockchain/box/unspent/byAddress/{address}", heavy=True
+                )
+                response.raise_for_status()
+                
+                utxos = [self._format_utxo(utxo) for utxo in json_loads(response.content)]
+            self._cache_put(self._utxo_cache, address, utxos, self.UTXO_CACHE_SIZE)
+            return list(utxos)
             
         except Exception as e:
             self.logger.error(f"Failed to get UTXOs for {address}: {e}")
             return []
     
+    def iter_address_utxos(self, address: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the UTXOs of an address as they arrive from the node.
+        
+        Unlike get_address_utxos, the response is decoded item by item and
+        never held in memory as a whole, which suits addresses with many
+        thousands of boxes. Results are not cached.
+        
+        Args:
+            address: Address to check
+            
+        Yields:
+            UTXO dictionaries, in node order
+            
+        Raises:
+            requests.RequestException: If the node request fails
+            ValueError: If the response is not a JSON array
+        """
+        with self._heavy_slots:
+            response = self._request(
+                "GET", f"/blockchain/box/unspent/byAddress/{address}",
+                heavy=True, stream=True
+            )
+            with response:
+                response.raise_for_status()
+                for utxo in _iter_json_array(response.iter_content(chunk_size=65536)):
+                    yield self._format_utxo(utxo)
+    
+    def get_address_balances(self, addresses: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get balances for many addresses concurrently.
+        
+        Args:
+            addresses: Addresses to check
+            
+        Returns:
+            Balance dictionaries (as get_address_balance), in input order
+        """
+        return self._map_addresses(self.get_address_balance, addresses)
+    
+    def get_address_utxos_batch(self, addresses: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get UTXOs for many addresses concurrently.
+        
+        Args:
+            addresses: Addresses to check
+            
+        Returns:
+            Dictionary mapping each address to its UTXO list
+        """
+        addresses = list(dict.fromkeys(addresses))
+        return dict(zip(addresses, self._map_addresses(self.get_address_utxos, addresses)))
+    
+    def _map_addresses(self, fetch, addresses: List[str]) -> List[Any]:
+        """Run a per-address lookup over the pooled session on a bounded thread pool."""
+        addresses = list(addresses)
+        if len(addresses) <= 1:
+            return [fetch(address) for address in addresses]
+        
+        with ThreadPoolExecutor(
+            max_workers=min(len(addresses), self.ADDRESS_FETCH_WORKERS)
+        ) as executor:
+            return list(executor.map(fetch, addresses))
+    
     def broadcast_transaction(self, signed_tx: Any) -> str:
         """
         Broadcast a signed transaction to the network.
@@ -220,7 +846,18 @@ class NetworkManager:
             
         Returns:
             Transaction ID
+            
+        Raises:
+            requests.RequestException: If the node did not accept the
+                transaction (demo-mode transactions get a demo ID instead)
+        
+        The POST is sent exactly once (retries only ever apply to GETs). If
+        it times out or the connection drops after sending, the node may
+        still have accepted the transaction, so a transaction with a known
+        ID is looked up in the mempool and in the chain before the broadcast
+        is reported as failed; resubmit only after checking yourself.
         """
+        tx_json = None
         try:
             # Convert transaction to JSON format
             if hasattr(signed_tx, 'to_json'):
@@ -228,20 +865,50 @@ class NetworkManager:
             else:
                 tx_json = signed_tx
             
-            response = self.session.post(
-                urljoin(self.node_url, "/transactions"),
-                json=tx_json,
-                timeout=self.timeout
+            response = self._request(
+                "POST", "/transactions",
+                data=json_dumps(tx_json),
+                headers={"Content-Type": "application/json"}
             )
             response.raise_for_status()
             
-            return response.json().get("id", "")
+            # Spent inputs and new change boxes make cached UTXO sets stale
+            self.invalidate_utxo_cache()
+            return json_loads(response.content).get("id", "")
             
         except Exception as e:
+            tx_id = tx_json.get("id") if isinstance(tx_json, dict) else None
+            if (
+                tx_id
+                and isinstance(e, (requests.Timeout, requests.ConnectionError))
+                and not isinstance(e, CircuitOpenError)
+                and self._transaction_known(tx_id)
+            ):
+                self.logger.warning(f"Broadcast of {tx_id} failed ({e}) but the node has the transaction")
+                self.invalidate_utxo_cache()
+                return tx_id
+            
             self.logger.error(f"Failed to broadcast transaction: {e}")
-            # Return demo transaction ID
-            return f"demo_broadcast_{int(time.time())}"
+            if isinstance(tx_json, dict) and tx_json.get("demo_mode"):
+                # Demo transactions were never meant to reach a node
+                return f"demo_broadcast_{int(time.time())}"
+            raise
     
+    def _transaction_known(self, tx_id: str) -> bool:
+        """Return True if the configured node holds tx_id in its mempool or in a block."""
+        try:
+            response = self._request(
+                "GET", f"/transactions/unconfirmed/byTransactionId/{tx_id}",
+                node_url=self.node_url
+            )
+            response.close()
+            if response.status_code == 200:
+                return True
+        except requests.RequestException as e:
+            self.logger.debug(f"Mempool lookup of {tx_id} failed: {e}")
+        return self.get_transaction_status(tx_id)["status"] == "confirmed"
+    
+    @_coalesced
     def get_transaction_status(self, tx_id: str) -> Dict[str, Any]:
         """
         Get transaction status.
@@ -253,13 +920,11 @@ class NetworkManager:
             Dictionary containing transaction status
         """
         try:
-            response = self.session.get(
-                urljoin(self.node_url, f"/transactions/{tx_id}"),
-                timeout=self.timeout
-            )
+            # Asked of the node the transaction was broadcast to
+            response = self._request("GET", f"/transactions/{tx_id}", node_url=self.node_url)
             
             if response.status_code == 200:
-                tx_data = response.json()
+                tx_data = json_loads(response.content)
                 return {
                     "transaction_id": tx_id,
                     "status": "confirmed",
@@ -303,24 +968,106 @@ class NetworkManager:
         Returns:
             Dictionary containing final transaction status
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout_seconds
+        attempt = 0
+        previous = None
         
-        while time.time() - start_time < timeout_seconds:
+        while True:
             status = self.get_transaction_status(tx_id)
             
             if status["status"] == "confirmed":
                 if status["confirmations"] >= min_confirmations:
                     self.logger.info(f"Transaction {tx_id} confirmed with {status['confirmations']} confirmations")
                     return status
+                if previous != "confirmed":
+                    # Just included in a block - further confirmations follow
+                    # on block cadence, so restart the backoff
+                    attempt = 0
             elif status["status"] == "not_found":
                 self.logger.warning(f"Transaction {tx_id} not found")
-                time.sleep(10)
-                continue
+            previous = status["status"]
             
-            time.sleep(10)  # Check every 10 seconds
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(self._poll_delay(attempt, remaining))
+            attempt += 1
         
         self.logger.warning(f"Transaction {tx_id} not confirmed within timeout")
-        return self.get_transaction_status(tx_id)
+        return status
+    
+    def _poll_delay(self, attempt: int, remaining: float) -> float:
+        """
+        Seconds to wait before confirmation poll number ``attempt + 1``.
+        
+        Exponential backoff with full jitter: a uniform draw below
+        ``min(cap, base * 2**attempt)``, so concurrent waiters spread out
+        instead of polling the node in lockstep. Never exceeds ``remaining``.
+        """
+        ceiling = min(
+            self.CONFIRMATION_MAX_POLL_INTERVAL,
+            self.CONFIRMATION_BASE_POLL_INTERVAL * 2 ** attempt
+        )
+        return min(random.uniform(0, ceiling), remaining)
+    
+    def wait_for_confirmations(
+        self,
+        tx_ids: List[Optional[str]],
+        timeout_seconds: int = 300,
+        min_confirmations: int = 1
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait for many transactions in one shared polling loop.
+        
+        Each round polls every still-pending transaction concurrently over the
+        pooled session, drops the confirmed ones, and backs off exponentially
+        with jitter (see _poll_delay) before the next round. The wait ends as soon as all are confirmed, so N
+        transactions take as long as the slowest one rather than the sum.
+        
+        Args:
+            tx_ids: Transaction IDs to wait for; None entries (such as failed
+                airdrop batches) are skipped
+            timeout_seconds: Maximum total time to wait
+            min_confirmations: Minimum confirmations required
+            
+        Returns:
+            Dictionary mapping each transaction ID to its final status
+        """
+        statuses: Dict[str, Dict[str, Any]] = {}
+        pending = [tx_id for tx_id in dict.fromkeys(tx_ids) if tx_id is not None]
+        if not pending:
+            return statuses
+        
+        deadline = time.monotonic() + timeout_seconds
+        attempt = 0
+        
+        with ThreadPoolExecutor(
+            max_workers=min(len(pending), self.CONFIRMATION_POLL_WORKERS)
+        ) as executor:
+            while True:
+                for tx_id, status in zip(pending, executor.map(self.get_transaction_status, pending)):
+                    statuses[tx_id] = status
+                
+                pending = [
+                    tx_id for tx_id in pending
+                    if statuses[tx_id]["status"] != "confirmed"
+                    or statuses[tx_id]["confirmations"] < min_confirmations
+                ]
+                if not pending:
+                    self.logger.info(f"All {len(statuses)} transactions confirmed")
+                    return statuses
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                
+                time.sleep(self._poll_delay(attempt, remaining))
+                attempt += 1
+        
+        self.logger.warning(
+            f"{len(pending)} of {len(statuses)} transactions not confirmed within timeout"
+        )
+        return statuses
     
     def get_mempool_size(self) -> int:
         """
@@ -330,13 +1077,10 @@ class NetworkManager:
             Number of transactions in mempool
         """
         try:
-            response = self.session.get(
-                urljoin(self.node_url, "/transactions/unconfirmed/size"),
-                timeout=self.timeout
-            )
+            response = self._hedged_get("/transactions/unconfirmed/size")
             response.raise_for_status()
             
-            return response.json().get("size", 0)
+            return json_loads(response.content).get("size", 0)
             
         except Exception as e:
             self.logger.error(f"Failed to get mempool size: {e}")
@@ -352,42 +1096,48 @@ class NetworkManager:
         Returns:
             True if valid, False otherwise
         """
-        try:
-            # Basic validation - check address format
-            if not address or len(address) < 40:
-                return False
-            
-            # Check if address starts with correct network prefix
-            if self.network == "mainnet" and not address.startswith("9"):
-                return False
-            elif self.network == "testnet" and not address.startswith("3"):
-                return False
-            
-            # Try to get balance (this will fail for invalid addresses)
-            self.get_address_balance(address)
-            return True
+        return self.validate_addresses([address])[0]
+    
+    def validate_addresses(self, addresses: List[str]) -> List[bool]:
+        """
+        Validate a batch of Ergo addresses for this network.
+        
+        All addresses are decoded and checksum-verified locally in one pass,
+        without a node round-trip per address.
+        
+        Args:
+            addresses: Addresses to validate
             
-        except Exception:
-            return False
+        Returns:
+            List of booleans, one per input address
+        """
+        return AddressUtils.validate_addresses(addresses, self.network)
     
+    @_coalesced
     def get_token_info(self, token_id: str) -> Dict[str, Any]:
         """
         Get token information.
         
+        Token metadata is immutable, so successful lookups are cached for
+        TOKEN_INFO_TTL_SECONDS.
+        
         Args:
             token_id: Token ID to lookup
             
         Returns:
             Dictionary containing token information
         """
+        cached = self._cache_get(self._token_cache, token_id, self.TOKEN_INFO_TTL_SECONDS)
+        if cached is not None:
+            return dict(cached)
+        
         try:
-            response = self.session.get(
-                urljoin(self.node_url, f"/blockchain/token/{token_id}"),
-                timeout=self.timeout
-            )
+            response = self._hedged_get(f"/blockchain/token/{token_id}")
             response.raise_for_status()
             
-            return response.json()
+            token_info = json_loads(response.content)
+            self._cache_put(self._token_cache, token_id, token_info, self.TOKEN_INFO_CACHE_SIZE)
+            return dict(token_info)
             
         except Exception as e:
             self.logger.error(f"Failed to get token info: {e}")
@@ -410,6 +1160,20 @@ class NetworkManager:
             "creation_height": utxo.get("creationHeight", 0)
         }
     
+    def close(self) -> None:
+        """Close the pooled HTTP sessions and their keep-alive connections."""
+        with self._hedge_lock:
+            if self._hedge_executor is not None:
+                self._hedge_executor.shutdown(wait=False)
+                self._hedge_executor = None
+        self._finalizer()
+    
+    def __enter__(self) -> "NetworkManager":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def __str__(self) -> str:
         """String representation of the network manager."""
         return f"NetworkManager(network={self.network})"
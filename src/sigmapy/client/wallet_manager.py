@@ -10,10 +10,11 @@ This class handles wallet-related operations including:
 """
 
 from typing import Dict, List, Optional, Any, Union
+import itertools
 import logging
-from decimal import Decimal
+import re
 
-from ..utils import AmountUtils
+from ..utils.address_utils import BASE58_PATTERN
 
 try:
     import ergo_lib_python as ergo
@@ -23,6 +24,16 @@ except ImportError:
     ergo = None
 
 
+logger = logging.getLogger(__name__)
+
+# Valid BIP-39 mnemonic lengths
+SEED_WORD_COUNTS = frozenset({12, 15, 18, 21, 24})
+
+# Cheap syntactic prefilter: every English BIP-39 word is 3-8 ASCII letters,
+# so phrases failing this are rejected before the ergo-lib mnemonic check
+BIP39_WORD_PATTERN = re.compile(r"[a-z]{3,8}", re.IGNORECASE | re.ASCII)
+
+
 class WalletManager:
     """
     Manages wallet operations and provides a unified interface for
@@ -37,11 +48,12 @@ class WalletManager:
             seed_phrase: Wallet seed phrase for signing transactions
             network: Network type ("mainnet" or "testnet")
         """
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.seed_phrase = seed_phrase
         self.network = network
-        self.addresses = []
-        self.cached_balances = {}
+        # Derived addresses in derivation order; a dict keeps that order and
+        # makes owns_address() a hash lookup
+        self._addresses: Dict[str, None] = {}
         self.secret_key = None
         self.wallet = None
         
@@ -63,11 +75,11 @@ class WalletManager:
         if not ERGO_LIB_AVAILABLE:
             self.logger.warning("ergo-lib-python not available. Using demo mode.")
             # Demo addresses for testing
-            self.addresses = [
+            self._addresses = dict.fromkeys([
                 "9fRusAarL1KkrWQVsxSRVYnvWzD4dWoLLxbYk3eWBV3jD3qvr3W",
                 "9gQqZyxyjAptMbfW1Gydm3qaap11zd6X9DrABTbMBRJLjZhQRCA",
                 "9h8UVJjdUYbNLuSqzZCqKNs2mxjVGYB9JwP4vVtNqmR3sKdxYyZ"
-            ]
+            ])
             return
         
         try:
@@ -78,7 +90,7 @@ class WalletManager:
             
             # Generate first address
             address = self._derive_address(0)
-            self.addresses = [str(address)]
+            self._addresses = {str(address): None}
             
             self.logger.info(f"Wallet initialized successfully for network: {self.network}")
             
@@ -88,19 +100,44 @@ class WalletManager:
     
     def _derive_address(self, index: int) -> str:
         """Derive address at given index."""
+        return self._derive_addresses(index, 1)[0]
+    
+    def _derive_addresses(self, start: int, count: int) -> List[str]:
+        """Derive the addresses at indices start .. start + count - 1."""
         if not ERGO_LIB_AVAILABLE or not self.secret_key:
-            return f"9demo_address_{index}"
+            return [f"9demo_address_{index}" for index in range(start, start + count)]
         
-        # Derive child key for the given index
-        child_key = self.secret_key.derive_child(index)
-        public_key = child_key.get_public_key()
-        address = ergo.Address.p2pk(public_key, self.network_type)
-        return str(address)
+        # Resolve the binding's methods once for the whole batch
+        derive_child = self.secret_key.derive_child
+        p2pk = ergo.Address.p2pk
+        network_type = self.network_type
+        return [
+            str(p2pk(derive_child(index).get_public_key(), network_type))
+            for index in range(start, start + count)
+        ]
     
     def has_wallet(self) -> bool:
         """Check if wallet is initialized."""
         return self.seed_phrase is not None
     
+    @property
+    def addresses(self) -> List[str]:
+        """Addresses derived so far, in derivation order."""
+        return list(self._addresses)
+    
+    def owns_address(self, address: str) -> bool:
+        """
+        Check whether an address is one this wallet has derived.
+        
+        Args:
+            address: Address to look up
+            
+        Returns:
+            True if the address was returned by get_addresses() (or is a
+            demo address), False otherwise
+        """
+        return address in self._addresses
+    
     def get_addresses(self, count: int = 1) -> List[str]:
         """
         Get wallet addresses.
@@ -114,16 +151,21 @@ class WalletManager:
         if not self.has_wallet():
             raise ValueError("No wallet initialized")
         
-        # Generate additional addresses if needed
-        while len(self.addresses) < count:
-            index = len(self.addresses)
-            new_address = self._derive_address(index)
-            self.addresses.append(new_address)
+        # Generate additional addresses if needed, in one batch
+        missing = count - len(self._addresses)
+        if missing > 0:
+            self._addresses.update(
+                dict.fromkeys(self._derive_addresses(len(self._addresses), missing))
+            )
         
-        return self.addresses[:count]
+        return list(itertools.islice(self._addresses, count))
     
     def get_primary_address(self) -> str:
         """Get the primary wallet address."""
+        # The first derived address is the primary one; it lives as long as
+        # the wallet, so read it straight from the address dict
+        if self._addresses and self.has_wallet():
+            return next(iter(self._addresses))
         addresses = self.get_addresses(1)
         return addresses[0]
     
@@ -255,13 +297,18 @@ class WalletManager:
         
         # Basic validation - check word count
         words = seed_phrase.split()
-        if len(words) not in [12, 15, 18, 21, 24]:
+        if len(words) not in SEED_WORD_COUNTS:
             return False
         
         if not ERGO_LIB_AVAILABLE:
             # Demo mode - basic validation
             return len(words) >= 12
         
+        # Reject malformed words without building a mnemonic
+        fullmatch = BIP39_WORD_PATTERN.fullmatch
+        if not all(fullmatch(word) for word in words):
+            return False
+        
         try:
             # Try to create mnemonic from phrase
             mnemonic = ergo.Mnemonic.from_phrase(seed_phrase)
@@ -279,19 +326,47 @@ class WalletManager:
         Returns:
             True if valid, False otherwise
         """
+        return self.parse_address(address) is not None
+    
+    def parse_address(self, address: str) -> Optional[Any]:
+        """
+        Decode an Ergo address once so it can be reused for output building.
+        
+        Args:
+            address: Base58 address to decode
+            
+        Returns:
+            The decoded ergo-lib Address (the address string itself in demo
+            mode), or None if the address is invalid
+        """
         if not address:
-            return False
+            return None
         
         if not ERGO_LIB_AVAILABLE:
             # Demo mode - basic validation
-            return address.startswith("9") and len(address) > 30
+            return address if address.startswith("9") and len(address) > 30 else None
+        
+        # Reject non-Base58 input without crossing into ergo-lib
+        if not BASE58_PATTERN.fullmatch(address):
+            return None
         
         try:
-            # Try to parse address
-            ergo.Address.from_base58(address)
-            return True
+            return ergo.Address.from_base58(address)
         except:
-            return False
+            return None
+    
+    def validate_addresses(self, addresses: List[str]) -> List[bool]:
+        """
+        Validate many addresses with the same rules as validate_address.
+        
+        Args:
+            addresses: Addresses to validate
+            
+        Returns:
+            List of booleans, one per input address, in input order
+        """
+        parse = self.parse_address
+        return [parse(address) is not None for address in addresses]
     
     def get_network_type(self) -> str:
         """Get the current network type."""
@@ -311,7 +386,7 @@ class WalletManager:
             f"WalletManager("
             f"has_wallet={self.has_wallet()}, "
             f"network={self.network}, "
-            f"addresses={len(self.addresses)}, "
+            f"addresses={len(self._addresses)}, "
             f"demo_mode={self.is_demo_mode()}"
             f")"
         )
\ No newline at end of file
@@ -8,9 +8,25 @@ management for batch operations and common use cases.
 from .config_parser import ConfigParser
 from .validators import ConfigValidator
 from .templates import TemplateManager
+from ._yaml_cache import (
+    ParserCache,
+    file_digest,
+    load_yaml_cached,
+    load_config,
+    set_yaml_cache_enabled,
+    stream_sequence,
+    write_json_sidecar,
+)
 
 __all__ = [
     "ConfigParser",
     "ConfigValidator",
     "TemplateManager",
+    "ParserCache",
+    "file_digest",
+    "load_yaml_cached",
+    "load_config",
+    "set_yaml_cache_enabled",
+    "stream_sequence",
+    "write_json_sidecar",
 ]
\ No newline at end of file
@@ -0,0 +1,209 @@
+"""
+Pre-serialized configuration templates
+
+Templates are static, so they are stored as ready-to-write YAML bytes. Template
+commands write these bytes directly instead of building a dict and running it
+through the YAML dumper, and the dict form is parsed (once) only when a caller
+actually needs it.
+
+Edit the YAML below directly; it is the single source of truth for each template.
+"""
+
+# Templates served by ConfigParser.get_template_config()
+TEMPLATES = {
+    "nft_collection": b"""\
+collection:
+  name: My NFT Collection
+  description: A unique collection of digital assets
+  creator: Artist Name
+  royalty: 0.05
+nfts:
+- name: 'NFT #1'
+  description: First NFT in the collection
+  image: https://example.com/image1.png
+  traits:
+    background: blue
+    rarity: common
+- name: 'NFT #2'
+  description: Second NFT in the collection
+  image: https://example.com/image2.png
+  traits:
+    background: red
+    rarity: rare
+""",
+
+    "token_distribution": b"""\
+distribution:
+  token_id: your_token_id_here
+  batch_size: 50
+  fee_per_tx: 0.001
+recipients:
+- address: 9f...
+  amount: 10
+- address: 9g...
+  amount: 20
+""",
+
+    "batch_operation": b"""\
+batch:
+  type: mixed
+  parallel: false
+operations:
+- type: create_token
+  parameters:
+    name: My Token
+    description: A utility token
+    supply: 1000000
+    decimals: 0
+- type: distribute_tokens
+  parameters:
+    token_id: token_id_from_previous_operation
+    recipients:
+    - address: 9f...
+      amount: 100
+    - address: 9g...
+      amount: 200
+""",
+}
+
+# Templates handed out by TemplateManager
+TEMPLATE_MANAGER_TEMPLATES = {
+    "nft_collection": b"""\
+collection:
+  name: My NFT Collection
+  description: A unique collection of digital assets
+  creator: Artist Name
+  royalty: 0.05
+  website: https://example.com
+  social:
+    twitter: '@artist'
+    discord: https://discord.gg/collection
+nfts:
+- name: 'NFT #1'
+  description: First NFT in the collection
+  image: https://example.com/image1.png
+  traits:
+    background: blue
+    rarity: common
+    attribute1: value1
+- name: 'NFT #2'
+  description: Second NFT in the collection
+  image: https://example.com/image2.png
+  traits:
+    background: red
+    rarity: rare
+    attribute1: value2
+""",
+
+    "token_distribution": b"""\
+distribution:
+  token_id: your_token_id_here
+  batch_size: 50
+  fee_per_tx: 0.001
+recipients:
+- address: 9f...
+  amount: 100
+  note: Recipient 1
+- address: 9g...
+  amount: 200
+  note: Recipient 2
+""",
+
+    "token_creation": b"""\
+tokens:
+- name: My Token
+  description: A utility token
+  supply: 1000000
+  decimals: 0
+- name: Another Token
+  description: Another utility token
+  supply: 500000
+  decimals: 2
+""",
+}
+
+# Template written by CollectionManager.create_collection_template()
+COLLECTION_TEMPLATE = b"""\
+collection:
+  name: My Art Collection
+  description: A unique digital art collection
+  supply: 10000
+  royalties:
+  - address: 9fArtistAddressHere...
+    percentage: 85
+  - address: 9fCharityAddressHere...
+    percentage: 15
+  additional_metadata:
+    website: https://example.com
+    twitter: '@artcollection'
+"""
+
+# Template written by NFTMinter.create_nft_collection_template()
+NFT_COLLECTION_TEMPLATE = b"""\
+collection:
+  token_id: your_collection_token_id_here
+  base_metadata:
+    description: A unique digital art collection
+    royalties:
+    - address: 9fArtistAddressHere...
+      percentage: 85
+    - address: 9fCharityAddressHere...
+      percentage: 15
+nfts:
+- name: 'Art #1'
+  description: First artwork in collection
+  image_url: https://example.com/art1.png
+  traits:
+    properties:
+      background: blue
+      style: abstract
+      artist: Jane Doe
+    levels:
+      rarity:
+        value: 85
+        max: 100
+      complexity:
+        value: 7
+        max: 10
+    stats:
+      creation_year: 2024
+      edition: 1
+  additional_metadata:
+    explicit: false
+    tags:
+    - art
+    - digital
+    - collectible
+- name: 'Art #2'
+  description: Second artwork in collection
+  image_url: https://example.com/art2.png
+  traits:
+    properties:
+      background: red
+      style: minimalist
+      artist: Jane Doe
+    levels:
+      rarity:
+        value: 92
+        max: 100
+      complexity:
+        value: 5
+        max: 10
+    stats:
+      creation_year: 2024
+      edition: 2
+"""
+
+# Template written by TokenManager.create_distribution_template()
+TOKEN_DISTRIBUTION_TEMPLATE = b"""\
+distribution:
+  token_id: your_token_id_here
+  fee_per_tx: 0.001
+recipients:
+- address: 9fRusAarL1KkrWQVsxSRVYnvWzD4dWoLLxbYk3eWBV3jD3qvr3W
+  amount: 100
+  note: Community member
+- address: 9gQqZyxyjAptMbfW1Gydm3qaap11zd6X9DrABTbMBRJLjZhQRCA
+  amount: 150
+  note: Developer contributor
+"""
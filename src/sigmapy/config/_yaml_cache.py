@@ -0,0 +1,524 @@
+"""
+YAML loading and dumping for configuration files
+
+All config reads and writes go through the libyaml-backed CSafeLoader and
+CSafeDumper when PyYAML was built with libyaml, falling back to the
+pure-Python safe implementations otherwise.
+
+Parsed configurations are pickled into a per-user cache directory, keyed on
+a BLAKE2b digest of the file's contents. Re-running a command
+against an unchanged config therefore skips the YAML parse entirely, and a
+single command can load a file once and hand the parsed dict to every
+downstream API instead of re-reading it. Within one process ParserCache
+also keeps the most recent parses in memory, so repeated loads of the same
+unchanged file (e.g. validate-then-distribute) never touch the disk again.
+
+A JSON side-car (``<config>.yaml.cache.json``) is also written beside each
+parsed config. JSON decodes an order of magnitude faster than YAML, so a
+fresh machine or CI run with an empty cache directory still skips the
+YAML parse whenever the side-car was written from the config's current
+contents (it records their digest; mtimes are not trusted, since copies
+and archives can give new contents an old timestamp).
+
+Both on-disk caches can be switched off (``SIGMAPY_YAML_CACHE=false``, the
+``yaml_cache`` ErgoClient option or the CLI ``--no-yaml-cache`` flag), in
+which case every process parses the YAML itself and writes nothing to disk.
+
+For recipient lists too large to hold as a parsed document, stream_sequence
+reads the items of one top-level sequence straight off the parser events
+(optionally building each item in full, nested fields included).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+import warnings
+from collections import OrderedDict
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, IO, Iterator, Mapping, Optional, Tuple, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+    from yaml._yaml import CParser as _CParser
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+    LIBYAML_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+if not LIBYAML_AVAILABLE:
+    # Emitted once, at import; configs still load, just several times slower
+    warnings.warn(
+        "PyYAML was built without libyaml; falling back to the pure-Python "
+        "YAML loader. Reinstall PyYAML with libyaml for faster config parsing.",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+
+# Cache directory, overridable for CI or sandboxed environments
+CACHE_DIR = Path(
+    os.environ.get("SIGMAPY_CACHE_DIR")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "sigmapy"
+) / "yaml"
+
+PICKLE_PROTOCOL = min(5, pickle.HIGHEST_PROTOCOL)
+
+# Whether the on-disk pickle cache and JSON side-cars are used
+_disk_cache_enabled = os.environ.get("SIGMAPY_YAML_CACHE", "true").lower() in ("true", "1", "yes", "on")
+
+
+def set_yaml_cache_enabled(enabled: bool) -> None:
+    """
+    Enable or disable the on-disk config caches for this process.
+
+    When disabled, configs are always parsed from the YAML source and no
+    pickle or JSON side-car files are read or written. The in-memory
+    ParserCache is unaffected, since it never outlives the process.
+
+    Args:
+        enabled: True to use the on-disk caches, False to bypass them
+    """
+    global _disk_cache_enabled
+    _disk_cache_enabled = bool(enabled)
+
+
+def yaml_cache_enabled() -> bool:
+    """Return True if the on-disk config caches are in use."""
+    return _disk_cache_enabled
+
+
+def yaml_load(stream: Union[str, bytes, IO]) -> Any:
+    """Parse a YAML document with the fastest available safe loader."""
+    return yaml.load(stream, Loader=_Loader)
+
+
+def yaml_dump(data: Any, stream: IO, **kwargs) -> None:
+    """Serialize data as YAML with the fastest available safe dumper."""
+    yaml.dump(data, stream, Dumper=_Dumper, **kwargs)
+
+
+if LIBYAML_AVAILABLE:
+    class _ItemLoader(
+        _CParser,
+        yaml.composer.Composer,
+        yaml.constructor.SafeConstructor,
+        yaml.resolver.Resolver,
+    ):
+        """Safe loader that composes libyaml events one node at a time."""
+
+        def __init__(self, stream: IO):
+            _CParser.__init__(self, stream)
+            yaml.composer.Composer.__init__(self)
+            yaml.constructor.SafeConstructor.__init__(self)
+            yaml.resolver.Resolver.__init__(self)
+else:
+    _ItemLoader = yaml.SafeLoader
+
+
+def stream_sequence(path: Union[str, Path], key: str, nested: bool = False) -> Iterator[Any]:
+    """
+    Yield the mappings of a top-level sequence without loading the document.
+
+    The YAML is consumed as a parser event stream, so memory stays flat no
+    matter how many items the sequence holds (e.g. an airdrop list with
+    tens of thousands of recipients). By default only scalar fields of each
+    item are kept and nested collections inside an item are skipped; with
+    ``nested`` each item is built in full (traits, royalties, ...), one item
+    at a time.
+
+    Args:
+        path: Path to the YAML file
+        key: Top-level key of the sequence, e.g. ``"recipients"``
+        nested: Build whole items, including nested collections and aliases
+
+    Yields:
+        One dict of scalar fields per sequence item, in document order (with
+        ``nested``, every item as loaded, whatever its type)
+
+    Raises:
+        ValueError: If the sequence uses anchors/aliases (scalar mode only)
+    """
+    if nested:
+        yield from _stream_items(path, key)
+        return
+
+    resolver = yaml.resolver.Resolver()
+    constructor = yaml.constructor.SafeConstructor()
+
+    def scalar(event: yaml.ScalarEvent) -> Any:
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = resolver.resolve(yaml.ScalarNode, event.value, event.implicit)
+        node = yaml.ScalarNode(tag, event.value, style=event.style)
+        return constructor.construct_object(node)
+
+    with open(path, 'rb') as stream:
+        events = yaml.parse(stream, Loader=_Loader)
+
+        # Find the sequence under `key` in the top-level mapping
+        depth = 0
+        expect_key = False
+        found = False
+        for event in events:
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                if depth == 0 and isinstance(event, yaml.SequenceStartEvent):
+                    return
+                if depth == 1 and found and isinstance(event, yaml.SequenceStartEvent):
+                    break
+                depth += 1
+                if depth == 1:
+                    expect_key = True
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                depth -= 1
+                if depth == 1:
+                    # A collection value under some other key just ended
+                    expect_key, found = True, False
+            elif isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)) and depth == 1:
+                if expect_key:
+                    found = isinstance(event, yaml.ScalarEvent) and event.value == key
+                    expect_key = False
+                else:
+                    expect_key, found = True, False
+        else:
+            return
+
+        # Inside the sequence; each item mapping is one level deeper
+        depth = 1
+        item = None
+        field = None
+        for event in events:
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                depth += 1
+                if depth == 2:
+                    item = {} if isinstance(event, yaml.MappingStartEvent) else None
+                    field = None
+                elif depth == 3:
+                    # Nested collection value - skipped, so drop its key
+                    field = None
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                depth -= 1
+                if depth == 0:
+                    return
+                if depth == 1 and item is not None:
+                    yield item
+                    item = None
+            elif depth == 2 and item is not None:
+                if isinstance(event, yaml.AliasEvent):
+                    raise ValueError(f"Anchors and aliases are not supported in streamed '{key}' items")
+                if isinstance(event, yaml.ScalarEvent):
+                    if field is None:
+                        field = scalar(event)
+                    else:
+                        item[field] = scalar(event)
+                        field = None
+
+
+def _stream_items(path: Union[str, Path], key: str) -> Iterator[Any]:
+    """Yield fully constructed items of a top-level sequence, one at a time."""
+    with open(path, 'rb') as stream:
+        loader = _ItemLoader(stream)
+        try:
+            loader.get_event()
+            if not loader.check_event(yaml.DocumentStartEvent):
+                return
+            loader.get_event()
+            if not loader.check_event(yaml.MappingStartEvent):
+                return
+            loader.get_event()
+
+            while not loader.check_event(yaml.MappingEndEvent):
+                name = loader.construct_object(loader.compose_node(None, None), deep=True)
+                if name == key and loader.check_event(yaml.SequenceStartEvent):
+                    loader.get_event()
+                    while not loader.check_event(yaml.SequenceEndEvent):
+                        node = loader.compose_node(None, None)
+                        item = loader.construct_object(node, deep=True)
+                        # Forget constructed objects so only one item is alive
+                        loader.constructed_objects = {}
+                        yield item
+                    return
+                # Some other top-level value; compose it only to skip past it
+                loader.compose_node(None, None)
+        finally:
+            loader.dispose()
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document with orjson when available, else the stdlib."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def json_dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON with orjson when available, else the stdlib.
+
+    Output is compact unless ``indent`` is set, which indents by two spaces
+    (the layout of ``json.dump(..., indent=2)``) for files people edit.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def file_digest(path: Union[str, "os.PathLike[str]"]) -> Tuple[str, bytes]:
+    """
+    Read a config file and fingerprint its contents.
+
+    The digest is a BLAKE2b hash of the raw bytes, so it only changes when
+    the contents do: a fresh checkout or a ``touch`` keeps hitting the
+    cache, while an edit that preserves mtime and size never serves a
+    stale parse.
+
+    Returns:
+        Tuple of (hex digest, file bytes)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = os.fspath(path)
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {path}") from None
+    return _digest(data), data
+
+
+def _digest(data: bytes) -> str:
+    """BLAKE2b fingerprint of a config file's bytes."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _cache_file(digest: str) -> Path:
+    """Map a content digest to its pickle file inside CACHE_DIR."""
+    return CACHE_DIR / f"{digest}.pickle"
+
+
+def sidecar_path(path: Union[str, Path]) -> Path:
+    """Return the JSON side-car path for a YAML config file."""
+    path = Path(path)
+    return path.with_name(path.name + ".cache.json")
+
+
+def write_json_sidecar(
+    path: Union[str, Path],
+    config: Dict[str, Any],
+    digest: Optional[str] = None
+) -> bool:
+    """
+    Write the JSON side-car for a YAML config file.
+
+    The side-car records the digest of the YAML it was parsed from and is
+    only used while the YAML still has exactly those contents.
+
+    Args:
+        path: Path to the YAML file the side-car belongs to
+        config: Parsed configuration to store
+        digest: file_digest of the YAML's current contents (read from the
+            file if not given)
+
+    Returns:
+        True if the side-car was written, False if it was skipped
+    """
+    sidecar = sidecar_path(path)
+    if digest is None:
+        try:
+            digest, _ = file_digest(path)
+        except FileNotFoundError:
+            logger.debug(f"Config {path} does not exist, no side-car written")
+            return False
+
+    try:
+        payload = json.dumps({"source": digest, "config": config}, separators=(',', ':'))
+    except (TypeError, ValueError) as e:
+        # YAML types without a JSON equivalent (dates, sets, ...)
+        logger.debug(f"Config {path} is not JSON-serializable, no side-car written: {e}")
+        return False
+
+    if json.loads(payload)["config"] != config:
+        # Non-string keys would come back as strings; keep YAML authoritative
+        logger.debug(f"Config {path} does not round-trip through JSON, no side-car written")
+        return False
+
+    try:
+        sidecar.write_text(payload, encoding='utf-8')
+        return True
+    except OSError as e:
+        logger.debug(f"Could not write JSON side-car {sidecar}: {e}")
+    return False
+
+
+def load_config(path: Union[str, Path], data: Optional[bytes] = None) -> Dict[str, Any]:
+    """
+    Load a YAML config, preferring its JSON side-car when it matches.
+
+    On a side-car miss the YAML is parsed and a fresh side-car is written.
+    ``.json`` configs are parsed directly with the JSON decoder.
+
+    Args:
+        path: Path to the YAML file
+        data: The file's bytes, if the caller has already read them
+
+    Returns:
+        Parsed configuration dictionary (empty dict for an empty file)
+    """
+    path = Path(path)
+    if path.suffix.lower() == '.json':
+        return json_loads(data if data is not None else path.read_bytes()) or {}
+
+    if not _disk_cache_enabled:
+        return yaml_load(data if data is not None else path.read_bytes()) or {}
+
+    if data is None:
+        data = path.read_bytes()
+    digest = _digest(data)
+    sidecar = sidecar_path(path)
+
+    try:
+        cached = json_loads(sidecar.read_bytes())
+        # Side-cars from other contents (or the old bare format) are stale
+        if isinstance(cached, dict) and cached.get("source") == digest:
+            return cached["config"]
+    except FileNotFoundError:
+        pass
+    except (ValueError, KeyError) as e:
+        logger.debug(f"Ignoring unreadable JSON side-car {sidecar}: {e}")
+
+    # One binary read; libyaml decodes the bytes itself in C
+    config = yaml_load(data) or {}
+
+    write_json_sidecar(path, config, digest)
+    return config
+
+
+class ParserCache:
+    """
+    Process-wide LRU of parsed config files.
+
+    Entries are keyed on a BLAKE2b digest of the file's bytes, so an edited
+    file is simply a new key, stale entries age out, and identical files
+    share one parse. Hashing a file is far cheaper than parsing it. Each entry
+    holds both the pickled payload and the decoded config: ``load`` hands
+    out private copies (unpickling doubles as a cheap deep copy), while
+    ``view`` returns a read-only proxy of the shared config for callers
+    that only inspect it.
+    """
+
+    MAX_ENTRIES = 100
+
+    _entries: "OrderedDict[str, Tuple[bytes, Dict[str, Any]]]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def _entry(cls, path: Union[str, Path]) -> Tuple[bytes, Dict[str, Any]]:
+        """Return the cached (payload, config) for a file, parsing it on a miss."""
+        key, data = file_digest(path)
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None:
+                cls._entries.move_to_end(key)
+                return entry
+
+        # Parse outside the lock; a concurrent miss on the same file is harmless
+        entry = _read_entry(path, key, data)
+
+        with cls._lock:
+            cls._entries[key] = entry
+            while len(cls._entries) > cls.MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+        return entry
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Dict[str, Any]:
+        """Return a private, mutable copy of a parsed config file."""
+        payload, _ = cls._entry(path)
+        return pickle.loads(payload)
+
+    @classmethod
+    def view(cls, path: Union[str, Path]) -> Mapping[str, Any]:
+        """
+        Return a read-only view of the shared parsed config.
+
+        Only the top level is protected; nested lists and dicts must be
+        treated as read-only by the caller.
+        """
+        _, config = cls._entry(path)
+        return MappingProxyType(config)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every in-memory entry (the on-disk caches are untouched)."""
+        with cls._lock:
+            cls._entries.clear()
+
+
+def load_yaml_cached(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Load a YAML configuration file, reusing a cached parse when unchanged.
+
+    Every call returns a fresh copy, so callers may mutate the result.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed configuration dictionary (empty dict for an empty file)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    return ParserCache.load(path)
+
+
+def _read_entry(path: Union[str, Path], digest: str, data: bytes) -> Tuple[bytes, Dict[str, Any]]:
+    """Return the pickled and decoded parse of a config, from disk cache or a fresh load."""
+    if not _disk_cache_enabled:
+        config = load_config(path, data)
+        return pickle.dumps(config, protocol=PICKLE_PROTOCOL), config
+
+    cache_file = _cache_file(digest)
+
+    try:
+        payload = cache_file.read_bytes()
+        return payload, pickle.loads(payload)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        # Corrupt or incompatible cache entry - fall back to a fresh parse
+        logger.debug(f"Ignoring unreadable YAML cache {cache_file}: {e}")
+
+    config = load_config(path, data)
+    payload = pickle.dumps(config, protocol=PICKLE_PROTOCOL)
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        # Caching is best-effort; a read-only home must not break commands
+        logger.debug(f"Could not write YAML cache {cache_file}: {e}")
+
+    return payload, config
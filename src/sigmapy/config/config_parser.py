@@ -5,12 +5,66 @@ This module provides utilities for parsing and validating configuration files
 used for batch operations and complex workflows.
 """
 
-from typing import Dict, Any, Union
+from typing import Dict, Any, Iterator, List, Union
 from pathlib import Path
+import functools
 import json
+import pickle
+import re
 import yaml
 import logging
 
+from ._yaml_cache import PICKLE_PROTOCOL, json_dumps, load_yaml_cached, stream_sequence, yaml_load, yaml_dump
+from ._template_data import TEMPLATES
+
+
+# Start of a top-level mapping key (not indented, not a list item or comment)
+_TOP_LEVEL_KEY = re.compile(rb"^[^\s#-]", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=None)
+def _template_dict(template_name: str) -> Dict[str, Any]:
+    """Parse a pre-serialized template once; callers must not mutate the result."""
+    return yaml_load(TEMPLATES[template_name])
+
+
+@functools.lru_cache(maxsize=None)
+def _template_payload(template_name: str) -> bytes:
+    """Pickle a parsed template once; unpickling it is a cheap private copy."""
+    return pickle.dumps(_template_dict(template_name), protocol=PICKLE_PROTOCOL)
+
+
+# Fast accept checks for the per-item validation loops. Each is a single
+# tight pass with exact-type tests that returns True only when every item is
+# valid; on False the validator's indexed loop runs to find and report the
+# first problem (and to accept the rarer valid cases, e.g. dict subclasses).
+def _nfts_ok(nfts: List[Any]) -> bool:
+    for nft in nfts:
+        if type(nft) is not dict or "name" not in nft or "description" not in nft:
+            return False
+        if "traits" in nft and type(nft["traits"]) is not dict:
+            return False
+    return True
+
+
+def _recipients_ok(recipients: List[Any]) -> bool:
+    for recipient in recipients:
+        if type(recipient) is not dict or "address" not in recipient:
+            return False
+        amount = recipient.get("amount")
+        if (type(amount) is not int and type(amount) is not float) or amount <= 0:
+            return False
+    return True
+
+
+def _operations_ok(operations: List[Any]) -> bool:
+    for operation in operations:
+        if type(operation) is not dict or "type" not in operation:
+            return False
+        if type(operation.get("parameters")) is not dict:
+            return False
+    return True
+
 
 class ConfigParser:
     """
@@ -57,12 +111,62 @@ class ConfigParser:
         else:
             raise ValueError(f"Unsupported configuration file format: {config_path.suffix}")
     
+    @staticmethod
+    def parse_header(config_file: Union[str, Path], max_bytes: int = 4096) -> Dict[str, Any]:
+        """
+        Parse only the top-level sections that fit in the first bytes of a YAML file.
+        
+        The read is cut just before the last top-level key inside the first
+        ``max_bytes`` bytes, so every returned section is complete; sections
+        past that point (typically a long ``recipients`` list) are omitted.
+        Small files, and headers that don't parse on their own, fall back to
+        a full parse.
+        
+        Args:
+            config_file: Path to YAML configuration file
+            max_bytes: Maximum number of bytes to read
+            
+        Returns:
+            Dictionary containing the complete top-level sections read
+            
+        Raises:
+            FileNotFoundError: If config file doesn't exist
+            ValueError: If config file format is invalid
+            
+        Examples:
+            >>> header = ConfigParser.parse_header("distribution.yaml")
+            >>> token_id = header["distribution"]["token_id"]
+        """
+        config_path = Path(config_file)
+        
+        if not config_path.exists():
+            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        
+        with open(config_path, 'rb') as f:
+            data = f.read(max_bytes + 1)
+        
+        if len(data) <= max_bytes:
+            return ConfigParser.parse_file(config_path)
+        
+        # The last top-level key in the window may be cut off mid-block
+        key_starts = [match.start() for match in _TOP_LEVEL_KEY.finditer(data, 0, max_bytes)]
+        if len(key_starts) < 2:
+            return ConfigParser.parse_file(config_path)
+        
+        try:
+            header = yaml_load(data[:key_starts[-1]])
+        except yaml.YAMLError:
+            header = None
+        
+        if not isinstance(header, dict):
+            return ConfigParser.parse_file(config_path)
+        return header
+    
     @staticmethod
     def _parse_yaml(config_path: Path) -> Dict[str, Any]:
-        """Parse YAML configuration file."""
+        """Parse YAML configuration file (memoized while the file is unchanged)."""
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+            return load_yaml_cached(config_path)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML format in {config_path}: {e}")
         except Exception as e:
@@ -70,11 +174,10 @@ class ConfigParser:
     
     @staticmethod
     def _parse_json(config_path: Path) -> Dict[str, Any]:
-        """Parse JSON configuration file."""
+        """Parse JSON configuration file (orjson when installed; memoized while unchanged)."""
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            return load_yaml_cached(config_path)
+        except (json.JSONDecodeError, ValueError) as e:
             raise ValueError(f"Invalid JSON format in {config_path}: {e}")
         except Exception as e:
             raise ValueError(f"Failed to parse JSON file {config_path}: {e}")
@@ -123,20 +226,79 @@ class ConfigParser:
         if not isinstance(nfts, list) or len(nfts) == 0:
             raise ValueError("'nfts' must be a non-empty list")
         
+        if _nfts_ok(nfts):
+            return
+        
         # Validate each NFT
         for i, nft in enumerate(nfts):
-            if not isinstance(nft, dict):
-                raise ValueError(f"NFT {i+1} must be a dictionary")
+            ConfigParser._validate_nft(i, nft)
+    
+    @staticmethod
+    def _validate_nft(i: int, nft: Any) -> None:
+        """Validate the NFT at (zero-based) position i of an NFT collection."""
+        if not isinstance(nft, dict):
+            raise ValueError(f"NFT {i+1} must be a dictionary")
+        
+        if "name" not in nft:
+            raise ValueError(f"NFT {i+1} must have a 'name' field")
+        
+        if "description" not in nft:
+            raise ValueError(f"NFT {i+1} must have a 'description' field")
+        
+        # Validate traits if present
+        if "traits" in nft and not isinstance(nft["traits"], dict):
+            raise ValueError(f"NFT {i+1} traits must be a dictionary")
+    
+    @staticmethod
+    def stream_nft_items(config_file: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the validated NFTs of a collection file one at a time.
+        
+        YAML files are read as a parser event stream and each NFT is built
+        and validated on its own, so the full collection is never held in
+        memory; use this instead of parse_file plus
+        validate_nft_collection_config for very large collections. JSON
+        files are parsed whole and their NFTs handed out the same way.
+        
+        Args:
+            config_file: Path to YAML or JSON NFT collection file
             
-            if "name" not in nft:
-                raise ValueError(f"NFT {i+1} must have a 'name' field")
+        Yields:
+            One NFT dictionary per entry of the 'nfts' list, in file order
             
-            if "description" not in nft:
-                raise ValueError(f"NFT {i+1} must have a 'description' field")
+        Raises:
+            FileNotFoundError: If config file doesn't exist
+            ValueError: If an NFT is invalid or the 'nfts' list is missing or
+                empty (raised when the bad entry is reached)
             
-            # Validate traits if present
-            if "traits" in nft and not isinstance(nft["traits"], dict):
-                raise ValueError(f"NFT {i+1} traits must be a dictionary")
+        Examples:
+            >>> for nft in ConfigParser.stream_nft_items("big_collection.yaml"):
+            ...     mint(nft)
+        """
+        config_path = Path(config_file)
+        
+        if not config_path.exists():
+            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        
+        if config_path.suffix.lower() in ['.yaml', '.yml']:
+            nfts = stream_sequence(config_path, "nfts", nested=True)
+        elif config_path.suffix.lower() == '.json':
+            nfts = ConfigParser._parse_json(config_path).get("nfts") or []
+            if not isinstance(nfts, list):
+                raise ValueError("'nfts' must be a non-empty list")
+        else:
+            raise ValueError(f"Unsupported configuration file format: {config_path.suffix}")
+        
+        count = 0
+        try:
+            for count, nft in enumerate(nfts, 1):
+                ConfigParser._validate_nft(count - 1, nft)
+                yield nft
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML format in {config_path}: {e}")
+        
+        if count == 0:
+            raise ValueError("'nfts' must be a non-empty list")
     
     @staticmethod
     def validate_token_distribution_config(config: Dict[str, Any]) -> None:
@@ -189,6 +351,9 @@ class ConfigParser:
         if not isinstance(recipients, list) or len(recipients) == 0:
             raise ValueError("'recipients' must be a non-empty list")
         
+        if _recipients_ok(recipients):
+            return
+        
         # Validate each recipient
         for i, recipient in enumerate(recipients):
             if not isinstance(recipient, dict):
@@ -252,6 +417,9 @@ class ConfigParser:
         if not isinstance(operations, list) or len(operations) == 0:
             raise ValueError("'operations' must be a non-empty list")
         
+        if _operations_ok(operations):
+            return
+        
         # Validate each operation
         for i, operation in enumerate(operations):
             if not isinstance(operation, dict):
@@ -281,87 +449,11 @@ class ConfigParser:
             >>> config = ConfigParser.get_template_config("nft_collection")
             >>> # Returns template for NFT collection configuration
         """
-        templates = {
-            "nft_collection": {
-                "collection": {
-                    "name": "My NFT Collection",
-                    "description": "A unique collection of digital assets",
-                    "creator": "Artist Name",
-                    "royalty": 0.05
-                },
-                "nfts": [
-                    {
-                        "name": "NFT #1",
-                        "description": "First NFT in the collection",
-                        "image": "https://example.com/image1.png",
-                        "traits": {
-                            "background": "blue",
-                            "rarity": "common"
-                        }
-                    },
-                    {
-                        "name": "NFT #2",
-                        "description": "Second NFT in the collection",
-                        "image": "https://example.com/image2.png",
-                        "traits": {
-                            "background": "red",
-                            "rarity": "rare"
-                        }
-                    }
-                ]
-            },
-            
-            "token_distribution": {
-                "distribution": {
-                    "token_id": "your_token_id_here",
-                    "batch_size": 50,
-                    "fee_per_tx": 0.001
-                },
-                "recipients": [
-                    {
-                        "address": "9f...",
-                        "amount": 10
-                    },
-                    {
-                        "address": "9g...",
-                        "amount": 20
-                    }
-                ]
-            },
-            
-            "batch_operation": {
-                "batch": {
-                    "type": "mixed",
-                    "parallel": False
-                },
-                "operations": [
-                    {
-                        "type": "create_token",
-                        "parameters": {
-                            "name": "My Token",
-                            "description": "A utility token",
-                            "supply": 1000000,
-                            "decimals": 0
-                        }
-                    },
-                    {
-                        "type": "distribute_tokens",
-                        "parameters": {
-                            "token_id": "token_id_from_previous_operation",
-                            "recipients": [
-                                {"address": "9f...", "amount": 100},
-                                {"address": "9g...", "amount": 200}
-                            ]
-                        }
-                    }
-                ]
-            }
-        }
-        
-        if template_name not in templates:
+        if template_name not in TEMPLATES:
             raise ValueError(f"Unknown template: {template_name}")
         
-        return templates[template_name]
+        # Hand out a copy so callers can edit it without touching the cache
+        return pickle.loads(_template_payload(template_name))
     
     @staticmethod
     def save_config(config: Dict[str, Any], output_file: Union[str, Path]) -> None:
@@ -380,27 +472,71 @@ class ConfigParser:
         
         # Determine format based on extension
         if output_path.suffix.lower() in ['.yaml', '.yml']:
+            # Unmodified templates are written from their pre-serialized form
+            for template_name, template_yaml in TEMPLATES.items():
+                if config == _template_dict(template_name):
+                    output_path.write_bytes(template_yaml)
+                    return
             ConfigParser._save_yaml(config, output_path)
         elif output_path.suffix.lower() == '.json':
             ConfigParser._save_json(config, output_path)
         else:
             raise ValueError(f"Unsupported output format: {output_path.suffix}")
     
+    @staticmethod
+    def convert_yaml_to_json(
+        yaml_file: Union[str, Path],
+        json_file: Union[str, Path, None] = None
+    ) -> Path:
+        """
+        Convert a YAML configuration file to JSON.
+        
+        JSON configs load far faster than YAML, so large recipient lists can
+        be converted once and the ``.json`` file used from then on.
+        
+        Args:
+            yaml_file: Path to YAML configuration file
+            json_file: Output path (defaults to the YAML path with a .json suffix)
+            
+        Returns:
+            Path of the written JSON file
+            
+        Raises:
+            ValueError: If the YAML contains values JSON cannot represent
+            
+        Examples:
+            >>> ConfigParser.convert_yaml_to_json("distribution.yaml")
+            PosixPath('distribution.json')
+        """
+        yaml_path = Path(yaml_file)
+        json_path = Path(json_file) if json_file is not None else yaml_path.with_suffix('.json')
+        
+        config = ConfigParser.parse_file(yaml_path)
+        
+        try:
+            round_trip = json.loads(json.dumps(config))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Configuration {yaml_path} cannot be represented as JSON: {e}")
+        if round_trip != config:
+            raise ValueError(f"Configuration {yaml_path} does not round-trip through JSON")
+        
+        ConfigParser._save_json(config, json_path)
+        return json_path
+    
     @staticmethod
     def _save_yaml(config: Dict[str, Any], output_path: Path) -> None:
         """Save configuration as YAML."""
         try:
             with open(output_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+                yaml_dump(config, f, default_flow_style=False, sort_keys=False)
         except Exception as e:
             raise ValueError(f"Failed to save YAML file {output_path}: {e}")
     
     @staticmethod
     def _save_json(config: Dict[str, Any], output_path: Path) -> None:
-        """Save configuration as JSON."""
+        """Save configuration as JSON (with orjson when installed)."""
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, sort_keys=False)
+            output_path.write_bytes(json_dumps(config, indent=True))
         except Exception as e:
             raise ValueError(f"Failed to save JSON file {output_path}: {e}")
     
@@ -6,7 +6,19 @@ and utilities for creating and managing configuration templates.
 """
 
 from typing import Dict, Any, List
+import functools
 import logging
+import pickle
+
+from ._yaml_cache import PICKLE_PROTOCOL, yaml_load
+from ._template_data import TEMPLATE_MANAGER_TEMPLATES
+
+
+@functools.lru_cache(maxsize=None)
+def _template_payload(template_name: str) -> bytes:
+    """Parse and pickle a template once; unpickling it is a cheap private copy."""
+    template = yaml_load(TEMPLATE_MANAGER_TEMPLATES[template_name])
+    return pickle.dumps(template, protocol=PICKLE_PROTOCOL)
 
 
 class TemplateManager:
@@ -29,41 +41,7 @@ class TemplateManager:
         Returns:
             Dictionary containing NFT collection template
         """
-        return {
-            "collection": {
-                "name": "My NFT Collection",
-                "description": "A unique collection of digital assets",
-                "creator": "Artist Name",
-                "royalty": 0.05,
-                "website": "https://example.com",
-                "social": {
-                    "twitter": "@artist",
-                    "discord": "https://discord.gg/collection"
-                }
-            },
-            "nfts": [
-                {
-                    "name": "NFT #1",
-                    "description": "First NFT in the collection",
-                    "image": "https://example.com/image1.png",
-                    "traits": {
-                        "background": "blue",
-                        "rarity": "common",
-                        "attribute1": "value1"
-                    }
-                },
-                {
-                    "name": "NFT #2",
-                    "description": "Second NFT in the collection",
-                    "image": "https://example.com/image2.png",
-                    "traits": {
-                        "background": "red",
-                        "rarity": "rare",
-                        "attribute1": "value2"
-                    }
-                }
-            ]
-        }
+        return pickle.loads(_template_payload("nft_collection"))
     
     @staticmethod
     def get_token_distribution_template() -> Dict[str, Any]:
@@ -73,25 +51,7 @@ class TemplateManager:
         Returns:
             Dictionary containing token distribution template
         """
-        return {
-            "distribution": {
-                "token_id": "your_token_id_here",
-                "batch_size": 50,
-                "fee_per_tx": 0.001
-            },
-            "recipients": [
-                {
-                    "address": "9f...",
-                    "amount": 100,
-                    "note": "Recipient 1"
-                },
-                {
-                    "address": "9g...",
-                    "amount": 200,
-                    "note": "Recipient 2"
-                }
-            ]
-        }
+        return pickle.loads(_template_payload("token_distribution"))
     
     @staticmethod
     def get_token_creation_template() -> Dict[str, Any]:
@@ -101,22 +61,7 @@ class TemplateManager:
         Returns:
             Dictionary containing token creation template
         """
-        return {
-            "tokens": [
-                {
-                    "name": "My Token",
-                    "description": "A utility token",
-                    "supply": 1000000,
-                    "decimals": 0
-                },
-                {
-                    "name": "Another Token",
-                    "description": "Another utility token",
-                    "supply": 500000,
-                    "decimals": 2
-                }
-            ]
-        }
+        return pickle.loads(_template_payload("token_creation"))
     
     def __str__(self) -> str:
         """String representation of TemplateManager."""
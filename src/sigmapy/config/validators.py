@@ -7,6 +7,11 @@ configuration files used in SigmaPy operations.
 
 from typing import Dict, Any, List
 import logging
+import re
+
+
+# Mainnet (9...) or testnet (3...) address of at least 40 Base58 characters
+_ADDRESS_PATTERN = re.compile(r"[93][1-9A-HJ-NP-Za-km-z]{39,}")
 
 
 class ConfigValidator:
@@ -35,15 +40,8 @@ class ConfigValidator:
         if not address or not isinstance(address, str):
             return False
         
-        # Basic validation - check length and prefix
-        if len(address) < 40:
-            return False
-        
-        # Check if it starts with valid prefix
-        if not (address.startswith("9") or address.startswith("3")):
-            return False
-        
-        return True
+        # Basic validation - prefix, length and Base58 alphabet in one match
+        return _ADDRESS_PATTERN.fullmatch(address) is not None
     
     @staticmethod
     def validate_amount(amount: Any) -> bool:
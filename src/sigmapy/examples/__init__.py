@@ -9,11 +9,30 @@ This module contains ready-to-use examples for common Ergo operations:
 - NFT operations
 """
 
-from .simple_payment import SimplePaymentExample
-from .advanced_transaction import AdvancedTransactionExample
-from .token_operations import TokenOperationsExample
-from .nft_examples import NFTExample
-from .multisig_example import MultiSigExample
+from typing import TYPE_CHECKING
+
+from .._lazy import make_lazy
+
+# Each name is imported from its module on first access (PEP 562), so
+# importing one example doesn't import all of them
+_LAZY = {
+    "SimplePaymentExample": ".simple_payment",
+    "AdvancedTransactionExample": ".advanced_transaction",
+    "TokenOperationsExample": ".token_operations",
+    "NFTExample": ".nft_examples",
+    "MultiSigExample": ".multisig_example",
+}
+
+if TYPE_CHECKING:
+    from .simple_payment import SimplePaymentExample
+    from .advanced_transaction import AdvancedTransactionExample
+    from .token_operations import TokenOperationsExample
+    from .nft_examples import NFTExample
+    from .multisig_example import MultiSigExample
+
+
+__getattr__, __dir__ = make_lazy(__name__, _LAZY)
+
 
 __all__ = [
     "SimplePaymentExample",
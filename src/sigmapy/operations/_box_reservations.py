@@ -0,0 +1,90 @@
+"""
+Input box reservations shared by concurrently built transactions
+
+Transactions built in parallel from the same wallet must not spend the same
+box. A box is reserved while the transaction spending it is being built,
+signed and broadcast; it is released again if that transaction never reaches
+the node. Boxes of a broadcast transaction stay reserved only until the
+node's unspent listing can be expected to have caught up, then expire.
+"""
+
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import threading
+import time
+
+
+class BoxReservations:
+    """
+    Thread-safe set of input box IDs claimed by in-flight transactions.
+    
+    Only the selection itself runs under the lock; UTXOs are fetched by the
+    caller beforehand so network I/O never serializes concurrent builds.
+    """
+    
+    # How long boxes spent by a broadcast transaction stay reserved; long
+    # enough for it to confirm, after which the node no longer lists them
+    # (or, if the node dropped the transaction, they become usable again)
+    SPENT_TTL_SECONDS = 600.0
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        # box id -> expiry (time.monotonic()), or None while still in flight
+        self._reserved: Dict[str, Optional[float]] = {}
+        # (expiry, box ids) in expiry order, for cheap pruning
+        self._expiries = deque()
+    
+    def claim(
+        self,
+        utxos: Iterable[Dict],
+        select: Callable[[List[Dict]], Tuple],
+        reserve: bool = True
+    ) -> Tuple:
+        """
+        Run an input selection over the boxes nobody else has reserved.
+        
+        Args:
+            utxos: Candidate UTXOs, as returned by the node
+            select: Called with the unreserved UTXOs; returns a tuple whose
+                first item is the list of selected UTXOs, and raises if they
+                do not cover the transaction
+            reserve: If False (dry runs), select without reserving anything
+        
+        Returns:
+            Whatever ``select`` returned
+        """
+        with self._lock:
+            self._expire(time.monotonic())
+            result = select([
+                utxo for utxo in utxos
+                if utxo['box_id'] not in self._reserved
+            ])
+            if reserve:
+                for utxo in result[0]:
+                    self._reserved[utxo['box_id']] = None
+        return result
+    
+    def release(self, box_ids: Iterable[str]) -> None:
+        """Return reserved boxes to the pool available for selection."""
+        with self._lock:
+            for box_id in box_ids:
+                self._reserved.pop(box_id, None)
+    
+    def mark_spent(self, box_ids: Iterable[str]) -> None:
+        """Let the boxes of a broadcast transaction expire after SPENT_TTL_SECONDS."""
+        with self._lock:
+            expiry = time.monotonic() + self.SPENT_TTL_SECONDS
+            box_ids = [box_id for box_id in box_ids if box_id in self._reserved]
+            for box_id in box_ids:
+                self._reserved[box_id] = expiry
+            self._expiries.append((expiry, box_ids))
+    
+    def _expire(self, now: float) -> None:
+        """Forget spent boxes whose reservation has run out; caller holds the lock."""
+        while self._expiries and self._expiries[0][0] <= now:
+            expiry, box_ids = self._expiries.popleft()
+            for box_id in box_ids:
+                # Skip boxes released and reserved again since
+                if self._reserved.get(box_id) == expiry:
+                    del self._reserved[box_id]
+
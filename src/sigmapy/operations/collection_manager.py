@@ -14,10 +14,11 @@ https://docs.ergoplatform.com/dev/tokens/standards/eip24/
 from typing import Dict, List, Optional, Any, Union
 import logging
 from pathlib import Path
-import yaml
 
 from ..utils import AmountUtils
-from ..config import ConfigParser
+from ..config import ConfigParser, load_yaml_cached, write_json_sidecar
+from ..config._yaml_cache import yaml_load
+from ..config._template_data import COLLECTION_TEMPLATE
 
 try:
     import ergo_lib_python as ergo
@@ -27,6 +28,9 @@ except ImportError:
     ergo = None
 
 
+logger = logging.getLogger(__name__)
+
+
 class CollectionManager:
     """
     Collection management operations with EIP-24 compliance.
@@ -50,7 +54,7 @@ class CollectionManager:
         self.wallet_manager = wallet_manager
         self.network_manager = network_manager
         self.dry_run = dry_run
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
     
     def create_collection_token(
         self, 
@@ -112,12 +116,12 @@ class CollectionManager:
             # Real transaction
             return self._execute_collection_creation(token_metadata)
     
-    def create_collection_from_config(self, config_file: Union[str, Path]) -> str:
+    def create_collection_from_config(self, config_file: Union[str, Path, Dict[str, Any]]) -> str:
         """
         Create a collection token from a YAML configuration file.
         
         Args:
-            config_file: Path to YAML configuration file
+            config_file: Path to YAML configuration file or already-parsed config dict
             
         Returns:
             Transaction ID
@@ -133,10 +137,11 @@ class CollectionManager:
                 - address: "9fCharity..."
                   percentage: 15
         """
-        self.logger.info(f"Loading collection config from {config_file}")
-        
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        if isinstance(config_file, (str, Path)):
+            self.logger.info(f"Loading collection config from {config_file}")
+            config = load_yaml_cached(config_file)
+        else:
+            config = config_file
         
         collection = config.get('collection', {})
         
@@ -399,19 +404,21 @@ class CollectionManager:
         
         self.logger.info("=== END DRY RUN ===")
     
-    def validate_collection_config(self, config_file: Union[str, Path]) -> Dict[str, Any]:
+    def validate_collection_config(self, config_file: Union[str, Path, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Validate a collection configuration file.
         
         Args:
-            config_file: Path to YAML configuration file
+            config_file: Path to YAML configuration file or already-parsed config dict
             
         Returns:
             Validation result with summary
         """
         try:
-            with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
+            if isinstance(config_file, (str, Path)):
+                config = load_yaml_cached(config_file)
+            else:
+                config = config_file
             
             collection = config.get('collection', {})
             
@@ -481,30 +488,10 @@ class CollectionManager:
     
     def create_collection_template(self, output_file: Union[str, Path]):
         """Create a template collection configuration YAML file."""
-        template = {
-            "collection": {
-                "name": "My Art Collection",
-                "description": "A unique digital art collection",
-                "supply": 10000,
-                "royalties": [
-                    {
-                        "address": "9fArtistAddressHere...",
-                        "percentage": 85
-                    },
-                    {
-                        "address": "9fCharityAddressHere...",
-                        "percentage": 15
-                    }
-                ],
-                "additional_metadata": {
-                    "website": "https://example.com",
-                    "twitter": "@artcollection"
-                }
-            }
-        }
+        Path(output_file).write_bytes(COLLECTION_TEMPLATE)
         
-        with open(output_file, 'w') as f:
-            yaml.dump(template, f, default_flow_style=False, indent=2)
+        # Pre-seed the JSON side-car so the first load skips the YAML parse
+        write_json_sidecar(output_file, yaml_load(COLLECTION_TEMPLATE))
         
         self.logger.info(f"Collection configuration template created: {output_file}")
     
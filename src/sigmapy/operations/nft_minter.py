@@ -3,7 +3,7 @@ NFTMinter - EIP-24 compliant NFT minting operations
 
 This class provides methods for:
 - Single NFT minting with full EIP-24 register support (R4-R8)
-- Sequential collection minting (N transactions for N NFTs)
+- Concurrent collection minting (N transactions for N NFTs)
 - Artist identity verification through P2PK input chain
 - Complex trait and metadata handling
 
@@ -11,14 +11,17 @@ Based on EIP-24 Artwork Contract standard:
 https://docs.ergoplatform.com/dev/tokens/standards/eip24/
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import yaml
-import time
 
 from ..utils import AmountUtils
-from ..config import ConfigParser
+from ..config import ConfigParser, load_yaml_cached, write_json_sidecar
+from ..config._yaml_cache import yaml_load
+from ..config._template_data import NFT_COLLECTION_TEMPLATE
+from ._box_reservations import BoxReservations
 
 try:
     import ergo_lib_python as ergo
@@ -28,6 +31,9 @@ except ImportError:
     ergo = None
 
 
+logger = logging.getLogger(__name__)
+
+
 class NFTMinter:
     """
     NFT minting operations with full EIP-24 compliance.
@@ -40,6 +46,9 @@ class NFTMinter:
     # Minimum ERG per output box (Ergo protocol requirement)
     MIN_BOX_VALUE_NANOERG = 1_000_000  # 0.001 ERG
     
+    # Upper bound on NFTs built and broadcast concurrently by mint_nft_collection
+    MAX_MINT_WORKERS = 16
+    
     def __init__(self, wallet_manager, network_manager, dry_run: bool = False):
         """
         Initialize NFTMinter.
@@ -52,7 +61,11 @@ class NFTMinter:
         self.wallet_manager = wallet_manager
         self.network_manager = network_manager
         self.dry_run = dry_run
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
+        
+        # Concurrently minted NFTs never spend the same box; reserved
+        # boxes are skipped by later builds
+        self._reservations = BoxReservations()
     
     def mint_nft(
         self,
@@ -103,6 +116,22 @@ class NFTMinter:
         if royalties:
             self._validate_royalties(royalties)
         
+        return self._mint_validated_nft(
+            name, description, image_url, collection_token_id,
+            royalties, traits, additional_metadata
+        )
+    
+    def _mint_validated_nft(
+        self,
+        name: str,
+        description: str,
+        image_url: Optional[str] = None,
+        collection_token_id: Optional[str] = None,
+        royalties: Optional[List[Dict[str, Any]]] = None,
+        traits: Optional[Dict[str, Any]] = None,
+        additional_metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Mint an NFT whose royalties have already been validated."""
         # Build NFT metadata
         nft_metadata = self._build_nft_metadata(
             name, description, image_url, collection_token_id,
@@ -111,7 +140,7 @@ class NFTMinter:
         
         if self.dry_run:
             # Dry run mode
-            tx_data = self._build_nft_creation_transaction(nft_metadata)
+            tx_data = self._build_nft_creation_transaction(nft_metadata, reserve=False)
             self._log_dry_run_nft_creation(tx_data, name, collection_token_id)
             return "dry_run_nft_creation"
         else:
@@ -120,16 +149,26 @@ class NFTMinter:
     
     def mint_nft_collection(
         self,
-        collection_config: Union[str, Path, Dict[str, Any]]
+        collection_config: Union[str, Path, Dict[str, Any]],
+        max_in_flight: Optional[int] = None
     ) -> List[str]:
         """
-        Mint an entire NFT collection sequentially.
+        Mint an entire NFT collection, one transaction per NFT.
+        
+        NFTs are built and broadcast concurrently on a bounded thread pool.
+        UTXO selection is serialized so no two mints spend the same input
+        box; the wallet therefore needs a separate box for every NFT in
+        flight. A failed NFT is logged with its index and does not stop
+        the others.
         
         Args:
             collection_config: Path to YAML config file or config dict
+            max_in_flight: NFTs minted concurrently (default MAX_MINT_WORKERS);
+                pass 1 to mint strictly one after another
             
         Returns:
-            List of transaction IDs (one per NFT)
+            List of transaction IDs for the successfully minted NFTs,
+            in config order
             
         Example config:
             collection:
@@ -150,8 +189,7 @@ class NFTMinter:
         """
         if isinstance(collection_config, (str, Path)):
             self.logger.info(f"Loading collection config from {collection_config}")
-            with open(collection_config, 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_yaml_cached(collection_config)
         else:
             config = collection_config
         
@@ -164,46 +202,72 @@ class NFTMinter:
         if not nfts:
             raise ValueError("No NFTs specified in configuration")
         
-        self.logger.info(f"Minting {len(nfts)} NFTs sequentially")
+        max_in_flight = max_in_flight or self.MAX_MINT_WORKERS
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive")
+        
+        self.logger.info(f"Minting {len(nfts)} NFTs, up to {max_in_flight} at a time")
         if collection_token_id:
             self.logger.info(f"Collection token: {collection_token_id}")
         
         transaction_ids = []
         failed_nfts = []
         
-        for i, nft_config in enumerate(nfts):
+        # Collection-wide royalties are shared by every NFT that does not
+        # override them, so validate them once rather than once per NFT
+        base_royalties = base_metadata.get('royalties')
+        base_royalties_error = None
+        if base_royalties:
+            self.logger.info(f"Royalties: {len(base_royalties)} recipients")
             try:
-                self.logger.info(f"Minting NFT {i+1}/{len(nfts)}: {nft_config.get('name', f'NFT #{i+1}')}")
-                
-                # Merge base metadata with NFT-specific metadata
-                merged_metadata = {**base_metadata, **nft_config}
-                
-                tx_id = self.mint_nft(
-                    name=merged_metadata.get('name', f'NFT #{i+1}'),
-                    description=merged_metadata.get('description', ''),
-                    image_url=merged_metadata.get('image_url'),
-                    collection_token_id=collection_token_id,
-                    royalties=merged_metadata.get('royalties'),
-                    traits=merged_metadata.get('traits'),
-                    additional_metadata=merged_metadata.get('additional_metadata')
-                )
-                
-                transaction_ids.append(tx_id)
-                
-                # Add delay between transactions in live mode to avoid overwhelming node
-                if not self.dry_run and i < len(nfts) - 1:
-                    time.sleep(2)
-                
+                self._validate_royalties(base_royalties)
+            except ValueError as e:
+                base_royalties_error = e
+        
+        def mint(i: int, nft_config: Dict[str, Any]) -> str:
+            self.logger.info(f"Minting NFT {i+1}/{len(nfts)}: {nft_config.get('name', f'NFT #{i+1}')}")
+            
+            # Merge base metadata with NFT-specific metadata
+            merged_metadata = {**base_metadata, **nft_config}
+            
+            royalties = merged_metadata.get('royalties')
+            if royalties is base_royalties:
+                if base_royalties_error:
+                    raise base_royalties_error
+            elif royalties:
+                self._validate_royalties(royalties)
+            
+            return self._mint_validated_nft(
+                name=merged_metadata.get('name', f'NFT #{i+1}'),
+                description=merged_metadata.get('description', ''),
+                image_url=merged_metadata.get('image_url'),
+                collection_token_id=collection_token_id,
+                royalties=royalties,
+                traits=merged_metadata.get('traits'),
+                additional_metadata=merged_metadata.get('additional_metadata')
+            )
+        
+        def collect(i: int, future) -> None:
+            try:
+                transaction_ids.append(future.result())
             except Exception as e:
                 self.logger.error(f"Failed to mint NFT {i+1}: {e}")
                 failed_nfts.append({
                     'index': i+1,
-                    'name': nft_config.get('name', f'NFT #{i+1}'),
+                    'name': nfts[i].get('name', f'NFT #{i+1}'),
                     'error': str(e)
                 })
-                
-                # Continue with remaining NFTs
-                continue
+        
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for i, nft_config in enumerate(nfts):
+                # Bound in-flight mints so the node is never flooded
+                if len(pending) >= max_in_flight:
+                    collect(*pending.popleft())
+                pending.append((i, executor.submit(mint, i, nft_config)))
+            
+            while pending:
+                collect(*pending.popleft())
         
         self.logger.info(f"Collection minting completed: {len(transaction_ids)} successful, {len(failed_nfts)} failed")
         
@@ -250,8 +314,13 @@ class NFTMinter:
         
         return metadata
     
-    def _build_nft_creation_transaction(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
-        """Build an NFT creation transaction."""
+    def _build_nft_creation_transaction(self, metadata: Dict[str, Any], reserve: bool = True) -> Dict[str, Any]:
+        """
+        Build an NFT creation transaction.
+        
+        With ``reserve`` the selected inputs stay reserved until the caller
+        releases them (or the transaction is broadcast); dry runs pass False.
+        """
         if not ERGO_LIB_AVAILABLE:
             # Demo mode transaction
             return {
@@ -272,14 +341,25 @@ class NFTMinter:
             
             # Calculate ERG needed (minimum box value + fee)
             total_erg_needed = self.MIN_BOX_VALUE_NANOERG + fee_nanoerg
-            selected_utxos, available_erg = self._select_erg_utxos(sender_utxos, total_erg_needed)
             
-            if available_erg < total_erg_needed:
-                raise ValueError(
-                    f"Insufficient ERG: need {AmountUtils.nanoerg_to_erg(total_erg_needed)}, "
-                    f"have {AmountUtils.nanoerg_to_erg(available_erg)}"
-                )
+            def select(available_utxos: List[Dict]) -> Tuple[List[Dict], int]:
+                selected_utxos, available_erg = self._select_erg_utxos(available_utxos, total_erg_needed)
+                
+                if available_erg < total_erg_needed:
+                    raise ValueError(
+                        f"Insufficient ERG: need {AmountUtils.nanoerg_to_erg(total_erg_needed)}, "
+                        f"have {AmountUtils.nanoerg_to_erg(available_erg)}"
+                    )
+                
+                return selected_utxos, available_erg
             
+            selected_utxos, available_erg = self._reservations.claim(sender_utxos, select, reserve)
+        except Exception as e:
+            self.logger.error(f"Failed to build NFT creation transaction: {e}")
+            raise
+        
+        input_box_ids = [utxo['box_id'] for utxo in selected_utxos]
+        try:
             # Add inputs
             for utxo in selected_utxos:
                 tx_builder.add_input(self._utxo_to_input(utxo))
@@ -301,6 +381,7 @@ class NFTMinter:
             
             return {
                 "unsigned_tx": unsigned_tx,
+                "input_box_ids": input_box_ids,
                 "metadata": metadata,
                 "fee_nanoerg": fee_nanoerg,
                 "total_erg": total_erg_needed,
@@ -309,6 +390,8 @@ class NFTMinter:
             
         except Exception as e:
             self.logger.error(f"Failed to build NFT creation transaction: {e}")
+            if reserve:
+                self._reservations.release(input_box_ids)
             raise
     
     def _execute_nft_creation(self, metadata: Dict[str, Any]) -> str:
@@ -317,14 +400,23 @@ class NFTMinter:
             # Build transaction
             tx_data = self._build_nft_creation_transaction(metadata)
             
-            # Sign transaction
-            if not tx_data.get("demo_mode", False):
-                signed_tx = self.wallet_manager.sign_transaction(tx_data["unsigned_tx"])
-            else:
-                signed_tx = tx_data
-            
-            # Broadcast transaction
-            tx_id = self.network_manager.broadcast_transaction(signed_tx)
+            tx_id = None
+            try:
+                # Sign transaction
+                if not tx_data.get("demo_mode", False):
+                    signed_tx = self.wallet_manager.sign_transaction(tx_data["unsigned_tx"])
+                else:
+                    signed_tx = tx_data
+                
+                # Broadcast transaction
+                tx_id = self.network_manager.broadcast_transaction(signed_tx)
+            finally:
+                if tx_id is None:
+                    # Inputs were not spent - make them available to other mints
+                    self._reservations.release(tx_data.get("input_box_ids", []))
+                else:
+                    # Spent; keep them reserved only until the node has caught up
+                    self._reservations.mark_spent(tx_data.get("input_box_ids", []))
             
             self.logger.info(f"NFT created. Transaction ID: {tx_id}")
             return tx_id
@@ -504,19 +596,21 @@ class NFTMinter:
         
         self.logger.info("=== END DRY RUN ===")
     
-    def validate_nft_collection_config(self, config_file: Union[str, Path]) -> Dict[str, Any]:
+    def validate_nft_collection_config(self, config_file: Union[str, Path, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Validate an NFT collection configuration file.
         
         Args:
-            config_file: Path to YAML configuration file
+            config_file: Path to YAML configuration file or already-parsed config dict
             
         Returns:
             Validation result with summary
         """
         try:
-            with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
+            if isinstance(config_file, (str, Path)):
+                config = load_yaml_cached(config_file)
+            else:
+                config = config_file
             
             collection = config.get('collection', {})
             nfts = config.get('nfts', [])
@@ -586,85 +680,10 @@ class NFTMinter:
     
     def create_nft_collection_template(self, output_file: Union[str, Path]):
         """Create a template NFT collection configuration YAML file."""
-        template = {
-            "collection": {
-                "token_id": "your_collection_token_id_here",
-                "base_metadata": {
-                    "description": "A unique digital art collection",
-                    "royalties": [
-                        {
-                            "address": "9fArtistAddressHere...",
-                            "percentage": 85
-                        },
-                        {
-                            "address": "9fCharityAddressHere...",
-                            "percentage": 15
-                        }
-                    ]
-                }
-            },
-            "nfts": [
-                {
-                    "name": "Art #1",
-                    "description": "First artwork in collection",
-                    "image_url": "https://example.com/art1.png",
-                    "traits": {
-                        "properties": {
-                            "background": "blue",
-                            "style": "abstract",
-                            "artist": "Jane Doe"
-                        },
-                        "levels": {
-                            "rarity": {
-                                "value": 85,
-                                "max": 100
-                            },
-                            "complexity": {
-                                "value": 7,
-                                "max": 10
-                            }
-                        },
-                        "stats": {
-                            "creation_year": 2024,
-                            "edition": 1
-                        }
-                    },
-                    "additional_metadata": {
-                        "explicit": False,
-                        "tags": ["art", "digital", "collectible"]
-                    }
-                },
-                {
-                    "name": "Art #2",
-                    "description": "Second artwork in collection",
-                    "image_url": "https://example.com/art2.png",
-                    "traits": {
-                        "properties": {
-                            "background": "red",
-                            "style": "minimalist",
-                            "artist": "Jane Doe"
-                        },
-                        "levels": {
-                            "rarity": {
-                                "value": 92,
-                                "max": 100
-                            },
-                            "complexity": {
-                                "value": 5,
-                                "max": 10
-                            }
-                        },
-                        "stats": {
-                            "creation_year": 2024,
-                            "edition": 2
-                        }
-                    }
-                }
-            ]
-        }
+        Path(output_file).write_bytes(NFT_COLLECTION_TEMPLATE)
         
-        with open(output_file, 'w') as f:
-            yaml.dump(template, f, default_flow_style=False, indent=2)
+        # Pre-seed the JSON side-car so the first load skips the YAML parse
+        write_json_sidecar(output_file, yaml_load(NFT_COLLECTION_TEMPLATE))
         
         self.logger.info(f"NFT collection configuration template created: {output_file}")
     
@@ -18,6 +18,9 @@ from decimal import Decimal
 from ..utils import AmountUtils
 
 
+logger = logging.getLogger(__name__)
+
+
 class RoyaltyManager:
     """
     Royalty structure management with EIP-24 compliance.
@@ -29,7 +32,7 @@ class RoyaltyManager:
     
     def __init__(self):
         """Initialize RoyaltyManager."""
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
     
     def create_royalty_structure(
         self,
@@ -250,28 +253,29 @@ class RoyaltyManager:
                 "remaining_to_seller_erg": sale_amount_erg
             }
         
-        distributions = []
-        total_royalties = 0
+        percentages = [recipient.get('percentage', 0) for recipient in recipients]
+        royalty_amounts = [(sale_amount_erg * percentage) / 100 for percentage in percentages]
+        royalty_nanoergs = AmountUtils.erg_to_nanoerg_batch(royalty_amounts)
+        total_royalties = sum(royalty_amounts)
         
-        for recipient in recipients:
-            percentage = recipient.get('percentage', 0)
-            royalty_amount = (sale_amount_erg * percentage) / 100
-            total_royalties += royalty_amount
-            
-            distributions.append({
+        distributions = [
+            {
                 "address": recipient['address'],
                 "name": recipient.get('name', 'Unknown'),
                 "percentage": percentage,
                 "amount_erg": royalty_amount,
-                "amount_nanoerg": AmountUtils.erg_to_nanoerg(royalty_amount)
-            })
+                "amount_nanoerg": royalty_nanoerg
+            }
+            for recipient, percentage, royalty_amount, royalty_nanoerg
+            in zip(recipients, percentages, royalty_amounts, royalty_nanoergs)
+        ]
         
         remaining_to_seller = sale_amount_erg - total_royalties
         
         return {
             "sale_amount_erg": sale_amount_erg,
             "total_royalties_erg": total_royalties,
-            "total_royalty_percentage": sum(r.get('percentage', 0) for r in recipients),
+            "total_royalty_percentage": sum(percentages),
             "distributions": distributions,
             "remaining_to_seller_erg": remaining_to_seller,
             "recipient_count": len(distributions)
@@ -8,14 +8,18 @@ This class provides methods for:
 - Airdrop functionality with YAML config support
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, zip_longest
 import logging
 from pathlib import Path
 import math
-import yaml
 
 from ..utils import AmountUtils
-from ..config import ConfigParser
+from ..config import ConfigParser, ParserCache, file_digest, stream_sequence
+from ..config._template_data import TOKEN_DISTRIBUTION_TEMPLATE
+from ._box_reservations import BoxReservations
 
 try:
     import ergo_lib_python as ergo
@@ -25,6 +29,9 @@ except ImportError:
     ergo = None
 
 
+logger = logging.getLogger(__name__)
+
+
 class TokenManager:
     """
     Token management operations with real blockchain integration.
@@ -36,7 +43,28 @@ class TokenManager:
     # Minimum ERG per output box (Ergo protocol requirement)
     MIN_BOX_VALUE_NANOERG = 1_000_000  # 0.001 ERG
     
-    def __init__(self, wallet_manager, network_manager, dry_run: bool = False):
+    # Airdrop batching: recipients packed into each transaction and
+    # concurrent submissions; fewer, larger transactions mean fewer fees
+    MAX_OUTPUTS_PER_TX = 100
+    AIRDROP_BATCH_SIZE = MAX_OUTPUTS_PER_TX
+    MAX_AIRDROP_WORKERS = 16
+    
+    # Validation summaries kept per config file (keyed on the file's content digest)
+    VALIDATION_CACHE_SIZE = 32
+    
+    # Coin selection: "auto" switches to the single-pass selector for large
+    # wallets; inputs per transaction are capped either way in single-pass mode
+    SELECTION_STRATEGIES = ("auto", "single_pass")
+    SINGLE_PASS_UTXO_THRESHOLD = 1000
+    MAX_INPUTS_PER_TX = 3000
+    
+    def __init__(
+        self,
+        wallet_manager,
+        network_manager,
+        dry_run: bool = False,
+        selection_strategy: str = "auto"
+    ):
         """
         Initialize TokenManager.
         
@@ -44,18 +72,45 @@ class TokenManager:
             wallet_manager: WalletManager instance for signing
             network_manager: NetworkManager instance for broadcasting
             dry_run: If True, build transactions but don't broadcast
+            selection_strategy: "auto" to use the single-pass input selector
+                only for wallets with many UTXOs, "single_pass" to always use it
         """
+        self.check_selection_strategy(selection_strategy)
+        
         self.wallet_manager = wallet_manager
         self.network_manager = network_manager
         self.dry_run = dry_run
-        self.logger = logging.getLogger(__name__)
+        self.selection_strategy = selection_strategy
+        self.logger = logger
+        
+        # Concurrently built transactions never spend the same box;
+        # reserved boxes are skipped by later builds
+        self._reservations = BoxReservations()
+        
+        self._validation_cache = OrderedDict()
     
-    def distribute_tokens_from_config(self, config_file: Union[str, Path]) -> str:
+    @classmethod
+    def check_selection_strategy(cls, selection_strategy: str) -> None:
+        """Raise ValueError unless selection_strategy is one of SELECTION_STRATEGIES."""
+        if selection_strategy not in cls.SELECTION_STRATEGIES:
+            raise ValueError(
+                f"Invalid selection_strategy: {selection_strategy}. "
+                f"Must be one of {', '.join(cls.SELECTION_STRATEGIES)}"
+            )
+    
+    def distribute_tokens_from_config(
+        self,
+        config_file: Union[str, Path, Dict[str, Any]],
+        validate: bool = True
+    ) -> str:
         """
         Distribute tokens according to a YAML configuration file.
         
         Args:
-            config_file: Path to YAML configuration file
+            config_file: Path to YAML configuration file or already-parsed config dict
+            validate: Pre-validate every recipient address. Pass False when the
+                config has just been checked with validate_distribution_config;
+                invalid addresses are then only rejected while building outputs.
             
         Returns:
             Transaction ID (single transaction for all recipients)
@@ -69,11 +124,13 @@ class TokenManager:
                 amount: 100
                 note: "Community member"
         """
-        self.logger.info(f"Loading token distribution config from {config_file}")
-        
         # Load configuration
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        if isinstance(config_file, (str, Path)):
+            self.logger.info(f"Loading token distribution config from {config_file}")
+            # The config is only read, so share the cached parse instead of copying it
+            config = ParserCache.view(config_file)
+        else:
+            config = config_file
         
         distribution = config.get('distribution', {})
         recipients = config.get('recipients', [])
@@ -93,11 +150,11 @@ class TokenManager:
         self.logger.info(f"Token decimals from node: {decimals}")
         self.logger.info(f"Transaction fee: {fee_per_tx} ERG")
         
-        # Validate all addresses
-        for recipient in recipients:
-            address = recipient['address']
-            if not self.wallet_manager.validate_address(address):
-                raise ValueError(f"Invalid address: {address}")
+        # Validate all addresses, keeping the decoded form for output building
+        if validate:
+            decoded_addresses = self._decode_addresses(r['address'] for r in recipients)
+        else:
+            decoded_addresses = None
         
         # Validate token amounts considering decimals
         for i, recipient in enumerate(recipients):
@@ -119,19 +176,43 @@ class TokenManager:
         if self.dry_run:
             # Dry run mode - build transaction but don't broadcast
             tx_data = self._build_token_distribution_transaction(
-                token_id, recipients, fee_per_tx, token_info
+                token_id, recipients, fee_per_tx, token_info, decoded_addresses,
+                reserve=False
             )
             self._log_dry_run_transaction(tx_data, recipients, token_info)
             tx_id = "dry_run_single_transaction"
         else:
             # Real transaction
             tx_id = self._execute_token_distribution_batch(
-                token_id, recipients, fee_per_tx, token_info
+                token_id, recipients, fee_per_tx, token_info, decoded_addresses
             )
         
         self.logger.info(f"Token distribution completed. Transaction created: {tx_id}")
         return tx_id
     
+    def _decode_addresses(self, addresses: Iterable[str]) -> Dict[str, Any]:
+        """
+        Validate and decode each distinct address exactly once.
+        
+        Args:
+            addresses: Recipient addresses (duplicates are decoded once)
+            
+        Returns:
+            Mapping of address string to its decoded form
+            
+        Raises:
+            ValueError: On the first invalid address
+        """
+        decoded = {}
+        for address in addresses:
+            if address in decoded:
+                continue
+            parsed = self.wallet_manager.parse_address(address)
+            if parsed is None:
+                raise ValueError(f"Invalid address: {address}")
+            decoded[address] = parsed
+        return decoded
+    
     def _get_token_info(self, token_id: str) -> Dict[str, Any]:
         """
         Get token information from the Ergo node.
@@ -227,6 +308,18 @@ class TokenManager:
         smallest_unit_amount = amount * (10 ** decimals)
         return int(smallest_unit_amount)
     
+    @staticmethod
+    def _convert_token_amounts_to_smallest_unit(
+        amounts: List[Union[int, float]],
+        decimals: int
+    ) -> List[int]:
+        """Convert a whole column of token amounts to smallest units in one pass."""
+        if decimals == 0:
+            return [int(amount) for amount in amounts]
+        
+        scale = 10 ** decimals
+        return [int(amount * scale) for amount in amounts]
+    
     def _format_token_amount_for_display(self, amount: int, decimals: int) -> str:
         """
         Format token amount for display considering decimals.
@@ -255,26 +348,38 @@ class TokenManager:
         token_id: str, 
         recipients: List[Dict], 
         fee_erg: float,
-        token_info: Optional[Dict[str, Any]] = None
+        token_info: Optional[Dict[str, Any]] = None,
+        decoded_addresses: Optional[Dict[str, Any]] = None,
+        reserve: bool = True
     ) -> Dict[str, Any]:
-        """Build a token distribution transaction."""
+        """
+        Build a token distribution transaction.
+        
+        ``decoded_addresses`` maps recipient addresses to their already
+        decoded form (see ``_decode_addresses``) so outputs are built
+        without decoding each address a second time.
+        
+        With ``reserve`` the selected inputs stay reserved until the caller
+        releases them (or the transaction is broadcast); dry runs pass False.
+        """
+        if decoded_addresses is None:
+            decoded_addresses = {}
+        
         if token_info is None:
             token_info = self._get_token_info(token_id)
         
         decimals = token_info.get('decimals', 0)
         
-        # Convert amounts to smallest units for transaction
-        converted_recipients = []
-        total_tokens_smallest_unit = 0
+        # Split recipients into parallel columns and convert all amounts at once
+        addresses = [recipient['address'] for recipient in recipients]
+        amounts = [recipient['amount'] for recipient in recipients]
+        token_amounts = self._convert_token_amounts_to_smallest_unit(amounts, decimals)
+        total_tokens_smallest_unit = sum(token_amounts)
         
-        for recipient in recipients:
-            amount = recipient['amount']
-            amount_smallest_unit = self._convert_token_amount_to_smallest_unit(amount, decimals)
-            converted_recipients.append({
-                **recipient,
-                'amount_smallest_unit': amount_smallest_unit
-            })
-            total_tokens_smallest_unit += amount_smallest_unit
+        converted_recipients = [
+            {**recipient, 'amount_smallest_unit': amount_smallest_unit}
+            for recipient, amount_smallest_unit in zip(recipients, token_amounts)
+        ]
         
         if not ERGO_LIB_AVAILABLE:
             # Demo mode transaction
@@ -284,57 +389,78 @@ class TokenManager:
                 "recipients": converted_recipients,
                 "fee_nanoerg": AmountUtils.erg_to_nanoerg(fee_erg),
                 "total_tokens": total_tokens_smallest_unit,
-                "total_tokens_display": sum(r['amount'] for r in recipients),
+                "total_tokens_display": sum(amounts),
                 "outputs": len(recipients),
                 "demo_mode": True,
                 "token_info": token_info
             }
         
         try:
-            # Get sender address and UTXOs
+            # Get sender address
             sender_address = self.wallet_manager.get_primary_address()
-            sender_utxos = self.network_manager.get_address_utxos(sender_address)
             
             # Create transaction builder
             tx_builder = ergo.TxBuilder()
             fee_nanoerg = AmountUtils.erg_to_nanoerg(fee_erg)
             
-            # Find UTXOs with the required tokens (in smallest units)
-            selected_utxos, available_tokens = self._select_token_utxos(
-                sender_utxos, token_id, total_tokens_smallest_unit
-            )
-            
-            if available_tokens < total_tokens_smallest_unit:
-                display_needed = self._format_token_amount_for_display(total_tokens_smallest_unit, decimals)
-                display_available = self._format_token_amount_for_display(available_tokens, decimals)
-                raise ValueError(
-                    f"Insufficient tokens: need {display_needed}, have {display_available}"
-                )
-            
             # Calculate total ERG needed (minimum box values + fee)
             total_erg_needed = len(recipients) * self.MIN_BOX_VALUE_NANOERG + fee_nanoerg
-            selected_utxos, available_erg = self._select_erg_utxos(
-                sender_utxos, total_erg_needed, selected_utxos
-            )
             
-            if available_erg < total_erg_needed:
-                raise ValueError(
-                    f"Insufficient ERG: need {AmountUtils.nanoerg_to_erg(total_erg_needed)}, "
-                    f"have {AmountUtils.nanoerg_to_erg(available_erg)}"
-                )
+            def select(sender_utxos: List[Dict]) -> Tuple[List[Dict], int, int]:
+                if (
+                    self.selection_strategy == "single_pass"
+                    or len(sender_utxos) > self.SINGLE_PASS_UTXO_THRESHOLD
+                ):
+                    selected_utxos, available_erg, available_tokens = self._single_pass_select(
+                        sender_utxos, total_erg_needed, token_id, total_tokens_smallest_unit
+                    )
+                else:
+                    # Find UTXOs with the required tokens (in smallest units)
+                    selected_utxos, available_tokens = self._select_token_utxos(
+                        sender_utxos, token_id, total_tokens_smallest_unit
+                    )
+                    selected_utxos, available_erg = self._select_erg_utxos(
+                        sender_utxos, total_erg_needed, selected_utxos
+                    )
+                
+                if available_tokens < total_tokens_smallest_unit:
+                    display_needed = self._format_token_amount_for_display(total_tokens_smallest_unit, decimals)
+                    display_available = self._format_token_amount_for_display(available_tokens, decimals)
+                    raise ValueError(
+                        f"Insufficient tokens: need {display_needed}, have {display_available}"
+                    )
+                
+                if available_erg < total_erg_needed:
+                    raise ValueError(
+                        f"Insufficient ERG: need {AmountUtils.nanoerg_to_erg(total_erg_needed)}, "
+                        f"have {AmountUtils.nanoerg_to_erg(available_erg)}"
+                    )
+                
+                return selected_utxos, available_erg, available_tokens
             
+            # Fetched outside the reservation lock; only selection is serialized
+            sender_utxos = self.network_manager.get_address_utxos(sender_address)
+            selected_utxos, available_erg, available_tokens = self._reservations.claim(
+                sender_utxos, select, reserve
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to build token distribution transaction: {e}")
+            raise
+        
+        input_box_ids = [utxo['box_id'] for utxo in selected_utxos]
+        try:
             # Add inputs
             for utxo in selected_utxos:
                 tx_builder.add_input(self._utxo_to_input(utxo))
             
             # Add outputs for recipients (using smallest units)
-            for recipient in converted_recipients:
-                output = self._create_token_output(
-                    recipient['address'], 
-                    token_id, 
-                    recipient['amount_smallest_unit'],
-                    self.MIN_BOX_VALUE_NANOERG
-                )
+            outputs = self._create_token_outputs(
+                [decoded_addresses.get(address, address) for address in addresses],
+                token_id,
+                token_amounts,
+                self.MIN_BOX_VALUE_NANOERG
+            )
+            for output in outputs:
                 tx_builder.add_output(output)
             
             # Add change output if needed
@@ -352,11 +478,12 @@ class TokenManager:
             
             return {
                 "unsigned_tx": unsigned_tx,
+                "input_box_ids": input_box_ids,
                 "token_id": token_id,
                 "recipients": converted_recipients,
                 "fee_nanoerg": fee_nanoerg,
                 "total_tokens": total_tokens_smallest_unit,
-                "total_tokens_display": sum(r['amount'] for r in recipients),
+                "total_tokens_display": sum(amounts),
                 "total_erg": total_erg_needed,
                 "demo_mode": False,
                 "token_info": token_info
@@ -364,6 +491,8 @@ class TokenManager:
             
         except Exception as e:
             self.logger.error(f"Failed to build token distribution transaction: {e}")
+            if reserve:
+                self._reservations.release(input_box_ids)
             raise
     
     def _execute_token_distribution_batch(
@@ -371,21 +500,33 @@ class TokenManager:
         token_id: str, 
         recipients: List[Dict], 
         fee_erg: float,
-        token_info: Optional[Dict[str, Any]] = None
+        token_info: Optional[Dict[str, Any]] = None,
+        decoded_addresses: Optional[Dict[str, Any]] = None
     ) -> str:
         """Execute a batch of token distribution."""
         try:
             # Build transaction
-            tx_data = self._build_token_distribution_transaction(token_id, recipients, fee_erg, token_info)
-            
-            # Sign transaction
-            if not tx_data.get("demo_mode", False):
-                signed_tx = self.wallet_manager.sign_transaction(tx_data["unsigned_tx"])
-            else:
-                signed_tx = tx_data
+            tx_data = self._build_token_distribution_transaction(
+                token_id, recipients, fee_erg, token_info, decoded_addresses
+            )
             
-            # Broadcast transaction
-            tx_id = self.network_manager.broadcast_transaction(signed_tx)
+            tx_id = None
+            try:
+                # Sign transaction
+                if not tx_data.get("demo_mode", False):
+                    signed_tx = self.wallet_manager.sign_transaction(tx_data["unsigned_tx"])
+                else:
+                    signed_tx = tx_data
+                
+                # Broadcast transaction
+                tx_id = self.network_manager.broadcast_transaction(signed_tx)
+            finally:
+                if tx_id is None:
+                    # Inputs were not spent - make them available to other batches
+                    self._reservations.release(tx_data.get("input_box_ids", []))
+                else:
+                    # Spent; keep them reserved only until the node has caught up
+                    self._reservations.mark_spent(tx_data.get("input_box_ids", []))
             
             self.logger.info(f"Token distribution batch completed. Transaction ID: {tx_id}")
             return tx_id
@@ -414,6 +555,54 @@ class TokenManager:
         
         return selected, total_tokens
     
+    def _single_pass_select(
+        self,
+        utxos: List[Dict],
+        erg_needed: int,
+        token_id: str,
+        tokens_needed: int,
+        max_inputs: Optional[int] = None
+    ) -> Tuple[List[Dict], int, int]:
+        """
+        Select inputs covering both the token and ERG requirement in one scan.
+        
+        UTXOs are taken in the order the node returned them (no sorting): a
+        box is selected if it holds the token while tokens are still short,
+        or if ERG is still short. Scanning stops as soon as both are covered
+        or ``max_inputs`` boxes have been selected.
+        
+        Returns:
+            Tuple of (selected UTXOs, total ERG selected, total tokens selected)
+        """
+        if max_inputs is None:
+            max_inputs = self.MAX_INPUTS_PER_TX
+        
+        selected = []
+        total_erg = 0
+        total_tokens = 0
+        
+        for utxo in utxos:
+            if total_erg >= erg_needed and total_tokens >= tokens_needed:
+                break
+            if len(selected) >= max_inputs:
+                self.logger.warning(
+                    f"Input selection stopped at {max_inputs} inputs before covering the requirement"
+                )
+                break
+            
+            token_amount = 0
+            if total_tokens < tokens_needed:
+                for token in utxo.get('tokens', []):
+                    if token.get('tokenId') == token_id or token.get('id') == token_id:
+                        token_amount += token.get('amount', 0)
+            
+            if token_amount or total_erg < erg_needed:
+                selected.append(utxo)
+                total_erg += utxo['value']
+                total_tokens += token_amount
+        
+        return selected, total_erg, total_tokens
+    
     def _select_erg_utxos(
         self, 
         utxos: List[Dict], 
@@ -435,28 +624,42 @@ class TokenManager:
         
         return selected, total_erg
     
-    def _create_token_output(self, address: str, token_id: str, token_amount: int, erg_value: int):
-        """Create an output containing tokens."""
+    def _create_token_outputs(
+        self,
+        addresses: List[Union[str, Any]],
+        token_id: str,
+        token_amounts: List[int],
+        erg_value: int
+    ) -> List[Any]:
+        """
+        Create one token output per recipient from parallel address/amount lists.
+        
+        The token ID and box value are parsed once for the whole batch rather
+        than once per output. Addresses may be pre-decoded.
+        """
         if not ERGO_LIB_AVAILABLE:
-            return {
-                "address": address,
-                "value": erg_value,
-                "tokens": [{"id": token_id, "amount": token_amount}]
-            }
+            return [
+                {
+                    "address": address,
+                    "value": erg_value,
+                    "tokens": [{"id": token_id, "amount": token_amount}]
+                }
+                for address, token_amount in zip(addresses, token_amounts)
+            ]
         
-        # Create actual ergo-lib output
-        addr = ergo.Address.from_base58(address)
+        ergo_token_id = ergo.TokenId.from_str(token_id)
         value = ergo.BoxValue.from_i64(erg_value)
         
-        # Create token
-        token = ergo.Token(ergo.TokenId.from_str(token_id), ergo.TokenAmount.from_i64(token_amount))
-        tokens = ergo.Tokens([token])
-        
-        # Create output
-        output_builder = ergo.ErgoBoxCandidateBuilder(value, addr)
-        output_builder.set_tokens(tokens)
+        outputs = []
+        for address, token_amount in zip(addresses, token_amounts):
+            addr = ergo.Address.from_base58(address) if isinstance(address, str) else address
+            token = ergo.Token(ergo_token_id, ergo.TokenAmount.from_i64(token_amount))
+            
+            output_builder = ergo.ErgoBoxCandidateBuilder(value, addr)
+            output_builder.set_tokens(ergo.Tokens([token]))
+            outputs.append(output_builder.build())
         
-        return output_builder.build()
+        return outputs
     
     def _create_change_output(self, address: str, erg_value: int, token_id: str, token_amount: int):
         """Create a change output."""
@@ -531,19 +734,61 @@ class TokenManager:
         
         self.logger.info("=== END DRY RUN ===")
     
-    def validate_distribution_config(self, config_file: Union[str, Path]) -> Dict[str, Any]:
+    def validate_distribution_config(self, config_file: Union[str, Path, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Validate a token distribution configuration file.
         
         Args:
-            config_file: Path to YAML configuration file
+            config_file: Path to YAML configuration file or already-parsed config dict
             
         Returns:
             Validation result with summary
         """
+        if not isinstance(config_file, (str, Path)):
+            return self._validate_distribution_config(config_file)
+        
+        try:
+            cache_key, _ = file_digest(config_file)
+        except OSError:
+            cache_key = None
+        
+        if cache_key in self._validation_cache:
+            self._validation_cache.move_to_end(cache_key)
+            return self._copy_summary(self._validation_cache[cache_key])
+        
+        summary = self._validate_distribution_config(config_file)
+        
+        if cache_key is not None and summary.get("total_recipients") is not None:
+            self._validation_cache[cache_key] = self._copy_summary(summary)
+            if len(self._validation_cache) > self.VALIDATION_CACHE_SIZE:
+                self._validation_cache.popitem(last=False)
+        
+        return summary
+    
+    @staticmethod
+    def _recipient_columns(recipients: List[Dict[str, Any]]) -> Tuple[List[Optional[str]], List[Any]]:
+        """Split recipient records into parallel address and amount columns (None if absent)."""
+        addresses = [recipient.get('address') for recipient in recipients]
+        amounts = [recipient.get('amount') for recipient in recipients]
+        return addresses, amounts
+    
+    @staticmethod
+    def _copy_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a validation summary; only its error and warning lists are mutable."""
+        return {
+            **summary,
+            "errors": list(summary["errors"]),
+            "warnings": list(summary["warnings"]),
+        }
+    
+    def _validate_distribution_config(self, config_file: Union[str, Path, Dict[str, Any]]) -> Dict[str, Any]:
+        """Validate a distribution config without consulting the cache."""
         try:
-            with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
+            if isinstance(config_file, (str, Path)):
+                # Validation only reads the config, so share the cached parse
+                config = ParserCache.view(config_file)
+            else:
+                config = config_file
             
             distribution = config.get('distribution', {})
             recipients = config.get('recipients', [])
@@ -558,31 +803,56 @@ class TokenManager:
             if not recipients:
                 errors.append("No recipients specified")
             
-            # Validate addresses
+            # Work on parallel columns rather than walking the records repeatedly
+            addresses, amounts = self._recipient_columns(recipients)
+            total_tokens = sum(amount for amount in amounts if amount is not None)
+            
+            # Validate addresses - each distinct address is checked only once
+            address_counts = Counter(address for address in addresses if address is not None)
+            distinct_addresses = list(address_counts)
+            address_valid = dict(zip(
+                distinct_addresses,
+                self.wallet_manager.validate_addresses(distinct_addresses)
+            ))
+            
             invalid_addresses = []
-            for i, recipient in enumerate(recipients):
-                if 'address' not in recipient:
-                    errors.append(f"Missing address for recipient {i+1}")
+            for i, (address, amount) in enumerate(zip(addresses, amounts), 1):
+                if address is None:
+                    errors.append(f"Missing address for recipient {i}")
                     continue
                 
-                if not self.wallet_manager.validate_address(recipient['address']):
-                    invalid_addresses.append(f"Recipient {i+1}: {recipient['address']}")
+                if not address_valid[address]:
+                    invalid_addresses.append(f"Recipient {i}: {address}")
                 
-                if 'amount' not in recipient or recipient['amount'] <= 0:
-                    errors.append(f"Invalid amount for recipient {i+1}")
+                if amount is None or amount <= 0:
+                    errors.append(f"Invalid amount for recipient {i}")
             
             if invalid_addresses:
                 errors.extend([f"Invalid address: {addr}" for addr in invalid_addresses])
             
             # Calculate totals for single transaction
             total_recipients = len(recipients)
-            total_tokens = sum(r.get('amount', 0) for r in recipients)
             fee_per_tx = distribution.get('fee_per_tx', 0.001)
             
             # Calculate costs for single transaction (no batching)
-            min_erg_needed = float(total_recipients * AmountUtils.nanoerg_to_erg(self.MIN_BOX_VALUE_NANOERG))
+            cost = self.estimate_distribution_cost(
+                total_recipients, max(total_recipients, 1), fee_per_tx
+            )
+            min_erg_needed = cost['min_box_values']
             total_fees = float(fee_per_tx)  # Single transaction fee
-            total_erg_needed = min_erg_needed + total_fees
+            # Sum in nanoERG so the total carries no float rounding error
+            total_erg_needed = float(AmountUtils.nanoerg_to_erg(
+                total_recipients * self.MIN_BOX_VALUE_NANOERG
+                + AmountUtils.erg_to_nanoerg(fee_per_tx)
+            ))
+            
+            # Repeated addresses are legal but usually a copy-paste mistake
+            duplicate_addresses = sum(1 for count in address_counts.values() if count > 1)
+            if duplicate_addresses:
+                warnings.append(
+                    f"{duplicate_addresses} address(es) appear more than once; "
+                    f"each occurrence receives its own output"
+                )
             
             # Add warning for large recipient counts
             if total_recipients > 100:
@@ -595,6 +865,7 @@ class TokenManager:
                 "total_recipients": total_recipients,
                 "total_tokens": total_tokens,
                 "single_transaction": True,
+                "estimated_batches": cost['transactions'],
                 "min_erg_needed": min_erg_needed,
                 "total_fees": total_fees,
                 "total_erg_needed": total_erg_needed,
@@ -610,29 +881,50 @@ class TokenManager:
                 "warnings": []
             }
     
+    @staticmethod
+    def estimate_distribution_cost(
+        recipient_count: int,
+        batch_size: int = 50,
+        fee_per_tx: float = 0.001
+    ) -> Dict[str, Any]:
+        """
+        Estimate the ERG cost of distributing tokens to many recipients.
+        
+        Closed-form: one transaction per batch, one fee per transaction and
+        one minimum-value box per recipient.
+        
+        Args:
+            recipient_count: Number of recipients
+            batch_size: Recipients per transaction
+            fee_per_tx: Transaction fee in ERG
+            
+        Returns:
+            Dictionary with transactions, total_fees, min_box_values and
+            total_cost (all amounts in ERG)
+            
+        Examples:
+            >>> TokenManager.estimate_distribution_cost(100, batch_size=50)
+            {'transactions': 2, 'total_fees': 0.002, 'min_box_values': 0.1, 'total_cost': 0.102}
+        """
+        if recipient_count < 0:
+            raise ValueError("recipient_count cannot be negative")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        
+        transactions = -(-recipient_count // batch_size)
+        fees_nanoerg = transactions * AmountUtils.erg_to_nanoerg(fee_per_tx)
+        boxes_nanoerg = recipient_count * TokenManager.MIN_BOX_VALUE_NANOERG
+        
+        return {
+            "transactions": transactions,
+            "total_fees": float(AmountUtils.nanoerg_to_erg(fees_nanoerg)),
+            "min_box_values": float(AmountUtils.nanoerg_to_erg(boxes_nanoerg)),
+            "total_cost": float(AmountUtils.nanoerg_to_erg(fees_nanoerg + boxes_nanoerg))
+        }
+    
     def create_distribution_template(self, output_file: Union[str, Path]):
         """Create a template token distribution YAML file."""
-        template = {
-            "distribution": {
-                "token_id": "your_token_id_here",
-                "fee_per_tx": 0.001,
-            },
-            "recipients": [
-                {
-                    "address": "9fRusAarL1KkrWQVsxSRVYnvWzD4dWoLLxbYk3eWBV3jD3qvr3W",
-                    "amount": 100,
-                    "note": "Community member"
-                },
-                {
-                    "address": "9gQqZyxyjAptMbfW1Gydm3qaap11zd6X9DrABTbMBRJLjZhQRCA",
-                    "amount": 150,
-                    "note": "Developer contributor"
-                }
-            ]
-        }
-        
-        with open(output_file, 'w') as f:
-            yaml.dump(template, f, default_flow_style=False, indent=2)
+        Path(output_file).write_bytes(TOKEN_DISTRIBUTION_TEMPLATE)
         
         self.logger.info(f"Token distribution template created: {output_file}")
     
@@ -656,7 +948,183 @@ class TokenManager:
         self.logger.warning("send_tokens not yet implemented")
         return "demo_token_send"
     
-    def airdrop_tokens(self, token_id: str, addresses: List[str], amounts: List[int]) -> List[str]:
-        """Airdrop tokens - placeholder implementation."""
-        self.logger.warning("airdrop_tokens not yet implemented")
-        return ["demo_airdrop_tx"]
\ No newline at end of file
+    def airdrop_tokens(
+        self,
+        token_id: str,
+        addresses: Iterable[Union[str, Tuple[str, Union[int, float]]]],
+        amounts: Optional[Iterable[Union[int, float]]] = None,
+        fee_erg: float = 0.001,
+        batch_size: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """
+        Airdrop tokens to many addresses, one transaction per batch.
+        
+        Recipients are consumed in batches of ``batch_size`` and the batches
+        are built and broadcast concurrently on a bounded thread pool. UTXO
+        selection is serialized so no two batches spend the same input box;
+        the wallet therefore needs enough separate boxes to fund every batch.
+        
+        Recipients may be streamed: pass a generator of ``(address, amount)``
+        pairs as ``addresses`` and leave ``amounts`` unset. At most one batch
+        per worker is held in memory at a time. Streamed addresses are
+        validated batch by batch, so an invalid address only fails its own
+        batch. Lists are validated in full before anything is sent.
+        
+        A batch that fails to build, sign or broadcast does not stop the
+        others; its inputs are released and the failure is logged with the
+        batch number and recipient range.
+        
+        Args:
+            token_id: Token ID to airdrop
+            addresses: Recipient addresses, or ``(address, amount)`` pairs
+                when ``amounts`` is None
+            amounts: Token amounts (in display units) for each address
+            fee_erg: Transaction fee per batch in ERG
+            batch_size: Recipients per transaction (default AIRDROP_BATCH_SIZE)
+            
+        Returns:
+            One entry per batch, in batch order: the transaction ID, or None
+            if that batch failed
+        """
+        batch_size = batch_size or self.AIRDROP_BATCH_SIZE
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        
+        decoded_addresses = None
+        if amounts is None:
+            pairs = iter(addresses)
+        elif isinstance(addresses, (list, tuple)) and isinstance(amounts, (list, tuple)):
+            if len(addresses) != len(amounts):
+                raise ValueError(
+                    f"Got {len(addresses)} addresses but {len(amounts)} amounts"
+                )
+            # Everything is already in memory - reject bad input before sending
+            decoded_addresses = self._decode_addresses(addresses)
+            pairs = zip(addresses, amounts)
+        else:
+            pairs = self._zip_strict(addresses, amounts)
+        
+        # Token metadata is the same for every batch - fetch it once
+        token_info = self._get_token_info(token_id)
+        
+        self.logger.info(
+            f"Airdropping {token_info.get('name', 'Unknown Token')} "
+            f"in batches of {batch_size} recipients"
+        )
+        
+        def submit(batch_number: int, batch: List[Dict], decoded: Dict[str, Any]) -> str:
+            if self.dry_run:
+                tx_data = self._build_token_distribution_transaction(
+                    token_id, batch, fee_erg, token_info, decoded, reserve=False
+                )
+                self._log_dry_run_transaction(tx_data, batch, token_info)
+                return f"dry_run_airdrop_batch_{batch_number}"
+            return self._execute_token_distribution_batch(
+                token_id, batch, fee_erg, token_info, decoded
+            )
+        
+        tx_ids = []
+        failed_batches = []
+        
+        def record_failure(batch_number: int, first: int, size: int, error: Exception):
+            self.logger.error(f"Airdrop batch {batch_number} failed: {error}")
+            tx_ids.append(None)
+            failed_batches.append({
+                'batch': batch_number,
+                'recipients': f"{first}-{first + size - 1}",
+                'error': str(error)
+            })
+        
+        def collect(batch_number: int, first: int, size: int, future):
+            try:
+                tx_ids.append(future.result())
+            except Exception as e:
+                record_failure(batch_number, first, size, e)
+        
+        pending = deque()
+        batch_number = 0
+        first = 1
+        
+        with ThreadPoolExecutor(max_workers=self.MAX_AIRDROP_WORKERS) as executor:
+            while True:
+                batch = [
+                    {'address': address, 'amount': amount}
+                    for address, amount in islice(pairs, batch_size)
+                ]
+                if not batch:
+                    break
+                
+                # Bound in-flight batches so memory stays O(batch_size * workers)
+                if len(pending) >= self.MAX_AIRDROP_WORKERS:
+                    collect(*pending.popleft())
+                
+                batch_number += 1
+                batch_first, first = first, first + len(batch)
+                
+                # Streamed input is validated (and decoded) one batch at a time
+                batch_decoded = decoded_addresses
+                if batch_decoded is None:
+                    try:
+                        batch_decoded = self._decode_addresses(r['address'] for r in batch)
+                    except ValueError as e:
+                        # Keep results in batch order behind the ones in flight
+                        while pending:
+                            collect(*pending.popleft())
+                        record_failure(batch_number, batch_first, len(batch), e)
+                        continue
+                
+                pending.append((
+                    batch_number, batch_first, len(batch),
+                    executor.submit(submit, batch_number, batch, batch_decoded)
+                ))
+            
+            while pending:
+                collect(*pending.popleft())
+        
+        if not tx_ids:
+            raise ValueError("No recipients specified for airdrop")
+        
+        self.logger.info(
+            f"Airdrop completed: {len(tx_ids) - len(failed_batches)} successful, "
+            f"{len(failed_batches)} failed"
+        )
+        
+        if failed_batches:
+            self.logger.warning("Failed batches:")
+            for failed in failed_batches:
+                self.logger.warning(
+                    f"  {failed['batch']}. recipients {failed['recipients']}: {failed['error']}"
+                )
+        
+        return tx_ids
+    
+    @staticmethod
+    def stream_recipients(config_file: Union[str, Path]) -> Iterator[Tuple[Optional[str], Any]]:
+        """
+        Stream ``(address, amount)`` pairs from a distribution config.
+        
+        The recipients are read straight off the YAML event stream without
+        building the parsed document, so very large recipient lists can be
+        fed to airdrop_tokens in constant memory. Missing fields are None.
+        
+        Args:
+            config_file: Path to a YAML distribution config
+            
+        Yields:
+            ``(address, amount)`` for each recipient, in file order
+            
+        Examples:
+            >>> pairs = TokenManager.stream_recipients("airdrop.yaml")
+            >>> tx_ids = token_manager.airdrop_tokens("abc123...", pairs)
+        """
+        for recipient in stream_sequence(config_file, 'recipients'):
+            yield recipient.get('address'), recipient.get('amount')
+    
+    @staticmethod
+    def _zip_strict(addresses: Iterable[str], amounts: Iterable[Union[int, float]]) -> Iterator[Tuple[str, Union[int, float]]]:
+        """Pair addresses with amounts lazily, failing if the lengths differ."""
+        missing = object()
+        for address, amount in zip_longest(addresses, amounts, fillvalue=missing):
+            if address is missing or amount is missing:
+                raise ValueError("addresses and amounts have different lengths")
+            yield address, amount
\ No newline at end of file
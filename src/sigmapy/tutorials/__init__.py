@@ -9,10 +9,28 @@ This module contains step-by-step tutorials covering:
 - Address management
 """
 
-from .basic_wallet import BasicWalletTutorial
-from .transactions import TransactionTutorial
-from .addresses import AddressTutorial
-from .tokens import TokenTutorial
+from typing import TYPE_CHECKING
+
+from .._lazy import make_lazy
+
+# Each name is imported from its module on first access (PEP 562), so
+# importing one tutorial doesn't import all of them
+_LAZY = {
+    "BasicWalletTutorial": ".basic_wallet",
+    "TransactionTutorial": ".transactions",
+    "AddressTutorial": ".addresses",
+    "TokenTutorial": ".tokens",
+}
+
+if TYPE_CHECKING:
+    from .basic_wallet import BasicWalletTutorial
+    from .transactions import TransactionTutorial
+    from .addresses import AddressTutorial
+    from .tokens import TokenTutorial
+
+
+__getattr__, __dir__ = make_lazy(__name__, _LAZY)
+
 
 __all__ = [
     "BasicWalletTutorial",
@@ -9,12 +9,36 @@ This module provides helper functions and utilities for:
 - Common patterns and abstractions
 """
 
-from .address_utils import AddressUtils
-from .amount_utils import AmountUtils
-from .transaction_utils import TransactionUtils
-from .network_utils import NetworkUtils
-from .serialization_utils import SerializationUtils
-from .env_utils import EnvManager, get_env_config, get_seed_phrase, validate_env_security
+from typing import TYPE_CHECKING
+
+from .._lazy import make_lazy
+
+# Each name is imported from its module on first access (PEP 562), so
+# helpers like AmountUtils or address validation don't pull in requests
+# through NetworkUtils
+_LAZY = {
+    "AddressUtils": ".address_utils",
+    "AmountUtils": ".amount_utils",
+    "TransactionUtils": ".transaction_utils",
+    "NetworkUtils": ".network_utils",
+    "SerializationUtils": ".serialization_utils",
+    "EnvManager": ".env_utils",
+    "get_env_config": ".env_utils",
+    "get_seed_phrase": ".env_utils",
+    "validate_env_security": ".env_utils",
+}
+
+if TYPE_CHECKING:
+    from .address_utils import AddressUtils
+    from .amount_utils import AmountUtils
+    from .transaction_utils import TransactionUtils
+    from .network_utils import NetworkUtils
+    from .serialization_utils import SerializationUtils
+    from .env_utils import EnvManager, get_env_config, get_seed_phrase, validate_env_security
+
+
+__getattr__, __dir__ = make_lazy(__name__, _LAZY)
+
 
 __all__ = [
     "AddressUtils",
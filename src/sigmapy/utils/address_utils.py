@@ -5,7 +5,9 @@ This module provides utility functions for address validation,
 formatting, and network detection.
 """
 
-from typing import Optional
+from typing import Iterable, List, Optional
+import functools
+import hashlib
 import re
 
 try:
@@ -16,9 +18,108 @@ except ImportError:
     ergo = None
 
 
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_BASE58_INDEX = {char: index for index, char in enumerate(BASE58_ALPHABET)}
+
+# Cheap syntactic prefilter: rejects junk before any decoding or ergo-lib call
+BASE58_PATTERN = re.compile(f"[{BASE58_ALPHABET}]+")
+
+# Shortest string worth decoding as an address (same floor as validate_address)
+MIN_ADDRESS_LENGTH = 30
+_ADDRESS_SHAPE_PATTERN = re.compile(f"[{BASE58_ALPHABET}]{{{MIN_ADDRESS_LENGTH},}}")
+
+# Single-address prefilter: mainnet (9...) or testnet (3...) prefix plus shape
+_NETWORK_ADDRESS_PATTERN = re.compile(f"[93][{BASE58_ALPHABET}]{{{MIN_ADDRESS_LENGTH - 1},}}")
+_DEMO_ADDRESS_PATTERN = re.compile(f"[{BASE58_ALPHABET}]{{40,60}}")
+
+# High nibble of the address prefix byte identifies the network
+NETWORK_PREFIXES = {"mainnet": 0x00, "testnet": 0x10}
+
+# Address checksum length (first bytes of Blake2b-256 over prefix + content)
+CHECKSUM_LENGTH = 4
+
+# Distinct (address, network) checks remembered by _checksum_valid
+ADDRESS_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def _checksum_valid(address: str, network_prefix: Optional[int]) -> bool:
+    """
+    Decode an address and verify its checksum (and network, if given).
+    
+    Memoized: airdrops and distribution configs repeat addresses, and a
+    repeat skips the Base58 decode and Blake2b hash entirely.
+    """
+    decoded = AddressUtils.decode_base58(address)
+    if not decoded or len(decoded) <= CHECKSUM_LENGTH + 1:
+        return False
+    
+    payload, checksum = decoded[:-CHECKSUM_LENGTH], decoded[-CHECKSUM_LENGTH:]
+    if network_prefix is not None and payload[0] & 0xF0 != network_prefix:
+        return False
+    
+    return hashlib.blake2b(payload, digest_size=32).digest()[:CHECKSUM_LENGTH] == checksum
+
+
 class AddressUtils:
     """Utilities for Ergo address operations."""
     
+    @staticmethod
+    def decode_base58(address: str) -> Optional[bytes]:
+        """
+        Decode a Base58 string into raw bytes.
+        
+        Args:
+            address: Base58-encoded string
+            
+        Returns:
+            Decoded bytes, or None if the string contains non-Base58 characters
+        """
+        num = 0
+        for char in address:
+            digit = _BASE58_INDEX.get(char)
+            if digit is None:
+                return None
+            num = num * 58 + digit
+        
+        leading_zeros = len(address) - len(address.lstrip('1'))
+        return b'\x00' * leading_zeros + num.to_bytes((num.bit_length() + 7) // 8, 'big')
+    
+    @staticmethod
+    def validate_addresses(addresses: Iterable[str], network: Optional[str] = None) -> List[bool]:
+        """
+        Validate many addresses locally in a single pass.
+        
+        Each address is Base58-decoded and its 4-byte Blake2b-256 checksum is
+        verified; no node round-trip is made.
+        
+        Args:
+            addresses: Addresses to validate
+            network: If given ('mainnet' or 'testnet'), also require the
+                address prefix byte to belong to that network
+            
+        Returns:
+            List of booleans, one per input address, in input order
+            
+        Examples:
+            >>> AddressUtils.validate_addresses(["9f...", "invalid"], "mainnet")
+            [True, False]
+        """
+        network_prefix = NETWORK_PREFIXES.get(network) if network else None
+        results = []
+        
+        has_address_shape = _ADDRESS_SHAPE_PATTERN.fullmatch
+        
+        for address in addresses:
+            # Shape check first so short or non-Base58 input is never decoded
+            if not isinstance(address, str) or not has_address_shape(address):
+                results.append(False)
+                continue
+            
+            results.append(_checksum_valid(address, network_prefix))
+        
+        return results
+    
     @staticmethod
     def validate_address(address: str) -> bool:
         """
@@ -33,12 +134,8 @@ class AddressUtils:
         if not address or not isinstance(address, str):
             return False
         
-        # Basic length check
-        if len(address) < 30:
-            return False
-        
-        # Check if starts with valid network prefix
-        if not (address.startswith('9') or address.startswith('3')):
+        # Length, network prefix and Base58 alphabet in one precompiled match
+        if _NETWORK_ADDRESS_PATTERN.fullmatch(address) is None:
             return False
         
         if ERGO_LIB_AVAILABLE:
@@ -50,8 +147,7 @@ class AddressUtils:
         else:
             # Basic validation for demo mode
             # Check address format with regex
-            pattern = r'^[123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz]{40,60}$'
-            return bool(re.match(pattern, address))
+            return _DEMO_ADDRESS_PATTERN.fullmatch(address) is not None
     
     @staticmethod
     def get_network_type(address: str) -> Optional[str]:
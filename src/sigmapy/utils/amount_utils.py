@@ -9,7 +9,25 @@ This module provides helper functions for working with Ergo amounts:
 """
 
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Union
+import functools
+import math
+from typing import Iterable, List, Union
+
+
+_NANOERG_SCALE = Decimal(1_000_000_000)
+_WHOLE = Decimal('1')
+
+
+@functools.lru_cache(maxsize=4096)
+def _float_erg_to_nanoerg(erg_amount: float) -> int:
+    """
+    Exact nanoERG value of a finite, non-negative float ERG amount.
+
+    The float's shortest repr is scaled with Decimal, so 0.1 means exactly
+    0.1 ERG. Memoized because the same few values (fees, common payout
+    amounts) are converted over and over.
+    """
+    return int((Decimal(repr(erg_amount)) * _NANOERG_SCALE).quantize(_WHOLE, rounding=ROUND_HALF_UP))
 
 
 class AmountUtils:
@@ -44,23 +62,58 @@ class AmountUtils:
             >>> AmountUtils.erg_to_nanoerg("0.001")
             1000000
         """
+        # Whole ERG converts exactly with plain integer math
+        if type(erg_amount) is int:
+            if erg_amount < 0:
+                raise ValueError(f"Invalid ERG amount: {erg_amount}")
+            return erg_amount * AmountUtils.NANOERG_PER_ERG
+        
+        if type(erg_amount) is float:
+            if not math.isfinite(erg_amount) or erg_amount < 0:
+                raise ValueError(f"Invalid ERG amount: {erg_amount}")
+            try:
+                return _float_erg_to_nanoerg(erg_amount)
+            except ArithmeticError as e:
+                # Beyond Decimal's working precision
+                raise ValueError(f"Invalid ERG amount: {erg_amount}") from e
+        
         try:
             # Convert to Decimal for precise arithmetic
-            if isinstance(erg_amount, (int, float)):
-                decimal_amount = Decimal(str(erg_amount))
-            else:
-                decimal_amount = Decimal(erg_amount)
+            decimal_amount = Decimal(erg_amount)
             
-            if decimal_amount < 0:
-                raise ValueError("Amount cannot be negative")
+            if not decimal_amount.is_finite() or decimal_amount < 0:
+                raise ValueError("Amount must be finite and non-negative")
             
             # Multiply by nanoERG per ERG and round to nearest integer
-            nanoerg_amount = decimal_amount * AmountUtils.NANOERG_PER_ERG
-            return int(nanoerg_amount.quantize(Decimal('1'), rounding=ROUND_HALF_UP))
+            nanoerg_amount = decimal_amount * _NANOERG_SCALE
+            return int(nanoerg_amount.quantize(_WHOLE, rounding=ROUND_HALF_UP))
             
-        except (ValueError, TypeError) as e:
+        except (ValueError, TypeError, ArithmeticError) as e:
             raise ValueError(f"Invalid ERG amount: {erg_amount}") from e
     
+    @staticmethod
+    def erg_to_nanoerg_batch(erg_amounts: Iterable[Union[int, float, str, Decimal]]) -> List[int]:
+        """
+        Convert many ERG amounts to nanoERG in one pass.
+        
+        Produces exactly the same values as calling erg_to_nanoerg on each
+        amount (integers and repeated floats skip Decimal entirely).
+        
+        Args:
+            erg_amounts: Amounts in ERG (float, int, string, or Decimal)
+            
+        Returns:
+            List of amounts in nanoERG, in input order
+            
+        Raises:
+            ValueError: If any amount is negative or invalid
+            
+        Examples:
+            >>> AmountUtils.erg_to_nanoerg_batch([1, 0.5, "0.001"])
+            [1000000000, 500000000, 1000000]
+        """
+        return [AmountUtils.erg_to_nanoerg(erg_amount) for erg_amount in erg_amounts]
+    
     @staticmethod
     def nanoerg_to_erg(nanoerg_amount: int) -> Decimal:
         """
@@ -6,11 +6,31 @@ variables and .env files, ensuring secure handling of sensitive data.
 """
 
 import os
+import hashlib
 import logging
-from typing import Optional, Dict, Any, Union
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple, Union
 from pathlib import Path
 
 
+logger = logging.getLogger(__name__)
+
+
+# Environment variables that validate_security() depends on
+_SECURITY_ENV_VARS = (
+    "SIGMAPY_SEED_PHRASE",
+    "WALLET_SEED_PHRASE",
+    "SEED_PHRASE",
+    "SIGMAPY_NETWORK",
+    "SIGMAPY_DEMO_MODE",
+)
+
+# validate_security() results shared by every EnvManager, keyed on the .env
+# file's stat and a digest (never the values) of the variables above
+_SECURITY_CACHE_SIZE = 8
+_security_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+
+
 class EnvManager:
     """
     Environment configuration manager for SigmaPy.
@@ -26,12 +46,28 @@ class EnvManager:
         Args:
             env_file: Path to .env file (defaults to .env in current directory)
         """
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.env_file = env_file or Path.cwd() / ".env"
         self.loaded_vars = {}
         
         # Load .env file if it exists
         self._load_env_file()
+        self._take_snapshot()
+    
+    def _take_snapshot(self) -> None:
+        """
+        Capture the SigmaPy variables once so getters are plain dict lookups.
+        
+        Later changes to the process environment are not seen until reload().
+        """
+        self._snapshot: Dict[str, str] = {
+            key: value for key, value in os.environ.items()
+            if key.startswith("SIGMAPY_") or key in _SECURITY_ENV_VARS
+        }
+    
+    def _getenv(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Look up a variable in the environment snapshot."""
+        return self._snapshot.get(key, default)
     
     def _load_env_file(self) -> None:
         """Load environment variables from .env file."""
@@ -95,7 +131,7 @@ class EnvManager:
         ]
         
         for var in seed_phrase_vars:
-            value = os.getenv(var)
+            value = self._getenv(var)
             if value:
                 # Basic validation
                 if self._validate_seed_phrase(value):
@@ -112,7 +148,7 @@ class EnvManager:
         Returns:
             Network name ("mainnet" or "testnet")
         """
-        network = os.getenv("SIGMAPY_NETWORK", "testnet").lower()
+        network = self._getenv("SIGMAPY_NETWORK", "testnet").lower()
         if network not in ["mainnet", "testnet"]:
             self.logger.warning(f"Invalid network '{network}', defaulting to testnet")
             return "testnet"
@@ -125,7 +161,7 @@ class EnvManager:
         Returns:
             Node URL string or None for default
         """
-        return os.getenv("SIGMAPY_NODE_URL") or None
+        return self._getenv("SIGMAPY_NODE_URL") or None
     
     def get_api_key(self) -> Optional[str]:
         """
@@ -134,7 +170,7 @@ class EnvManager:
         Returns:
             API key string or None if not set
         """
-        return os.getenv("SIGMAPY_API_KEY") or None
+        return self._getenv("SIGMAPY_API_KEY") or None
     
     def get_demo_mode(self) -> bool:
         """
@@ -143,7 +179,7 @@ class EnvManager:
         Returns:
             True if demo mode is enabled, False otherwise
         """
-        demo_mode = os.getenv("SIGMAPY_DEMO_MODE", "false").lower()
+        demo_mode = self._getenv("SIGMAPY_DEMO_MODE", "false").lower()
         return demo_mode in ["true", "1", "yes", "on"]
     
     def get_timeout(self) -> int:
@@ -154,7 +190,7 @@ class EnvManager:
             Timeout in seconds
         """
         try:
-            timeout = int(os.getenv("SIGMAPY_TIMEOUT", "30"))
+            timeout = int(self._getenv("SIGMAPY_TIMEOUT", "30"))
             if timeout <= 0:
                 raise ValueError("Timeout must be positive")
             return timeout
@@ -170,7 +206,7 @@ class EnvManager:
             Batch size for operations
         """
         try:
-            batch_size = int(os.getenv("SIGMAPY_BATCH_SIZE", "50"))
+            batch_size = int(self._getenv("SIGMAPY_BATCH_SIZE", "50"))
             if batch_size <= 0:
                 raise ValueError("Batch size must be positive")
             return batch_size
@@ -186,7 +222,7 @@ class EnvManager:
             Default fee in ERG
         """
         try:
-            fee = float(os.getenv("SIGMAPY_DEFAULT_FEE", "0.001"))
+            fee = float(self._getenv("SIGMAPY_DEFAULT_FEE", "0.001"))
             if fee <= 0:
                 raise ValueError("Fee must be positive")
             return fee
@@ -201,7 +237,7 @@ class EnvManager:
         Returns:
             Log level string
         """
-        level = os.getenv("SIGMAPY_LOG_LEVEL", "INFO").upper()
+        level = self._getenv("SIGMAPY_LOG_LEVEL", "INFO").upper()
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         if level not in valid_levels:
             self.logger.warning(f"Invalid log level '{level}', using INFO")
@@ -215,7 +251,7 @@ class EnvManager:
         Returns:
             Log file path or None for console only
         """
-        return os.getenv("SIGMAPY_LOG_FILE") or None
+        return self._getenv("SIGMAPY_LOG_FILE") or None
     
     def get_require_confirmation(self) -> bool:
         """
@@ -224,7 +260,7 @@ class EnvManager:
         Returns:
             True if confirmation is required, False otherwise
         """
-        confirmation = os.getenv("SIGMAPY_REQUIRE_CONFIRMATION", "true").lower()
+        confirmation = self._getenv("SIGMAPY_REQUIRE_CONFIRMATION", "true").lower()
         return confirmation in ["true", "1", "yes", "on"]
     
     def get_max_retry_attempts(self) -> int:
@@ -235,7 +271,7 @@ class EnvManager:
             Maximum retry attempts
         """
         try:
-            attempts = int(os.getenv("SIGMAPY_MAX_RETRY_ATTEMPTS", "3"))
+            attempts = int(self._getenv("SIGMAPY_MAX_RETRY_ATTEMPTS", "3"))
             if attempts < 0:
                 raise ValueError("Retry attempts must be non-negative")
             return attempts
@@ -243,6 +279,16 @@ class EnvManager:
             self.logger.warning("Invalid retry attempts value, using default 3")
             return 3
     
+    def get_yaml_cache(self) -> bool:
+        """
+        Get whether parsed config files may be cached on disk.
+        
+        Returns:
+            True if the YAML pickle cache and JSON side-cars are enabled
+        """
+        yaml_cache = self._getenv("SIGMAPY_YAML_CACHE", "true").lower()
+        return yaml_cache in ["true", "1", "yes", "on"]
+    
     def get_config_dict(self) -> Dict[str, Any]:
         """
         Get all configuration as a dictionary.
@@ -263,6 +309,7 @@ class EnvManager:
             "log_file": self.get_log_file(),
             "require_confirmation": self.get_require_confirmation(),
             "max_retry_attempts": self.get_max_retry_attempts(),
+            "yaml_cache": self.get_yaml_cache(),
         }
     
     def _validate_seed_phrase(self, seed_phrase: str) -> bool:
@@ -328,6 +375,7 @@ SIGMAPY_DEMO_MODE="true"  # Set to "false" to use real wallet operations
 SIGMAPY_TIMEOUT="30"      # Network timeout in seconds
 SIGMAPY_BATCH_SIZE="50"   # Default batch size for operations
 SIGMAPY_DEFAULT_FEE="0.001"  # Default transaction fee in ERG
+SIGMAPY_YAML_CACHE="true"    # Cache parsed config files on disk (side-cars + pickles)
 
 # Logging Configuration
 SIGMAPY_LOG_LEVEL="INFO"  # DEBUG, INFO, WARNING, ERROR
@@ -345,13 +393,63 @@ SIGMAPY_MAX_RETRY_ATTEMPTS="3"       # Maximum retry attempts for failed operati
         except Exception as e:
             self.logger.error(f"Failed to create .env file: {e}")
     
+    def reload(self) -> None:
+        """
+        Re-read the .env file and the environment after either changed at runtime.
+        
+        Variables previously loaded from the file are replaced (variables
+        set in the real environment still take precedence), the getters'
+        snapshot is refreshed, and cached security results are dropped.
+        """
+        for key in self.loaded_vars:
+            os.environ.pop(key, None)
+        self.loaded_vars = {}
+        self._load_env_file()
+        self._take_snapshot()
+        _security_cache.clear()
+    
+    def _security_cache_key(self) -> Tuple[Any, ...]:
+        """Build the validate_security() cache key for the current state."""
+        try:
+            stat = self.env_file.stat()
+            file_key = (stat.st_mtime_ns, stat.st_mode)
+        except OSError:
+            file_key = None
+        
+        env_digest = hashlib.sha256(
+            "\0".join(self._getenv(var, "") for var in _SECURITY_ENV_VARS).encode("utf-8")
+        ).hexdigest()
+        return (str(self.env_file), file_key, env_digest)
+    
     def validate_security(self) -> Dict[str, Any]:
         """
         Validate security configuration.
         
+        Results are cached across EnvManager instances until the .env file
+        or the relevant environment variables change.
+        
         Returns:
             Dictionary with security validation results
         """
+        key = self._security_cache_key()
+        result = _security_cache.get(key)
+        if result is None:
+            result = self._validate_security()
+            _security_cache[key] = result
+            if len(_security_cache) > _SECURITY_CACHE_SIZE:
+                _security_cache.popitem(last=False)
+        else:
+            _security_cache.move_to_end(key)
+        
+        # Callers get their own lists
+        return {
+            "issues": list(result["issues"]),
+            "warnings": list(result["warnings"]),
+            "secure": result["secure"]
+        }
+    
+    def _validate_security(self) -> Dict[str, Any]:
+        """Run the security checks without consulting the cache."""
         issues = []
         warnings = []
         
@@ -409,6 +507,17 @@ SIGMAPY_MAX_RETRY_ATTEMPTS="3"       # Maximum retry attempts for failed operati
 env_manager = EnvManager()
 
 
+def _current_env_manager() -> EnvManager:
+    """
+    Return the global EnvManager with its snapshot refreshed.
+    
+    The global instance is built at import time, so the module-level helpers
+    re-read the environment on every call and see variables set afterwards.
+    """
+    env_manager._take_snapshot()
+    return env_manager
+
+
 def get_env_config() -> Dict[str, Any]:
     """
     Get environment configuration using the global EnvManager.
@@ -416,7 +525,7 @@ def get_env_config() -> Dict[str, Any]:
     Returns:
         Dictionary containing all configuration values
     """
-    return env_manager.get_config_dict()
+    return _current_env_manager().get_config_dict()
 
 
 def get_seed_phrase() -> Optional[str]:
@@ -426,7 +535,7 @@ def get_seed_phrase() -> Optional[str]:
     Returns:
         Seed phrase string or None if not found
     """
-    return env_manager.get_seed_phrase()
+    return _current_env_manager().get_seed_phrase()
 
 
 def validate_env_security() -> Dict[str, Any]:
@@ -436,7 +545,7 @@ def validate_env_security() -> Dict[str, Any]:
     Returns:
         Dictionary with security validation results
     """
-    return env_manager.validate_security()
+    return _current_env_manager().validate_security()
 
 
 def main():
@@ -10,6 +10,8 @@ import requests
 import time
 import logging
 
+from ..config._yaml_cache import json_loads
+
 
 class NetworkUtils:
     """Utilities for Ergo network operations."""
@@ -63,7 +65,7 @@ class NetworkUtils:
             result['response_time'] = round(end_time - start_time, 3)
             
             if response.status_code == 200:
-                info = response.json()
+                info = json_loads(response.content)
                 result['reachable'] = True
                 result['height'] = info.get('fullHeight', 0)
                 result['version'] = info.get('appVersion', 'unknown')
@@ -136,7 +138,7 @@ class NetworkUtils:
             # Get basic info
             info_response = requests.get(f"{node_url.rstrip('/')}/info", timeout=10)
             if info_response.status_code == 200:
-                info = info_response.json()
+                info = json_loads(info_response.content)
                 status['reachable'] = True
                 status['height'] = info.get('fullHeight', 0)
                 status['peers'] = info.get('peersCount', 0)
@@ -150,7 +152,7 @@ class NetworkUtils:
                     timeout=5
                 )
                 if mempool_response.status_code == 200:
-                    mempool_data = mempool_response.json()
+                    mempool_data = json_loads(mempool_response.content)
                     status['mempool_size'] = mempool_data.get('size', 0)
             except:
                 pass  # Mempool info is optional
@@ -211,7 +213,7 @@ class NetworkUtils:
                 )
                 
                 if response.status_code == 200:
-                    info = response.json()
+                    info = json_loads(response.content)
                     current_height = info.get('fullHeight', 0)
                     
                     if current_height >= target_height:
@@ -6,7 +6,6 @@ validation, and processing.
 """
 
 from typing import Dict, List, Optional, Any
-import time
 import hashlib
 
 try:
@@ -141,13 +140,10 @@ class TransactionUtils:
         Returns:
             Transaction ID string
         """
-        # Create a hash-based ID for demo mode
-        timestamp = str(int(time.time()))
-        content = str(tx_data)
-        hash_input = f"{timestamp}{content}".encode()
-        
-        tx_hash = hashlib.sha256(hash_input).hexdigest()
-        return f"demo_tx_{tx_hash[:16]}"
+        # Create a content-hash ID for demo mode: the same transaction data
+        # always gets the same ID, across runs and hash seeds
+        tx_hash = hashlib.blake2b(str(tx_data).encode(), digest_size=8).hexdigest()
+        return f"demo_tx_{tx_hash}"
     
     @staticmethod
     def format_transaction_summary(tx_data: Dict[str, Any]) -> str: